@@ -0,0 +1,95 @@
+"""Micro-benchmark for Semantic Layer name suggestions.
+
+Compares the full Levenshtein scan (`get_closest_words`) with the
+length-bucketed, banded `WordIndex` used by `get_misspellings`.
+
+Usage: uv run python benchmarks/bench_misspellings.py
+"""
+
+import random
+import time
+from collections.abc import Callable
+from functools import partial
+
+from dbt_mcp.semantic_layer.levenshtein import WordIndex, get_closest_words
+
+NAME_PARTS = [
+    "order",
+    "revenue",
+    "customer",
+    "product",
+    "total",
+    "net",
+    "gross",
+    "count",
+    "avg",
+    "daily",
+    "monthly",
+    "active",
+    "churned",
+    "new",
+    "returning",
+    "margin",
+    "discount",
+    "shipping",
+    "tax",
+    "refund",
+]
+
+
+def make_names(rng: random.Random, count: int) -> list[str]:
+    names: set[str] = set()
+    while len(names) < count:
+        parts = rng.sample(NAME_PARTS, k=rng.randint(2, 4))
+        names.add(
+            "_".join(parts) + (f"_{rng.randint(1, 99)}" if rng.random() < 0.3 else "")
+        )
+    return sorted(names)
+
+
+def misspell(rng: random.Random, word: str) -> str:
+    position = rng.randrange(len(word))
+    return word[:position] + word[position + 1 :]
+
+
+def full_scan(words: list[str], targets: list[str]) -> list[list[str]]:
+    return [
+        get_closest_words(t, words, top_k=5, threshold=max(1, len(t) // 2))
+        for t in targets
+    ]
+
+
+def indexed(index: WordIndex, targets: list[str]) -> list[list[str]]:
+    return [
+        index.get_closest_words(t, top_k=5, threshold=max(1, len(t) // 2))
+        for t in targets
+    ]
+
+
+def timed(fn: Callable[[], object], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    rng = random.Random(0)
+    print(f"{'words':>7} {'targets':>8} {'full scan':>11} {'index':>9} {'build':>9}")
+    for word_count in [100, 1_000, 5_000]:
+        words = make_names(rng, word_count)
+        targets = [misspell(rng, rng.choice(words)) for _ in range(10)]
+        index = WordIndex(words)
+        assert full_scan(words, targets) == indexed(index, targets)
+        print(
+            f"{word_count:>7} {len(targets):>8} "
+            f"{timed(partial(full_scan, words, targets)) * 1000:>9.1f}ms "
+            f"{timed(partial(indexed, index, targets)) * 1000:>7.1f}ms "
+            f"{timed(partial(WordIndex, words)) * 1000:>7.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
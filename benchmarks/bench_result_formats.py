@@ -0,0 +1,68 @@
+"""Compares the size of a query result in each output format.
+
+A 1,000 row, 10 column result is written in every `ResultFormat`, and as
+the indented records JSON that `dbt show --output json` prints. Tokens are
+estimated at 4 bytes per token, which is only meant to compare formats.
+
+Usage: uv run python benchmarks/bench_result_formats.py
+"""
+
+import datetime
+import json
+import random
+
+import pyarrow as pa
+
+from dbt_mcp.results.serialization import ResultFormat, serialize_table
+
+BYTES_PER_TOKEN = 4
+
+
+def make_table(rows: int = 1_000) -> pa.Table:
+    rng = random.Random(0)
+    start = datetime.date(2024, 1, 1)
+    return pa.table(
+        {
+            "metric_time__day": [
+                start + datetime.timedelta(days=i) for i in range(rows)
+            ],
+            "customer__region": [
+                rng.choice(["emea", "amer", "apac"]) for _ in range(rows)
+            ],
+            "customer__segment": [
+                rng.choice(["smb", "enterprise"]) for _ in range(rows)
+            ],
+            "order__channel": [
+                rng.choice(["web", "store", "app"]) for _ in range(rows)
+            ],
+            "order_count": [rng.randrange(1_000) for _ in range(rows)],
+            "customer_count": [rng.randrange(500) for _ in range(rows)],
+            "revenue": [round(rng.random() * 10_000, 2) for _ in range(rows)],
+            "gross_margin": [round(rng.random(), 4) for _ in range(rows)],
+            "average_order_value": [round(rng.random() * 200, 2) for _ in range(rows)],
+            "is_complete": [rng.random() > 0.1 for _ in range(rows)],
+        }
+    )
+
+
+def main() -> None:
+    table = make_table()
+    outputs = {
+        "dbt show json": json.dumps({"show": table.to_pylist()}, indent=2, default=str),
+        **{
+            result_format.value: serialize_table(table, result_format)
+            for result_format in ResultFormat
+        },
+    }
+    baseline = len(outputs["dbt show json"].encode())
+    print(f"{'format':<14} {'bytes':>9} {'~tokens':>9} {'vs dbt show':>12}")
+    for name, output in outputs.items():
+        size = len(output.encode())
+        print(
+            f"{name:<14} {size:>9,} {size // BYTES_PER_TOKEN:>9,} "
+            f"{size / baseline:>11.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
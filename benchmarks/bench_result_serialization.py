@@ -0,0 +1,82 @@
+"""Micro-benchmark for serializing Semantic Layer query results.
+
+Compares the Arrow-native JSON writer used by `query_metrics` with the
+previous `to_pandas().to_json(orient="records", indent=2)` round trip on a
+wide and a tall result set. The pandas rows are skipped when pandas isn't
+installed. Peak memory is the Python heap as traced by tracemalloc, which
+excludes buffers allocated by Arrow itself.
+
+Usage: uv run python benchmarks/bench_result_serialization.py
+"""
+
+import datetime
+import importlib.util
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+
+import pyarrow as pa
+
+from dbt_mcp.results.serialization import ResultFormat, serialize_table
+
+
+def make_table(rows: int, metric_columns: int) -> pa.Table:
+    rng = random.Random(0)
+    start = datetime.date(2020, 1, 1)
+    columns: dict[str, pa.Array] = {
+        "metric_time__day": pa.array(
+            [start + datetime.timedelta(days=i % 3650) for i in range(rows)]
+        ),
+        "customer__region": pa.array(
+            [rng.choice(["emea", "amer", "apac"]) for _ in range(rows)]
+        ),
+    }
+    for i in range(metric_columns):
+        columns[f"metric_{i}"] = pa.array([rng.random() * 1000 for _ in range(rows)])
+    return pa.table(columns)
+
+
+def pandas_records(table: pa.Table) -> str:
+    return table.to_pandas().to_json(orient="records", indent=2)
+
+
+def measure(fn: Callable[[], str]) -> tuple[float, int, int]:
+    """Returns the best time, the peak traced memory and the output size."""
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, len(result.encode())
+
+
+def main() -> None:
+    has_pandas = importlib.util.find_spec("pandas") is not None
+
+    shapes = {
+        "wide (1k rows x 100 cols)": make_table(1_000, 100),
+        "tall (200k rows x 3 cols)": make_table(200_000, 3),
+    }
+    print(f"{'result':<27} {'serializer':<14} {'time':>9} {'py peak':>10} {'size':>10}")
+    for name, table in shapes.items():
+        serializers: dict[str, Callable[[], str]] = {
+            "arrow json": partial(serialize_table, table, ResultFormat.JSON),
+        }
+        if has_pandas:
+            serializers["pandas json"] = partial(pandas_records, table)
+        for serializer, fn in serializers.items():
+            seconds, peak, size = measure(fn)
+            print(
+                f"{name:<27} {serializer:<14} {seconds * 1000:>7.0f}ms "
+                f"{peak / 2**20:>8.1f}MB {size / 2**20:>8.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
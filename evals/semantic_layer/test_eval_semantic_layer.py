@@ -72,7 +72,7 @@ def deep_equal(dict1: Any, dict2: Any) -> bool:
         return dict1 == dict2
 
 
-def expect_query_metrics_tool_call(
+async def expect_query_metrics_tool_call(
     messages: list,
     tools: list[FunctionToolParam],
     expected_metrics: list[str],
@@ -120,7 +120,7 @@ def expect_query_metrics_tool_call(
         ),
         config=sl_config,
     )
-    tool_response = semantic_layer_fetcher.query_metrics(
+    tool_response = await semantic_layer_fetcher.query_metrics(
         metrics=args_dict["metrics"],
         group_by=[
             GroupByParam(name=g["name"], type=g["type"], grain=g.get("grain"))
@@ -192,7 +192,7 @@ async def test_semantic_layer_fulfillment_query():
         "get_dimensions",
         '{"metrics":["orders"]}',
     )
-    expect_query_metrics_tool_call(
+    await expect_query_metrics_tool_call(
         messages,
         tools,
     )
@@ -221,7 +221,7 @@ async def test_semantic_layer_food_revenue_per_month():
         "get_entities",
         '{"metrics":["food_revenue"]}',
     )
-    expect_query_metrics_tool_call(
+    await expect_query_metrics_tool_call(
         messages=messages,
         tools=tools,
         expected_metrics=["food_revenue"],
@@ -257,7 +257,7 @@ async def test_semantic_layer_what_percentage_of_orders_were_large():
         "list_metrics",
         "{}",
     )
-    expect_query_metrics_tool_call(
+    await expect_query_metrics_tool_call(
         messages=messages,
         tools=tools,
         expected_metrics=["orders", "large_orders"],
@@ -0,0 +1,109 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+@dataclass
+class _CacheEntry(Generic[V]):
+    value: V
+    size: int
+    expires_at: float
+
+
+class LRUCache(Generic[K, V]):
+    """In-memory LRU cache whose entries expire after a TTL.
+
+    The least recently used entries are evicted once the cache holds more
+    than `max_entries` entries, or more than `max_bytes` bytes as measured
+    by `size_of`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        max_bytes: int | None = None,
+        size_of: Callable[[V], int] | None = None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.size_of = size_of
+        self._entries: OrderedDict[K, _CacheEntry[V]] = OrderedDict()
+        self._bytes = 0
+        self._stats = CacheStats()
+
+    def get(self, key: K) -> tuple[bool, V | None]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self._stats.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self._stats.hits += 1
+        return True, entry.value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        if ttl_seconds <= 0:
+            return
+        size = self.size_of(value) if self.size_of else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _CacheEntry(
+            value=value,
+            size=size,
+            expires_at=time.monotonic() + ttl_seconds,
+        )
+        self._bytes += size
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def values(self) -> list[V]:
+        """Returns the values of all unexpired entries, without counting
+        them as reads."""
+        now = time.monotonic()
+        return [e.value for e in self._entries.values() if e.expires_at > now]
+
+    def pop(self, key: K) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def get_stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            entries=len(self._entries),
+            bytes=self._bytes,
+        )
+
+    def _remove(self, key: K) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
@@ -0,0 +1,92 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class RefreshingValue(Generic[T]):
+    """Holds a value loaded from upstream and keeps it fresh.
+
+    The first `get` waits for the value to load. Once the value is older
+    than `ttl_seconds`, `get` keeps returning the stale copy while a
+    single background task reloads it, so callers never wait on a reload.
+    If the reload fails, the stale copy is kept and the next `get` retries.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        load: Callable[[], Awaitable[T]],
+        ttl_seconds: float,
+    ):
+        self.name = name
+        self._load = load
+        self.ttl_seconds = ttl_seconds
+        self._value: T | None = None
+        self._loaded_at: float | None = None
+        self._load_task: asyncio.Task[T] | None = None
+        # Bumped on invalidation so that loads started before it are discarded
+        self._generation = 0
+
+    @property
+    def is_stale(self) -> bool:
+        return (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at >= self.ttl_seconds
+        )
+
+    async def get(self) -> T:
+        if self._loaded_at is None:
+            return await asyncio.shield(self._start_load())
+        if self.is_stale:
+            self._start_load()
+        return self._value  # type: ignore[return-value]
+
+    def get_nowait(self) -> T | None:
+        """Returns the value, if it has been loaded, without waiting for it.
+
+        Starts loading the value in the background if it's missing or stale.
+        """
+        if self.is_stale:
+            self._start_load()
+        return self._value
+
+    async def refresh(self) -> T:
+        """Reloads the value and waits for the result."""
+        return await asyncio.shield(self._start_load())
+
+    def invalidate(self) -> None:
+        """Drops the value so that the next `get` loads it from upstream."""
+        self._value = None
+        self._loaded_at = None
+        self._load_task = None
+        self._generation += 1
+
+    def _start_load(self) -> asyncio.Task[T]:
+        if self._load_task is None:
+            task = asyncio.create_task(self._run_load(self._generation))
+            # Background refreshes aren't awaited, their errors are logged instead
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._load_task = task
+        return self._load_task
+
+    async def _run_load(self, generation: int) -> T:
+        try:
+            value = await self._load()
+            if generation == self._generation:
+                self._value = value
+                self._loaded_at = time.monotonic()
+                logger.debug(f"Loaded {self.name}")
+            return value
+        except Exception:
+            if self._loaded_at is not None:
+                logger.exception(f"Error refreshing {self.name}, serving stale copy")
+            raise
+        finally:
+            if generation == self._generation:
+                self._load_task = None
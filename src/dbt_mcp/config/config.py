@@ -1,12 +1,25 @@
 import os
+from collections.abc import Callable
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, TypeVar
 
 import yaml
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 
 from dbt_mcp.tools.tool_names import ToolName
+from dbt_mcp.tools.toolsets import Toolset
+
+T = TypeVar("T")
+
+# dbt CLI tools read local project files that change while the user works,
+# the Admin API reports live job run status and SQL tools are proxied to a
+# remote server, so none of them are cached by default.
+DEFAULT_TOOLSET_CACHE_TTL: dict[Toolset, float] = {
+    Toolset.DBT_CLI: 0,
+    Toolset.ADMIN_API: 0,
+    Toolset.SQL: 0,
+}
 
 
 class TrackingConfig(BaseModel):
@@ -24,12 +37,49 @@ class SemanticLayerConfig(BaseModel):
     prod_environment_id: int
     service_token: str
     headers: dict[str, str]
+    # Seconds before the metric catalog is refreshed in the background
+    catalog_ttl_seconds: float = 300.0
+    # Metrics whose dimensions and entities are kept in memory
+    metadata_cache_max_entries: int = 1024
+    # Query results are reused for identical queries for this many seconds
+    result_cache_ttl_seconds: float = 300.0
+    result_cache_max_bytes: int = 128 * 1024 * 1024
+    # Answer queries for simple metrics at a coarser grain, or with fewer
+    # group bys, by rolling up cached results. Off by default, since
+    # semi-additive measures can't be told apart from the metric catalog and
+    # rolling them up would return wrong totals.
+    rollup_cached_results: bool = False
+    # Sessions kept open for queries, and how long they're kept while idle
+    max_sessions: int = 4
+    session_idle_timeout_seconds: float = 300.0
+    # Paged query results are dropped after this many seconds,
+    # or once together they take more than `result_max_bytes`
+    result_ttl_seconds: float = 300.0
+    result_max_bytes: int = 256 * 1024 * 1024
+    # Compiled SQL is reused for identical queries against the same semantic
+    # manifest for this many seconds, and kept in the database at
+    # `compiled_sql_cache_path` across restarts if it's set
+    compiled_sql_cache_ttl_seconds: float = 24 * 60 * 60
+    compiled_sql_cache_path: Path | None = None
+    # Distinct values of dimensions are reused for this many seconds
+    dimension_values_ttl_seconds: float = 600.0
+    # Most rows and bytes of a query result held in memory. Reading stops
+    # once a result exceeds either, and the query fails, or returns the rows
+    # that fit if `truncate_results_over_budget` is set.
+    result_budget_max_rows: int = 1_000_000
+    result_budget_max_bytes: int = 128 * 1024 * 1024
+    truncate_results_over_budget: bool = False
 
 
 class DiscoveryConfig(BaseModel):
     url: str
     headers: dict[str, str]
     environment_id: int
+    # Seconds before the model catalog and lineage graph are checked for
+    # changes in the background, and before the models of the catalog are
+    # crawled again regardless
+    catalog_ttl_seconds: float = 300.0
+    catalog_max_age_seconds: float = 60 * 60
 
 
 class DbtCliConfig(BaseModel):
@@ -54,6 +104,38 @@ class AdminApiConfig(BaseModel):
     prod_environment_id: int | None = None
 
 
+class ToolExecutionConfig(BaseModel):
+    # Worker threads per toolset for tools that are implemented synchronously.
+    max_workers: int = 8
+    toolset_max_workers: dict[Toolset, int] = {}
+    # Calls that can wait for a worker before new calls are rejected.
+    max_queued_calls: int = 32
+    # Seconds between debug logs of the executor, tool cache and in-flight
+    # call counters. An interval of 0 only logs them at shutdown.
+    stats_log_interval_seconds: float = 300.0
+
+
+class ToolCacheConfig(BaseModel):
+    # Seconds that results of read-only, idempotent tools are reused.
+    # A TTL of 0 disables caching.
+    ttl_seconds: float = 60.0
+    toolset_ttl_seconds: dict[Toolset, float] = DEFAULT_TOOLSET_CACHE_TTL
+    max_entries: int = 1024
+    max_bytes: int = 64 * 1024 * 1024
+
+
+class HttpClientConfig(BaseModel):
+    # Connection limits apply per upstream host.
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    # Discovery queries and artifact downloads can take a while,
+    # so we only fail fast on connecting.
+    timeout: float = 60.0
+    connect_timeout: float = 10.0
+    http2: bool = True
+
+
 class DbtMcpSettings(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="",
@@ -89,6 +171,92 @@ class DbtMcpSettings(BaseSettings):
 
     multicell_account_prefix: str | None = Field(None, alias="MULTICELL_ACCOUNT_PREFIX")
 
+    dbt_mcp_max_workers: int = Field(8, alias="DBT_MCP_MAX_WORKERS")
+    dbt_mcp_toolset_max_workers: Annotated[dict[Toolset, int], NoDecode] = Field(
+        # dbt commands share the project's target directory, so they run one at a time
+        # unless explicitly configured otherwise.
+        {Toolset.DBT_CLI: 1},
+        alias="DBT_MCP_TOOLSET_MAX_WORKERS",
+    )
+    dbt_mcp_max_queued_calls: int = Field(32, alias="DBT_MCP_MAX_QUEUED_CALLS")
+    dbt_mcp_stats_log_interval: float = Field(300.0, alias="DBT_MCP_STATS_LOG_INTERVAL")
+
+    dbt_mcp_tool_cache_ttl: float = Field(60.0, alias="DBT_MCP_TOOL_CACHE_TTL")
+    dbt_mcp_toolset_cache_ttl: Annotated[dict[Toolset, float], NoDecode] = Field(
+        DEFAULT_TOOLSET_CACHE_TTL,
+        alias="DBT_MCP_TOOLSET_CACHE_TTL",
+    )
+    dbt_mcp_tool_cache_max_entries: int = Field(
+        1024, alias="DBT_MCP_TOOL_CACHE_MAX_ENTRIES"
+    )
+    dbt_mcp_tool_cache_max_bytes: int = Field(
+        64 * 1024 * 1024, alias="DBT_MCP_TOOL_CACHE_MAX_BYTES"
+    )
+
+    dbt_mcp_discovery_catalog_ttl: float = Field(
+        300.0, alias="DBT_MCP_DISCOVERY_CATALOG_TTL"
+    )
+    dbt_mcp_discovery_catalog_max_age: float = Field(
+        60 * 60, alias="DBT_MCP_DISCOVERY_CATALOG_MAX_AGE"
+    )
+    dbt_mcp_semantic_layer_catalog_ttl: float = Field(
+        300.0, alias="DBT_MCP_SEMANTIC_LAYER_CATALOG_TTL"
+    )
+    dbt_mcp_semantic_layer_cache_max_entries: int = Field(
+        1024, alias="DBT_MCP_SEMANTIC_LAYER_CACHE_MAX_ENTRIES"
+    )
+    dbt_mcp_semantic_layer_result_cache_ttl: float = Field(
+        300.0, alias="DBT_MCP_SEMANTIC_LAYER_RESULT_CACHE_TTL"
+    )
+    dbt_mcp_semantic_layer_result_cache_max_bytes: int = Field(
+        128 * 1024 * 1024, alias="DBT_MCP_SEMANTIC_LAYER_RESULT_CACHE_MAX_BYTES"
+    )
+    dbt_mcp_semantic_layer_rollup_cached_results: bool = Field(
+        False, alias="DBT_MCP_SEMANTIC_LAYER_ROLLUP_CACHED_RESULTS"
+    )
+    dbt_mcp_semantic_layer_max_sessions: int = Field(
+        4, alias="DBT_MCP_SEMANTIC_LAYER_MAX_SESSIONS"
+    )
+    dbt_mcp_semantic_layer_session_idle_timeout: float = Field(
+        300.0, alias="DBT_MCP_SEMANTIC_LAYER_SESSION_IDLE_TIMEOUT"
+    )
+    dbt_mcp_semantic_layer_result_ttl: float = Field(
+        300.0, alias="DBT_MCP_SEMANTIC_LAYER_RESULT_TTL"
+    )
+    dbt_mcp_semantic_layer_result_max_bytes: int = Field(
+        256 * 1024 * 1024, alias="DBT_MCP_SEMANTIC_LAYER_RESULT_MAX_BYTES"
+    )
+    dbt_mcp_semantic_layer_sql_cache_ttl: float = Field(
+        24 * 60 * 60, alias="DBT_MCP_SEMANTIC_LAYER_SQL_CACHE_TTL"
+    )
+    dbt_mcp_semantic_layer_sql_cache_path: str | None = Field(
+        None, alias="DBT_MCP_SEMANTIC_LAYER_SQL_CACHE_PATH"
+    )
+    dbt_mcp_semantic_layer_dimension_values_ttl: float = Field(
+        600.0, alias="DBT_MCP_SEMANTIC_LAYER_DIMENSION_VALUES_TTL"
+    )
+    dbt_mcp_semantic_layer_result_budget_rows: int = Field(
+        1_000_000, alias="DBT_MCP_SEMANTIC_LAYER_RESULT_BUDGET_ROWS"
+    )
+    dbt_mcp_semantic_layer_result_budget_bytes: int = Field(
+        128 * 1024 * 1024, alias="DBT_MCP_SEMANTIC_LAYER_RESULT_BUDGET_BYTES"
+    )
+    dbt_mcp_semantic_layer_truncate_results: bool = Field(
+        False, alias="DBT_MCP_SEMANTIC_LAYER_TRUNCATE_RESULTS"
+    )
+
+    dbt_mcp_http_max_connections: int = Field(20, alias="DBT_MCP_HTTP_MAX_CONNECTIONS")
+    dbt_mcp_http_max_keepalive_connections: int = Field(
+        10, alias="DBT_MCP_HTTP_MAX_KEEPALIVE_CONNECTIONS"
+    )
+    dbt_mcp_http_keepalive_expiry: float = Field(
+        30.0, alias="DBT_MCP_HTTP_KEEPALIVE_EXPIRY"
+    )
+    dbt_mcp_http_timeout: float = Field(60.0, alias="DBT_MCP_HTTP_TIMEOUT")
+    dbt_mcp_http_connect_timeout: float = Field(
+        10.0, alias="DBT_MCP_HTTP_CONNECT_TIMEOUT"
+    )
+
     @property
     def actual_host(self) -> str | None:
         return self.dbt_host or self.dbt_mcp_host
@@ -127,6 +295,67 @@ class DbtMcpSettings(BaseSettings):
             raise ValueError("\n".join(errors))
         return tool_names
 
+    @field_validator("dbt_mcp_toolset_max_workers", mode="before")
+    @classmethod
+    def parse_toolset_max_workers(
+        cls, env_var: str | dict[Toolset, int] | None
+    ) -> dict[Toolset, int]:
+        if isinstance(env_var, dict):
+            return env_var
+        return _parse_toolset_values(
+            env_var,
+            env_var_name="DBT_MCP_TOOLSET_MAX_WORKERS",
+            value_name="max workers",
+            parse_value=int,
+            defaults={Toolset.DBT_CLI: 1},
+        )
+
+    @field_validator("dbt_mcp_toolset_cache_ttl", mode="before")
+    @classmethod
+    def parse_toolset_cache_ttl(
+        cls, env_var: str | dict[Toolset, float] | None
+    ) -> dict[Toolset, float]:
+        if isinstance(env_var, dict):
+            return env_var
+        return _parse_toolset_values(
+            env_var,
+            env_var_name="DBT_MCP_TOOLSET_CACHE_TTL",
+            value_name="ttl seconds",
+            parse_value=float,
+            defaults=DEFAULT_TOOLSET_CACHE_TTL,
+        )
+
+
+def _parse_toolset_values(
+    env_var: str | None,
+    *,
+    env_var_name: str,
+    value_name: str,
+    parse_value: Callable[[str], T],
+    defaults: dict[Toolset, T],
+) -> dict[Toolset, T]:
+    """Parses per-toolset settings of the form `toolset=value,toolset=value`."""
+    values = dict(defaults)
+    if not env_var:
+        return values
+    errors: list[str] = []
+    for entry in env_var.split(","):
+        entry_stripped = entry.strip()
+        if entry_stripped == "":
+            continue
+        toolset_name, _, value = entry_stripped.partition("=")
+        try:
+            toolset = Toolset(toolset_name.strip())
+            values[toolset] = parse_value(value)
+        except ValueError:
+            errors.append(
+                f"Invalid entry in {env_var_name}: {entry_stripped}."
+                + f" Must be of the form <toolset>=<{value_name}>."
+            )
+    if errors:
+        raise ValueError("\n".join(errors))
+    return values
+
 
 class Config(BaseModel):
     tracking_config: TrackingConfig
@@ -135,9 +364,17 @@ class Config(BaseModel):
     discovery_config: DiscoveryConfig | None = None
     semantic_layer_config: SemanticLayerConfig | None = None
     admin_api_config: AdminApiConfig | None = None
+    tool_execution_config: ToolExecutionConfig = ToolExecutionConfig()
+    tool_cache_config: ToolCacheConfig = ToolCacheConfig()
+    http_client_config: HttpClientConfig = HttpClientConfig()
     disable_tools: list[ToolName]
 
 
+def _get_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    return (Path(cache_home) if cache_home else Path.home() / ".cache") / "dbt-mcp"
+
+
 def load_config() -> Config:
     # Load settings from environment variables using pydantic_settings
     settings = DbtMcpSettings()  # type: ignore[call-arg]
@@ -260,6 +497,8 @@ def load_config() -> Config:
                 "Content-Type": "application/json",
             },
             environment_id=settings.actual_prod_environment_id,
+            catalog_ttl_seconds=settings.dbt_mcp_discovery_catalog_ttl,
+            catalog_max_age_seconds=settings.dbt_mcp_discovery_catalog_max_age,
         )
 
     semantic_layer_config = None
@@ -287,6 +526,25 @@ def load_config() -> Config:
                 "Authorization": f"Bearer {settings.dbt_token}",
                 "x-dbt-partner-source": "dbt-mcp",
             },
+            catalog_ttl_seconds=settings.dbt_mcp_semantic_layer_catalog_ttl,
+            metadata_cache_max_entries=settings.dbt_mcp_semantic_layer_cache_max_entries,
+            result_cache_ttl_seconds=settings.dbt_mcp_semantic_layer_result_cache_ttl,
+            result_cache_max_bytes=settings.dbt_mcp_semantic_layer_result_cache_max_bytes,
+            rollup_cached_results=settings.dbt_mcp_semantic_layer_rollup_cached_results,
+            max_sessions=settings.dbt_mcp_semantic_layer_max_sessions,
+            session_idle_timeout_seconds=settings.dbt_mcp_semantic_layer_session_idle_timeout,
+            result_ttl_seconds=settings.dbt_mcp_semantic_layer_result_ttl,
+            result_max_bytes=settings.dbt_mcp_semantic_layer_result_max_bytes,
+            compiled_sql_cache_ttl_seconds=settings.dbt_mcp_semantic_layer_sql_cache_ttl,
+            compiled_sql_cache_path=(
+                Path(settings.dbt_mcp_semantic_layer_sql_cache_path)
+                if settings.dbt_mcp_semantic_layer_sql_cache_path
+                else _get_cache_dir() / "compiled_sql.sqlite3"
+            ),
+            dimension_values_ttl_seconds=settings.dbt_mcp_semantic_layer_dimension_values_ttl,
+            result_budget_max_rows=settings.dbt_mcp_semantic_layer_result_budget_rows,
+            result_budget_max_bytes=settings.dbt_mcp_semantic_layer_result_budget_bytes,
+            truncate_results_over_budget=settings.dbt_mcp_semantic_layer_truncate_results,
         )
 
     # Load local user ID from dbt profile
@@ -314,5 +572,24 @@ def load_config() -> Config:
         discovery_config=discovery_config,
         semantic_layer_config=semantic_layer_config,
         admin_api_config=admin_api_config,
+        tool_execution_config=ToolExecutionConfig(
+            max_workers=settings.dbt_mcp_max_workers,
+            toolset_max_workers=settings.dbt_mcp_toolset_max_workers,
+            max_queued_calls=settings.dbt_mcp_max_queued_calls,
+            stats_log_interval_seconds=settings.dbt_mcp_stats_log_interval,
+        ),
+        tool_cache_config=ToolCacheConfig(
+            ttl_seconds=settings.dbt_mcp_tool_cache_ttl,
+            toolset_ttl_seconds=settings.dbt_mcp_toolset_cache_ttl,
+            max_entries=settings.dbt_mcp_tool_cache_max_entries,
+            max_bytes=settings.dbt_mcp_tool_cache_max_bytes,
+        ),
+        http_client_config=HttpClientConfig(
+            max_connections=settings.dbt_mcp_http_max_connections,
+            max_keepalive_connections=settings.dbt_mcp_http_max_keepalive_connections,
+            keepalive_expiry=settings.dbt_mcp_http_keepalive_expiry,
+            timeout=settings.dbt_mcp_http_timeout,
+            connect_timeout=settings.dbt_mcp_http_connect_timeout,
+        ),
         disable_tools=settings.disable_tools or [],
     )
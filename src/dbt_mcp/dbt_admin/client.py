@@ -1,9 +1,10 @@
 import logging
-from functools import cache
 from typing import Any, Dict, List, Optional
-import requests
+
+import httpx
 
 from dbt_mcp.config.config import AdminApiConfig
+from dbt_mcp.http.client import HttpClientManager
 
 logger = logging.getLogger(__name__)
 
@@ -17,30 +18,40 @@ class AdminAPIError(Exception):
 class DbtAdminAPIClient:
     """Client for interacting with the dbt Admin API."""
 
-    def __init__(self, config: AdminApiConfig):
+    def __init__(
+        self, config: AdminApiConfig, http_client: httpx.AsyncClient | None = None
+    ):
         self.config = config
         self.headers = {
             "Authorization": f"Bearer {config.token}",
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
+        self._http_client = http_client
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        return self._http_client or HttpClientManager.get_client(self.config.url)
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+    async def _make_request(
+        self, method: str, endpoint: str, **kwargs
+    ) -> Dict[str, Any]:
         """Make a request to the dbt API."""
         url = f"{self.config.url}{endpoint}"
 
         try:
-            response = requests.request(method, url, headers=self.headers, **kwargs)
+            response = await self.http_client.request(
+                method, url, headers=self.headers, **kwargs
+            )
             response.raise_for_status()
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"API request failed: {e}")
             raise AdminAPIError(f"API request failed: {e}")
 
-    @cache
-    def list_jobs(self, account_id: int, **params) -> List[Dict[str, Any]]:
+    async def list_jobs(self, account_id: int, **params) -> List[Dict[str, Any]]:
         """List jobs for an account."""
-        result = self._make_request(
+        result = await self._make_request(
             "GET",
             f"/api/v2/accounts/{account_id}/jobs/?include_related=['most_recent_run','most_recent_completed_run']",
             params=params,
@@ -105,28 +116,28 @@ class DbtAdminAPIClient:
 
         return filtered_data
 
-    def get_job_details(self, account_id: int, job_id: int) -> Dict[str, Any]:
+    async def get_job_details(self, account_id: int, job_id: int) -> Dict[str, Any]:
         """Get details for a specific job."""
-        result = self._make_request(
+        result = await self._make_request(
             "GET",
             f"/api/v2/accounts/{account_id}/jobs/{job_id}/?include_related=['most_recent_run','most_recent_completed_run']",
         )
         return result.get("data", {})
 
-    def trigger_job_run(
+    async def trigger_job_run(
         self, account_id: int, job_id: int, cause: str, **kwargs
     ) -> Dict[str, Any]:
         """Trigger a job run."""
         data = {"cause": cause, **kwargs}
-        result = self._make_request(
+        result = await self._make_request(
             "POST", f"/api/v2/accounts/{account_id}/jobs/{job_id}/run/", json=data
         )
         return result.get("data", {})
 
-    def list_jobs_runs(self, account_id: int, **params) -> List[Dict[str, Any]]:
+    async def list_jobs_runs(self, account_id: int, **params) -> List[Dict[str, Any]]:
         """List runs for an account."""
         extra_info = "?include_related=['job']"
-        result = self._make_request(
+        result = await self._make_request(
             "GET", f"/api/v2/accounts/{account_id}/runs/{extra_info}", params=params
         )
 
@@ -164,7 +175,7 @@ class DbtAdminAPIClient:
 
         return data
 
-    def get_job_run_details(
+    async def get_job_run_details(
         self, account_id: int, run_id: int, debug: bool = False
     ) -> Dict[str, Any]:
         """Get details for a specific job run."""
@@ -173,7 +184,7 @@ class DbtAdminAPIClient:
         incl = "?include_related=['run_steps']"
         if debug:
             incl = "?include_related=['run_steps','debug_logs']"
-        result = self._make_request(
+        result = await self._make_request(
             "GET", f"/api/v2/accounts/{account_id}/runs/{run_id}/{incl}"
         )
         data = result.get("data", {})
@@ -185,23 +196,23 @@ class DbtAdminAPIClient:
 
         return data
 
-    def cancel_job_run(self, account_id: int, run_id: int) -> Dict[str, Any]:
+    async def cancel_job_run(self, account_id: int, run_id: int) -> Dict[str, Any]:
         """Cancel a job run."""
-        result = self._make_request(
+        result = await self._make_request(
             "POST", f"/api/v2/accounts/{account_id}/runs/{run_id}/cancel/"
         )
         return result.get("data", {})
 
-    def retry_job_run(self, account_id: int, run_id: int) -> Dict[str, Any]:
+    async def retry_job_run(self, account_id: int, run_id: int) -> Dict[str, Any]:
         """Retry a failed job run."""
-        result = self._make_request(
+        result = await self._make_request(
             "POST", f"/api/v2/accounts/{account_id}/runs/{run_id}/retry/"
         )
         return result.get("data", {})
 
-    def list_job_run_artifacts(self, account_id: int, run_id: int) -> List[str]:
+    async def list_job_run_artifacts(self, account_id: int, run_id: int) -> List[str]:
         """List artifacts for a job run."""
-        result = self._make_request(
+        result = await self._make_request(
             "GET", f"/api/v2/accounts/{account_id}/runs/{run_id}/artifacts/"
         )
         data = result.get("data", [])
@@ -216,7 +227,7 @@ class DbtAdminAPIClient:
         ]
         return filtered_data
 
-    def get_job_run_artifact(
+    async def get_job_run_artifact(
         self,
         account_id: int,
         run_id: int,
@@ -233,7 +244,7 @@ class DbtAdminAPIClient:
             "Accept": "*/*",
         }
 
-        response = requests.get(
+        response = await self.http_client.get(
             f"{self.config.url}/api/v2/accounts/{account_id}/runs/{run_id}/artifacts/{artifact_path}",
             headers=get_artifact_header,
             params=params,
@@ -41,7 +41,7 @@ STATUS_MAP = {
 def create_admin_api_tool_definitions(
     admin_client: DbtAdminAPIClient, admin_api_config: AdminApiConfig
 ) -> list[ToolDefinition]:
-    def list_jobs(
+    async def list_jobs(
         # TODO: add support for project_id in the future
         # project_id: Optional[int] = None,
         limit: int | None = None,
@@ -58,22 +58,24 @@ def create_admin_api_tool_definitions(
                 params["limit"] = limit
             if offset:
                 params["offset"] = offset
-            return admin_client.list_jobs(admin_api_config.account_id, **params)
+            return await admin_client.list_jobs(admin_api_config.account_id, **params)
         except Exception as e:
             logger.error(
                 f"Error listing jobs for account {admin_api_config.account_id}: {e}"
             )
             return str(e)
 
-    def get_job_details(job_id: int) -> dict[str, Any] | str:
+    async def get_job_details(job_id: int) -> dict[str, Any] | str:
         """Get details for a specific job."""
         try:
-            return admin_client.get_job_details(admin_api_config.account_id, job_id)
+            return await admin_client.get_job_details(
+                admin_api_config.account_id, job_id
+            )
         except Exception as e:
             logger.error(f"Error getting job {job_id}: {e}")
             return str(e)
 
-    def trigger_job_run(
+    async def trigger_job_run(
         job_id: int,
         cause: str = "Triggered by dbt MCP",
         git_branch: str | None = None,
@@ -89,14 +91,14 @@ def create_admin_api_tool_definitions(
                 kwargs["git_sha"] = git_sha
             if schema_override:
                 kwargs["schema_override"] = schema_override
-            return admin_client.trigger_job_run(
+            return await admin_client.trigger_job_run(
                 admin_api_config.account_id, job_id, cause, **kwargs
             )
         except Exception as e:
             logger.error(f"Error triggering job {job_id}: {e}")
             return str(e)
 
-    def list_jobs_runs(
+    async def list_jobs_runs(
         job_id: int | None = None,
         status: JobRunStatus | None = None,
         limit: int | None = None,
@@ -117,14 +119,16 @@ def create_admin_api_tool_definitions(
                 params["offset"] = offset
             if order_by:
                 params["order_by"] = order_by
-            return admin_client.list_jobs_runs(admin_api_config.account_id, **params)
+            return await admin_client.list_jobs_runs(
+                admin_api_config.account_id, **params
+            )
         except Exception as e:
             logger.error(
                 f"Error listing runs for account {admin_api_config.account_id}: {e}"
             )
             return str(e)
 
-    def get_job_run_details(
+    async def get_job_run_details(
         run_id: int,
         debug: bool = Field(
             default=False,
@@ -133,45 +137,47 @@ def create_admin_api_tool_definitions(
     ) -> dict[str, Any] | str:
         """Get details for a specific job run."""
         try:
-            return admin_client.get_job_run_details(
+            return await admin_client.get_job_run_details(
                 admin_api_config.account_id, run_id, debug=debug
             )
         except Exception as e:
             logger.error(f"Error getting run {run_id}: {e}")
             return str(e)
 
-    def cancel_job_run(run_id: int) -> dict[str, Any] | str:
+    async def cancel_job_run(run_id: int) -> dict[str, Any] | str:
         """Cancel a job run."""
         try:
-            return admin_client.cancel_job_run(admin_api_config.account_id, run_id)
+            return await admin_client.cancel_job_run(
+                admin_api_config.account_id, run_id
+            )
         except Exception as e:
             logger.error(f"Error cancelling run {run_id}: {e}")
             return str(e)
 
-    def retry_job_run(run_id: int) -> dict[str, Any] | str:
+    async def retry_job_run(run_id: int) -> dict[str, Any] | str:
         """Retry a failed job run."""
         try:
-            return admin_client.retry_job_run(admin_api_config.account_id, run_id)
+            return await admin_client.retry_job_run(admin_api_config.account_id, run_id)
         except Exception as e:
             logger.error(f"Error retrying run {run_id}: {e}")
             return str(e)
 
-    def list_job_run_artifacts(run_id: int) -> list[str] | str:
+    async def list_job_run_artifacts(run_id: int) -> list[str] | str:
         """List artifacts for a job run."""
         try:
-            return admin_client.list_job_run_artifacts(
+            return await admin_client.list_job_run_artifacts(
                 admin_api_config.account_id, run_id
             )
         except Exception as e:
             logger.error(f"Error listing artifacts for run {run_id}: {e}")
             return str(e)
 
-    def get_job_run_artifact(
+    async def get_job_run_artifact(
         run_id: int, artifact_path: str, step: int | None = None
     ) -> Any | str:
         """Get a specific job run artifact."""
         try:
-            return admin_client.get_job_run_artifact(
+            return await admin_client.get_job_run_artifact(
                 admin_api_config.account_id, run_id, artifact_path, step
             )
         except Exception as e:
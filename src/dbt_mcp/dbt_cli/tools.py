@@ -1,17 +1,56 @@
+import json
+import logging
 import os
 import subprocess
 from collections.abc import Iterable, Sequence
 
+import pyarrow as pa
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
 
 from dbt_mcp.config.config import DbtCliConfig
 from dbt_mcp.prompts.prompts import get_prompt
+from dbt_mcp.results.serialization import ResultFormat, serialize_table
 from dbt_mcp.tools.definitions import ToolDefinition
 from dbt_mcp.tools.register import register_tools
 from dbt_mcp.tools.tool_names import ToolName
 from dbt_mcp.tools.annotations import create_tool_annotations
 
+logger = logging.getLogger(__name__)
+
+
+def _get_show_rows(output: str) -> list[dict] | None:
+    """Finds the rows in the JSON printed by `dbt show --output json`,
+    which comes after any log lines."""
+    decoder = json.JSONDecoder()
+    offset = 0
+    while offset < len(output):
+        if output.startswith("{", offset):
+            try:
+                data, _ = decoder.raw_decode(output, offset)
+                if isinstance(data, dict) and isinstance(data.get("show"), list):
+                    return data["show"]
+            except json.JSONDecodeError:
+                pass
+        next_line = output.find("\n", offset)
+        if next_line == -1:
+            break
+        offset = next_line + 1
+    return None
+
+
+def _format_show_output(output: str, output_format: ResultFormat) -> str:
+    rows = _get_show_rows(output)
+    if rows is None:
+        # e.g. a compilation or database error
+        return output
+    try:
+        table = pa.Table.from_pylist(rows)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        logger.warning("Could not convert dbt show results, returning them as is")
+        return output
+    return serialize_table(table, output_format)
+
 
 def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition]:
     def _run_dbt_command(
@@ -154,6 +193,9 @@ def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition
     def show(
         sql_query: str = Field(description=get_prompt("dbt_cli/args/sql_query")),
         limit: int = Field(default=5, description=get_prompt("dbt_cli/args/limit")),
+        output_format: ResultFormat | None = Field(
+            default=None, description=get_prompt("dbt_cli/args/output_format")
+        ),
     ) -> str:
         args = ["show", "--inline", sql_query, "--favor-state"]
         # This is quite crude, but it should be okay for now
@@ -171,7 +213,10 @@ def create_dbt_cli_tool_definitions(config: DbtCliConfig) -> list[ToolDefinition
         if cli_limit is not None:
             args.extend(["--limit", str(cli_limit)])
         args.extend(["--output", "json"])
-        return _run_dbt_command(args)
+        output = _run_dbt_command(args)
+        if output_format is None:
+            return output
+        return _format_show_output(output, output_format)
 
     return [
         ToolDefinition(
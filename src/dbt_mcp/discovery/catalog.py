@@ -0,0 +1,99 @@
+import json
+import logging
+import time
+from dataclasses import dataclass
+
+from dbt_mcp.cache.refreshing import RefreshingValue
+from dbt_mcp.discovery.client import ModelFilter, ModelsFetcher
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ModelCatalogStats:
+    # Full crawls of the models of the environment
+    crawls: int = 0
+    # Refreshes that kept the models since the environment hadn't changed
+    unchanged: int = 0
+
+
+@dataclass
+class _Snapshot:
+    models: list[dict]
+    # When the applied state of the environment last changed, if known
+    last_updated_at: str | None
+    crawled_at: float
+
+
+class ModelCatalog:
+    """Keeps the models of the environment in memory, per model filter.
+
+    The first request for a filter crawls its models. Once they're older than
+    `ttl_seconds`, the stale copy keeps being served while a background
+    refresh checks whether the applied state of the environment changed, and
+    only crawls the models again if it did. Models are also crawled again
+    once they're older than `max_age_seconds`, as their order by query usage
+    changes without the applied state changing.
+    """
+
+    def __init__(
+        self,
+        models_fetcher: ModelsFetcher,
+        ttl_seconds: float,
+        max_age_seconds: float,
+    ):
+        self.models_fetcher = models_fetcher
+        self.ttl_seconds = ttl_seconds
+        self.max_age_seconds = max_age_seconds
+        self._catalogs: dict[str, RefreshingValue[_Snapshot]] = {}
+        self._snapshots: dict[str, _Snapshot] = {}
+        self._stats = ModelCatalogStats()
+
+    async def get_models(self, model_filter: ModelFilter | None = None) -> list[dict]:
+        key = json.dumps(model_filter or {}, sort_keys=True)
+        catalog = self._catalogs.get(key)
+        if catalog is None:
+            catalog = RefreshingValue(
+                name=f"model catalog {key}",
+                load=lambda: self._load(key, model_filter),
+                ttl_seconds=self.ttl_seconds,
+            )
+            self._catalogs[key] = catalog
+        snapshot = await catalog.get()
+        return snapshot.models
+
+    def invalidate(self) -> None:
+        """Drops all models so that the next request crawls them again."""
+        for catalog in self._catalogs.values():
+            catalog.invalidate()
+        self._snapshots.clear()
+
+    def get_stats(self) -> ModelCatalogStats:
+        return ModelCatalogStats(
+            crawls=self._stats.crawls, unchanged=self._stats.unchanged
+        )
+
+    async def _load(self, key: str, model_filter: ModelFilter | None) -> _Snapshot:
+        last_updated_at = None
+        try:
+            last_updated_at = await self.models_fetcher.fetch_last_updated_at()
+        except Exception:
+            logger.debug("Error checking the applied state", exc_info=True)
+        current = self._snapshots.get(key)
+        if (
+            current is not None
+            and last_updated_at is not None
+            and last_updated_at == current.last_updated_at
+            and time.monotonic() - current.crawled_at < self.max_age_seconds
+        ):
+            self._stats.unchanged += 1
+            return current
+        models = await self.models_fetcher.fetch_models(model_filter)
+        self._stats.crawls += 1
+        snapshot = _Snapshot(
+            models=models,
+            last_updated_at=last_updated_at,
+            crawled_at=time.monotonic(),
+        )
+        self._snapshots[key] = snapshot
+        return snapshot
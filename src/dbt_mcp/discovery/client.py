@@ -1,12 +1,81 @@
+import asyncio
 import textwrap
-from typing import Literal, TypedDict
+from typing import Any, Literal, TypedDict
 
-import requests
+import httpx
 
 from dbt_mcp.gql.errors import raise_gql_error
+from dbt_mcp.http.client import HttpClientManager
 
 PAGE_SIZE = 100
 MAX_NUM_MODELS = 1000
+# Most models looked up in a single request by the batched fetches
+MAX_BATCH_SIZE = 50
+# Upper bound on the models crawled for the lineage graph
+MAX_NUM_LINEAGE_MODELS = 10_000
+
+# Types of the nodes that can be parents or children of a model
+LINEAGE_NODE_TYPES = [
+    "ExposureAppliedStateNestedNode",
+    "ExternalModelNode",
+    "MacroDefinitionNestedNode",
+    "MetricDefinitionNestedNode",
+    "ModelAppliedStateNestedNode",
+    "SavedQueryDefinitionNestedNode",
+    "SeedAppliedStateNestedNode",
+    "SemanticModelDefinitionNestedNode",
+    "SnapshotAppliedStateNestedNode",
+    "SourceAppliedStateNestedNode",
+    "TestAppliedStateNestedNode",
+]
+
+
+def get_model_query(name: str, node_fields: str) -> str:
+    """A query for the given fields of the models matching a filter."""
+    return (
+        textwrap.dedent(f"""
+        query {name}(
+            $environmentId: BigInt!,
+            $modelsFilter: ModelAppliedFilter
+            $first: Int,
+        ) {{
+            environment(id: $environmentId) {{
+                applied {{
+                    models(filter: $modelsFilter, first: $first) {{
+                        edges {{
+                            node {{
+        """)
+        + node_fields
+        + textwrap.dedent("""
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    """)
+    )
+
+
+def get_batched_models_query(name: str, node_fields: str, num_filters: int) -> str:
+    """A query for the given fields of the models matching each of
+    `num_filters` filters, in fields aliased `models0`, `models1` and so on.
+    """
+    # Commas are optional in GraphQL, so trailing ones are fine
+    variables = "".join(
+        f"$filter{i}: ModelAppliedFilter, $first{i}: Int, " for i in range(num_filters)
+    )
+    fields = "".join(
+        f"models{i}: models(filter: $filter{i}, first: $first{i}) "
+        + "{ edges { node { uniqueId name "
+        + node_fields
+        + " } } } "
+        for i in range(num_filters)
+    )
+    return (
+        f"query {name}($environmentId: BigInt!, {variables}) {{ "
+        + f"environment(id: $environmentId) {{ applied {{ {fields}}} }} }}"
+    )
 
 
 class GraphQLQueries:
@@ -37,118 +106,100 @@ class GraphQLQueries:
         }
     """)
 
-    GET_MODEL_HEALTH = textwrap.dedent("""
-        query GetModelDetails(
-            $environmentId: BigInt!,
-            $modelsFilter: ModelAppliedFilter
-            $first: Int,
-        ) {
+    GET_LAST_UPDATED_AT = textwrap.dedent("""
+        query GetLastUpdatedAt($environmentId: BigInt!) {
             environment(id: $environmentId) {
                 applied {
-                    models(filter: $modelsFilter, first: $first) {
-                        edges {
-                            node {
-                                name
-                                uniqueId
-                                executionInfo {
-                                    lastRunGeneratedAt
-                                    lastRunStatus
-                                    executeCompletedAt
-                                    executeStartedAt
-                                }
-                                tests {
-                                    name
-                                    description
-                                    columnName
-                                    testType
-                                    executionInfo {
-                                        lastRunGeneratedAt
-                                        lastRunStatus
-                                        executeCompletedAt
-                                        executeStartedAt
-                                    }
-                                }
-                                ancestors(types: [Model, Source, Seed, Snapshot]) {
-                                  ... on ModelAppliedStateNestedNode {
-                                    name
-                                    uniqueId
-                                    resourceType
-                                    materializedType
-                                    modelexecutionInfo: executionInfo {
-                                      lastRunStatus
-                                      executeCompletedAt
-                                      }
-                                  }
-                                  ... on SnapshotAppliedStateNestedNode {
-                                    name
-                                    uniqueId
-                                    resourceType
-                                    snapshotExecutionInfo: executionInfo {
-                                      lastRunStatus
-                                      executeCompletedAt
-                                    }
-                                  }
-                                  ... on SeedAppliedStateNestedNode {
-                                    name
-                                    uniqueId
-                                    resourceType
-                                    seedExecutionInfo: executionInfo {
-                                      lastRunStatus
-                                      executeCompletedAt
-                                    }
-                                  }
-                                  ... on SourceAppliedStateNestedNode {
-                                    sourceName
-                                    name
-                                    resourceType
-                                    freshness {
-                                      maxLoadedAt
-                                      maxLoadedAtTimeAgoInS
-                                      freshnessStatus
-                                    }
-                                  }
-                              }
-                            }
-                        }
-                    }
+                    lastUpdatedAt
                 }
             }
         }
     """)
 
-    GET_MODEL_DETAILS = textwrap.dedent("""
-        query GetModelDetails(
-            $environmentId: BigInt!,
-            $modelsFilter: ModelAppliedFilter
-            $first: Int,
-        ) {
-            environment(id: $environmentId) {
-                applied {
-                    models(filter: $modelsFilter, first: $first) {
-                        edges {
-                            node {
-                                name
-                                uniqueId
-                                rawCode
-                                description
-                                database
-                                schema
-                                alias
-                                catalog {
-                                    columns {
-                                        description
-                                        name
-                                        type
-                                    }
-                                }
-                            }
-                        }
-                    }
+    MODEL_HEALTH_FIELDS = textwrap.dedent("""
+        name
+        uniqueId
+        executionInfo {
+            lastRunGeneratedAt
+            lastRunStatus
+            executeCompletedAt
+            executeStartedAt
+        }
+        tests {
+            name
+            description
+            columnName
+            testType
+            executionInfo {
+                lastRunGeneratedAt
+                lastRunStatus
+                executeCompletedAt
+                executeStartedAt
+            }
+        }
+        ancestors(types: [Model, Source, Seed, Snapshot]) {
+            ... on ModelAppliedStateNestedNode {
+                name
+                uniqueId
+                resourceType
+                materializedType
+                modelexecutionInfo: executionInfo {
+                    lastRunStatus
+                    executeCompletedAt
+                }
+            }
+            ... on SnapshotAppliedStateNestedNode {
+                name
+                uniqueId
+                resourceType
+                snapshotExecutionInfo: executionInfo {
+                    lastRunStatus
+                    executeCompletedAt
+                }
+            }
+            ... on SeedAppliedStateNestedNode {
+                name
+                uniqueId
+                resourceType
+                seedExecutionInfo: executionInfo {
+                    lastRunStatus
+                    executeCompletedAt
+                }
+            }
+            ... on SourceAppliedStateNestedNode {
+                sourceName
+                name
+                resourceType
+                freshness {
+                    maxLoadedAt
+                    maxLoadedAtTimeAgoInS
+                    freshnessStatus
                 }
             }
         }
     """)
 
+    GET_MODEL_HEALTH = get_model_query("GetModelHealth", MODEL_HEALTH_FIELDS)
+
+    MODEL_DETAILS_FIELDS = textwrap.dedent("""
+        name
+        uniqueId
+        rawCode
+        description
+        database
+        schema
+        alias
+        catalog {
+            columns {
+                description
+                name
+                type
+            }
+        }
+    """)
+
+    GET_MODEL_DETAILS = get_model_query("GetModelDetails", MODEL_DETAILS_FIELDS)
+
     COMMON_FIELDS_PARENTS_CHILDREN = textwrap.dedent("""
         {
         ... on ExposureAppliedStateNestedNode {
@@ -208,53 +259,53 @@ class GraphQLQueries:
         }
     """)
 
-    GET_MODEL_PARENTS = (
-        textwrap.dedent("""
-        query GetModelParents(
-            $environmentId: BigInt!,
-            $modelsFilter: ModelAppliedFilter
-            $first: Int,
-        ) {
-            environment(id: $environmentId) {
-                applied {
-                    models(filter: $modelsFilter, first: $first) {
-                        pageInfo {
-                            endCursor
-                        }
-                        edges {
-                            node {
-                                parents
-    """)
-        + COMMON_FIELDS_PARENTS_CHILDREN
-        + textwrap.dedent("""
-                                }
-                            }
-                        }
-                    }
-                }
-            }
-        }
-    """)
+    MODEL_PARENTS_FIELDS = "parents" + COMMON_FIELDS_PARENTS_CHILDREN + "}"
+
+    GET_MODEL_PARENTS = get_model_query("GetModelParents", MODEL_PARENTS_FIELDS)
+
+    MODEL_CHILDREN_FIELDS = "children" + COMMON_FIELDS_PARENTS_CHILDREN + "}"
+
+    GET_MODEL_CHILDREN = get_model_query("GetModelChildren", MODEL_CHILDREN_FIELDS)
+
+    LINEAGE_NODE_FIELDS = "".join(
+        f"""
+                                ... on {node_type} {{
+                                    uniqueId
+                                    resourceType
+                                    name
+                                    description
+                                }}"""
+        for node_type in LINEAGE_NODE_TYPES
     )
 
-    GET_MODEL_CHILDREN = (
+    GET_MODELS_LINEAGE = (
         textwrap.dedent("""
-        query GetModelChildren(
+        query GetModelsLineage(
             $environmentId: BigInt!,
-            $modelsFilter: ModelAppliedFilter
-            $first: Int,
+            $after: String,
+            $first: Int
         ) {
             environment(id: $environmentId) {
                 applied {
-                    models(filter: $modelsFilter, first: $first) {
+                    models(after: $after, first: $first) {
                         pageInfo {
                             endCursor
                         }
                         edges {
                             node {
-                                children
-    """)
-        + COMMON_FIELDS_PARENTS_CHILDREN
+                                uniqueId
+                                resourceType
+                                name
+                                description
+                                executionInfo {
+                                    executionTime
+                                }
+                                parents {""")
+        + LINEAGE_NODE_FIELDS
+        + textwrap.dedent("""
+                                }
+                                children {""")
+        + LINEAGE_NODE_FIELDS
         + textwrap.dedent("""
                                 }
                             }
@@ -267,13 +318,43 @@ class GraphQLQueries:
     )
 
 
+ModelProfileSection = Literal["details", "parents", "children", "health"]
+
+# The fields of a model fetched for each section of its profile
+MODEL_PROFILE_FIELDS: dict[ModelProfileSection, str] = {
+    "details": GraphQLQueries.MODEL_DETAILS_FIELDS,
+    "parents": GraphQLQueries.MODEL_PARENTS_FIELDS,
+    "children": GraphQLQueries.MODEL_CHILDREN_FIELDS,
+    "health": GraphQLQueries.MODEL_HEALTH_FIELDS,
+}
+
+
+def _drop_nulls(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _drop_nulls(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_drop_nulls(v) for v in value]
+    return value
+
+
 class MetadataAPIClient:
-    def __init__(self, *, url: str, headers: dict[str, str]):
+    def __init__(
+        self,
+        *,
+        url: str,
+        headers: dict[str, str],
+        http_client: httpx.AsyncClient | None = None,
+    ):
         self.url = url
         self.headers = headers
+        self._http_client = http_client
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        return self._http_client or HttpClientManager.get_client(self.url)
 
-    def execute_query(self, query: str, variables: dict) -> dict:
-        response = requests.post(
+    async def execute_query(self, query: str, variables: dict) -> dict:
+        response = await self.http_client.post(
             url=self.url,
             json={"query": query, "variables": variables},
             headers=self.headers,
@@ -317,7 +398,7 @@ class ModelsFetcher:
         else:
             raise ValueError("Either model_name or unique_id must be provided")
 
-    def fetch_models(self, model_filter: ModelFilter | None = None) -> list[dict]:
+    async def fetch_models(self, model_filter: ModelFilter | None = None) -> list[dict]:
         has_next_page = True
         after_cursor: str = ""
         all_edges: list[dict] = []
@@ -330,7 +411,9 @@ class ModelsFetcher:
                 "sort": {"field": "queryUsageCount", "direction": "desc"},
             }
 
-            result = self.api_client.execute_query(GraphQLQueries.GET_MODELS, variables)
+            result = await self.api_client.execute_query(
+                GraphQLQueries.GET_MODELS, variables
+            )
             all_edges.extend(self._parse_response_to_json(result))
 
             previous_after_cursor = after_cursor
@@ -342,7 +425,191 @@ class ModelsFetcher:
 
         return all_edges
 
-    def fetch_model_details(
+    async def fetch_models_lineage(self) -> list[dict]:
+        """All models of the environment along with their parents and
+        children, in as few requests as the page size allows."""
+        after_cursor: str = ""
+        all_edges: list[dict] = []
+        while len(all_edges) < MAX_NUM_LINEAGE_MODELS:
+            result = await self.api_client.execute_query(
+                GraphQLQueries.GET_MODELS_LINEAGE,
+                {
+                    "environmentId": self.environment_id,
+                    "after": after_cursor,
+                    "first": PAGE_SIZE,
+                },
+            )
+            all_edges.extend(self._parse_response_to_json(result))
+            previous_after_cursor = after_cursor
+            after_cursor = result["data"]["environment"]["applied"]["models"][
+                "pageInfo"
+            ]["endCursor"]
+            if not after_cursor or previous_after_cursor == after_cursor:
+                break
+        return all_edges
+
+    async def fetch_last_updated_at(self) -> str | None:
+        """When the applied state of the environment last changed."""
+        result = await self.api_client.execute_query(
+            GraphQLQueries.GET_LAST_UPDATED_AT,
+            {"environmentId": self.environment_id},
+        )
+        raise_gql_error(result)
+        return result["data"]["environment"]["applied"]["lastUpdatedAt"]
+
+    async def _fetch_model_nodes_batch(
+        self,
+        name: str,
+        node_fields: str,
+        model_names: list[str] | None = None,
+        unique_ids: list[str] | None = None,
+    ) -> dict[str, dict]:
+        """Maps each of the given model names and unique IDs that match a
+        model to its node, looking up at most `MAX_BATCH_SIZE` of them per
+        request.
+
+        Unique IDs are looked up together through a single `uniqueIds`
+        filter per request, and names through an aliased field each.
+        """
+        references: list[tuple[str | None, str | None]] = [
+            (None, u) for u in dict.fromkeys(unique_ids or [])
+        ] + [(n, None) for n in dict.fromkeys(model_names or [])]
+        if not references:
+            raise ValueError("Either model_names or unique_ids must be provided")
+        batches = [
+            references[i : i + MAX_BATCH_SIZE]
+            for i in range(0, len(references), MAX_BATCH_SIZE)
+        ]
+        nodes: dict[str, dict] = {}
+        results = await asyncio.gather(
+            *(self._fetch_batch(name, node_fields, batch) for batch in batches)
+        )
+        for result in results:
+            nodes.update(result)
+        return nodes
+
+    async def _fetch_batch(
+        self,
+        name: str,
+        node_fields: str,
+        references: list[tuple[str | None, str | None]],
+    ) -> dict[str, dict]:
+        batch_unique_ids = [u for _, u in references if u is not None]
+        batch_names = [n for n, _ in references if n is not None]
+        filters: list[tuple[dict, int]] = [
+            ({"identifier": model_name}, 1) for model_name in batch_names
+        ]
+        if batch_unique_ids:
+            filters.append(({"uniqueIds": batch_unique_ids}, len(batch_unique_ids)))
+        variables: dict = {"environmentId": self.environment_id}
+        for i, (model_filter, first) in enumerate(filters):
+            variables[f"filter{i}"] = model_filter
+            variables[f"first{i}"] = first
+        result = await self.api_client.execute_query(
+            get_batched_models_query(name, node_fields, len(filters)), variables
+        )
+        raise_gql_error(result)
+        applied = result["data"]["environment"]["applied"]
+        nodes: dict[str, dict] = {}
+        for i, model_name in enumerate(batch_names):
+            edges = applied[f"models{i}"]["edges"]
+            if edges:
+                nodes[model_name] = edges[0]["node"]
+        if batch_unique_ids:
+            for edge in applied[f"models{len(batch_names)}"]["edges"]:
+                nodes[edge["node"]["uniqueId"]] = edge["node"]
+        return nodes
+
+    async def fetch_model_details_batch(
+        self, model_names: list[str] | None = None, unique_ids: list[str] | None = None
+    ) -> dict[str, dict]:
+        nodes = await self._fetch_model_nodes_batch(
+            "GetModelDetailsBatch",
+            GraphQLQueries.MODEL_DETAILS_FIELDS,
+            model_names,
+            unique_ids,
+        )
+        return {
+            r: nodes.get(r, {}) for r in [*(model_names or []), *(unique_ids or [])]
+        }
+
+    async def fetch_model_health_batch(
+        self, model_names: list[str] | None = None, unique_ids: list[str] | None = None
+    ) -> dict[str, dict]:
+        nodes = await self._fetch_model_nodes_batch(
+            "GetModelHealthBatch",
+            GraphQLQueries.MODEL_HEALTH_FIELDS,
+            model_names,
+            unique_ids,
+        )
+        return {
+            r: nodes.get(r, {}) for r in [*(model_names or []), *(unique_ids or [])]
+        }
+
+    async def fetch_model_parents_batch(
+        self, model_names: list[str] | None = None, unique_ids: list[str] | None = None
+    ) -> dict[str, list[dict]]:
+        nodes = await self._fetch_model_nodes_batch(
+            "GetModelParentsBatch",
+            GraphQLQueries.MODEL_PARENTS_FIELDS,
+            model_names,
+            unique_ids,
+        )
+        return {
+            r: nodes[r]["parents"] if r in nodes else []
+            for r in [*(model_names or []), *(unique_ids or [])]
+        }
+
+    async def fetch_model_children_batch(
+        self, model_names: list[str] | None = None, unique_ids: list[str] | None = None
+    ) -> dict[str, list[dict]]:
+        nodes = await self._fetch_model_nodes_batch(
+            "GetModelChildrenBatch",
+            GraphQLQueries.MODEL_CHILDREN_FIELDS,
+            model_names,
+            unique_ids,
+        )
+        return {
+            r: nodes[r]["children"] if r in nodes else []
+            for r in [*(model_names or []), *(unique_ids or [])]
+        }
+
+    async def fetch_model_profile(
+        self,
+        model_name: str | None = None,
+        unique_id: str | None = None,
+        sections: list[ModelProfileSection] | None = None,
+    ) -> dict:
+        """The given sections of the profile of a model, from a single
+        request.
+
+        The fields of all sections are selected in one query, so the fields
+        they share are only returned once, and null fields are left out.
+        """
+        sections = sections or list(MODEL_PROFILE_FIELDS)
+        unknown = [s for s in sections if s not in MODEL_PROFILE_FIELDS]
+        if unknown:
+            raise ValueError(
+                f"Unknown sections: {', '.join(unknown)}. "
+                + f"Available sections: {', '.join(MODEL_PROFILE_FIELDS)}."
+            )
+        query = get_model_query(
+            "GetModelProfile",
+            "".join(MODEL_PROFILE_FIELDS[s] for s in dict.fromkeys(sections)),
+        )
+        variables = {
+            "environmentId": self.environment_id,
+            "modelsFilter": self._get_model_filters(model_name, unique_id),
+            "first": 1,
+        }
+        result = await self.api_client.execute_query(query, variables)
+        raise_gql_error(result)
+        edges = result["data"]["environment"]["applied"]["models"]["edges"]
+        if not edges:
+            return {}
+        return _drop_nulls(edges[0]["node"])
+
+    async def fetch_model_details(
         self, model_name: str | None = None, unique_id: str | None = None
     ) -> dict:
         model_filters = self._get_model_filters(model_name, unique_id)
@@ -351,7 +618,7 @@ class ModelsFetcher:
             "modelsFilter": model_filters,
             "first": 1,
         }
-        result = self.api_client.execute_query(
+        result = await self.api_client.execute_query(
             GraphQLQueries.GET_MODEL_DETAILS, variables
         )
         raise_gql_error(result)
@@ -360,7 +627,7 @@ class ModelsFetcher:
             return {}
         return edges[0]["node"]
 
-    def fetch_model_parents(
+    async def fetch_model_parents(
         self, model_name: str | None = None, unique_id: str | None = None
     ) -> list[dict]:
         model_filters = self._get_model_filters(model_name, unique_id)
@@ -369,7 +636,7 @@ class ModelsFetcher:
             "modelsFilter": model_filters,
             "first": 1,
         }
-        result = self.api_client.execute_query(
+        result = await self.api_client.execute_query(
             GraphQLQueries.GET_MODEL_PARENTS, variables
         )
         raise_gql_error(result)
@@ -378,7 +645,7 @@ class ModelsFetcher:
             return []
         return edges[0]["node"]["parents"]
 
-    def fetch_model_children(
+    async def fetch_model_children(
         self, model_name: str | None = None, unique_id: str | None = None
     ) -> list[dict]:
         model_filters = self._get_model_filters(model_name, unique_id)
@@ -387,7 +654,7 @@ class ModelsFetcher:
             "modelsFilter": model_filters,
             "first": 1,
         }
-        result = self.api_client.execute_query(
+        result = await self.api_client.execute_query(
             GraphQLQueries.GET_MODEL_CHILDREN, variables
         )
         raise_gql_error(result)
@@ -396,7 +663,7 @@ class ModelsFetcher:
             return []
         return edges[0]["node"]["children"]
 
-    def fetch_model_health(
+    async def fetch_model_health(
         self, model_name: str | None = None, unique_id: str | None = None
     ) -> list[dict]:
         model_filters = self._get_model_filters(model_name, unique_id)
@@ -405,7 +672,7 @@ class ModelsFetcher:
             "modelsFilter": model_filters,
             "first": 1,
         }
-        result = self.api_client.execute_query(
+        result = await self.api_client.execute_query(
             GraphQLQueries.GET_MODEL_HEALTH, variables
         )
         raise_gql_error(result)
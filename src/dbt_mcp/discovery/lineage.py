@@ -0,0 +1,242 @@
+import logging
+import sys
+from collections import deque
+from typing import Literal
+
+from dbt_mcp.cache.refreshing import RefreshingValue
+from dbt_mcp.discovery.client import ModelsFetcher
+
+logger = logging.getLogger(__name__)
+
+LineageDirection = Literal["ancestors", "descendants"]
+
+# Number of the slowest downstream models listed in an impact analysis
+SLOWEST_MODELS = 10
+
+# Returned along with lineage answers, since the graph only knows the edges
+# that the models of the environment report
+LINEAGE_SCOPE = "models"
+LINEAGE_SCOPE_NOTE = (
+    "Only edges to and from models are known. Edges between two other "
+    + "nodes, like a source that a snapshot selects from directly or an "
+    + "exposure that depends on a source, are missing."
+)
+
+
+class LineageGraph:
+    """Adjacency lists of the lineage of an environment.
+
+    The graph is built from the parents and children of every model, so it
+    has the edges that touch a model but not those between two other nodes,
+    like a source and a snapshot. Nodes are numbered, and their unique IDs,
+    names and resource types are interned, so that the graph of a large
+    project stays small. Every node maps to the numbers of its parents and
+    children.
+    """
+
+    def __init__(self, models: list[dict], last_updated_at: str | None = None):
+        # When the applied state of the environment last changed, if known
+        self.last_updated_at = last_updated_at
+        self._ids: dict[str, int] = {}
+        self._unique_ids: list[str] = []
+        self._names: list[str] = []
+        self._resource_types: list[str] = []
+        self._descriptions: list[str | None] = []
+        self._model_ids_by_name: dict[str, int] = {}
+        # Seconds the last run of each model took, if it has run
+        self._execution_times: dict[int, float] = {}
+        parents: list[set[int]] = []
+        children: list[set[int]] = []
+
+        def add_node(node: dict) -> int | None:
+            unique_id = node.get("uniqueId")
+            if not unique_id:
+                return None
+            node_id = self._ids.get(unique_id)
+            if node_id is None:
+                node_id = len(self._unique_ids)
+                self._ids[sys.intern(unique_id)] = node_id
+                self._unique_ids.append(sys.intern(unique_id))
+                self._names.append(sys.intern(node.get("name") or ""))
+                self._resource_types.append(sys.intern(node.get("resourceType") or ""))
+                self._descriptions.append(node.get("description"))
+                parents.append(set())
+                children.append(set())
+            return node_id
+
+        for model in models:
+            model_id = add_node(model)
+            if model_id is None:
+                continue
+            self._model_ids_by_name.setdefault(self._names[model_id], model_id)
+            execution_time = (model.get("executionInfo") or {}).get("executionTime")
+            if execution_time is not None:
+                self._execution_times[model_id] = execution_time
+            for parent in model.get("parents") or []:
+                parent_id = add_node(parent)
+                if parent_id is not None:
+                    parents[model_id].add(parent_id)
+                    children[parent_id].add(model_id)
+            for child in model.get("children") or []:
+                child_id = add_node(child)
+                if child_id is not None:
+                    children[model_id].add(child_id)
+                    parents[child_id].add(model_id)
+
+        self._parents = [tuple(sorted(p)) for p in parents]
+        self._children = [tuple(sorted(c)) for c in children]
+
+    def __len__(self) -> int:
+        return len(self._unique_ids)
+
+    def find_model(
+        self, model_name: str | None = None, unique_id: str | None = None
+    ) -> int | None:
+        if unique_id:
+            return self._ids.get(unique_id)
+        elif model_name:
+            return self._model_ids_by_name.get(model_name)
+        else:
+            raise ValueError("Either model_name or unique_id must be provided")
+
+    def get_parents(self, node_id: int) -> list[dict]:
+        return [self._describe(p) for p in self._parents[node_id]]
+
+    def get_children(self, node_id: int) -> list[dict]:
+        return [self._describe(c) for c in self._children[node_id]]
+
+    def traverse(
+        self,
+        node_id: int,
+        direction: LineageDirection,
+        depth: int | None = None,
+        resource_types: list[str] | None = None,
+    ) -> list[dict]:
+        """The ancestors or descendants of a node, up to `depth` hops away,
+        closest first.
+
+        `resource_types` filters the nodes returned, not the nodes walked
+        through, so that for example the sources behind a chain of models
+        are still found.
+        """
+        edges = self._parents if direction == "ancestors" else self._children
+        wanted = {t.lower() for t in resource_types} if resource_types else None
+        return [
+            self._describe(node) | {"depth": distance}
+            for node, distance in self._walk([node_id], edges, depth).items()
+            if wanted is None or self._resource_types[node].lower() in wanted
+        ]
+
+    def get_downstream_impact(self, node_ids: list[int]) -> dict:
+        """What building the given nodes and everything downstream of them
+        involves: the number of downstream nodes of each resource type, the
+        exposures affected, and how long the models took on their last run.
+        """
+        downstream = self._walk(node_ids, self._children)
+        counts: dict[str, int] = {}
+        for node in downstream:
+            resource_type = self._resource_types[node]
+            counts[resource_type] = counts.get(resource_type, 0) + 1
+        selected = list(dict.fromkeys(node_ids))
+        # The selected nodes are built too
+        built = [*selected, *downstream]
+        timed = [
+            (self._execution_times[n], n) for n in built if n in self._execution_times
+        ]
+        slowest = sorted(timed, reverse=True)[:SLOWEST_MODELS]
+        return {
+            "selected": [self._unique_ids[n] for n in selected],
+            "downstreamCounts": counts,
+            "exposures": [
+                self._describe(n) | {"depth": distance}
+                for n, distance in downstream.items()
+                if self._resource_types[n].lower() == "exposure"
+            ],
+            "executionTimeSeconds": sum(t for t, _ in timed),
+            # Models without a recorded run aren't in the total
+            "modelsWithoutExecutionTime": sum(
+                1
+                for n in built
+                if self._resource_types[n].lower() == "model"
+                and n not in self._execution_times
+            ),
+            "slowestModels": [
+                {"uniqueId": self._unique_ids[n], "executionTimeSeconds": t}
+                for t, n in slowest
+            ],
+        }
+
+    def _walk(
+        self,
+        node_ids: list[int],
+        edges: list[tuple[int, ...]],
+        depth: int | None = None,
+    ) -> dict[int, int]:
+        """Breadth-first walk from the given nodes, mapping every node
+        reached, closest first, to its distance from them."""
+        distances = dict.fromkeys(node_ids, 0)
+        reached: dict[int, int] = {}
+        queue = deque(distances)
+        while queue:
+            current = queue.popleft()
+            distance = distances[current] + 1
+            if depth is not None and distance > depth:
+                continue
+            for neighbor in edges[current]:
+                if neighbor in distances:
+                    continue
+                distances[neighbor] = distance
+                reached[neighbor] = distance
+                queue.append(neighbor)
+        return reached
+
+    def _describe(self, node_id: int) -> dict:
+        return {
+            "uniqueId": self._unique_ids[node_id],
+            "resourceType": self._resource_types[node_id],
+            "name": self._names[node_id],
+            "description": self._descriptions[node_id],
+        }
+
+
+class ModelLineage:
+    """Keeps the lineage graph of the environment in memory.
+
+    The graph is loaded in bulk on first use. Once it's older than
+    `ttl_seconds`, it keeps being served while a background refresh checks
+    whether the applied state of the environment changed, and only loads
+    the graph again if it did.
+    """
+
+    def __init__(self, models_fetcher: ModelsFetcher, ttl_seconds: float):
+        self.models_fetcher = models_fetcher
+        self.graph = RefreshingValue(
+            name="lineage graph", load=self._load, ttl_seconds=ttl_seconds
+        )
+        self._current: LineageGraph | None = None
+
+    async def get_graph(self) -> LineageGraph:
+        return await self.graph.get()
+
+    def get_graph_nowait(self) -> LineageGraph | None:
+        """The graph if it has been loaded, starting to load it otherwise."""
+        return self.graph.get_nowait()
+
+    async def _load(self) -> LineageGraph:
+        last_updated_at = None
+        try:
+            last_updated_at = await self.models_fetcher.fetch_last_updated_at()
+        except Exception:
+            logger.debug("Error checking the applied state", exc_info=True)
+        current = self._current
+        if (
+            current is not None
+            and last_updated_at is not None
+            and last_updated_at == current.last_updated_at
+        ):
+            return current
+        models = await self.models_fetcher.fetch_models_lineage()
+        graph = LineageGraph(models, last_updated_at=last_updated_at)
+        logger.info(f"Loaded lineage graph of {len(graph)} nodes")
+        self._current = graph
+        return graph
@@ -1,10 +1,22 @@
 import logging
 from collections.abc import Sequence
+from typing import Literal
 
 from mcp.server.fastmcp import FastMCP
 
 from dbt_mcp.config.config import DiscoveryConfig
-from dbt_mcp.discovery.client import MetadataAPIClient, ModelsFetcher
+from dbt_mcp.discovery.catalog import ModelCatalog
+from dbt_mcp.discovery.client import (
+    MetadataAPIClient,
+    ModelProfileSection,
+    ModelsFetcher,
+)
+from dbt_mcp.discovery.lineage import (
+    LINEAGE_SCOPE,
+    LINEAGE_SCOPE_NOTE,
+    LineageDirection,
+    ModelLineage,
+)
 from dbt_mcp.prompts.prompts import get_prompt
 from dbt_mcp.tools.annotations import create_tool_annotations
 from dbt_mcp.tools.definitions import ToolDefinition
@@ -22,51 +34,192 @@ def create_discovery_tool_definitions(config: DiscoveryConfig) -> list[ToolDefin
     models_fetcher = ModelsFetcher(
         api_client=api_client, environment_id=config.environment_id
     )
+    model_catalog = ModelCatalog(
+        models_fetcher=models_fetcher,
+        ttl_seconds=config.catalog_ttl_seconds,
+        max_age_seconds=config.catalog_max_age_seconds,
+    )
+    model_lineage = ModelLineage(
+        models_fetcher=models_fetcher, ttl_seconds=config.catalog_ttl_seconds
+    )
 
-    def get_mart_models() -> list[dict] | str:
+    async def get_mart_models() -> list[dict] | str:
         try:
-            mart_models = models_fetcher.fetch_models(
+            mart_models = await model_catalog.get_models(
                 model_filter={"modelingLayer": "marts"}
             )
             return [m for m in mart_models if m["name"] != "metricflow_time_spine"]
         except Exception as e:
             return str(e)
 
-    def get_all_models() -> list[dict] | str:
+    async def get_all_models() -> list[dict] | str:
         try:
-            return models_fetcher.fetch_models()
+            return await model_catalog.get_models()
         except Exception as e:
             return str(e)
 
-    def get_model_details(
-        model_name: str | None = None, unique_id: str | None = None
+    async def get_model_details(
+        model_name: str | None = None,
+        unique_id: str | None = None,
+        model_names: list[str] | None = None,
+        unique_ids: list[str] | None = None,
     ) -> dict | str:
         try:
-            return models_fetcher.fetch_model_details(model_name, unique_id)
+            if model_names or unique_ids:
+                return await models_fetcher.fetch_model_details_batch(
+                    model_names, unique_ids
+                )
+            return await models_fetcher.fetch_model_details(model_name, unique_id)
         except Exception as e:
             return str(e)
 
-    def get_model_parents(
-        model_name: str | None = None, unique_id: str | None = None
-    ) -> list[dict] | str:
+    async def get_related_models_batch(
+        relation: Literal["parents", "children"],
+        model_names: list[str] | None,
+        unique_ids: list[str] | None,
+    ) -> dict[str, list[dict]]:
+        """The parents or children of each model, from the lineage graph once
+        it's loaded and otherwise in batched requests."""
+        graph = model_lineage.get_graph_nowait()
+        references = [(n, None) for n in model_names or []] + [
+            (None, u) for u in unique_ids or []
+        ]
+        related: dict[str, list[dict]] = {}
+        missing_names = []
+        missing_unique_ids = []
+        for model_name, unique_id in references:
+            reference = str(unique_id or model_name)
+            node = graph.find_model(model_name, unique_id) if graph else None
+            if graph and node is not None:
+                related[reference] = (
+                    graph.get_parents(node)
+                    if relation == "parents"
+                    else graph.get_children(node)
+                )
+            elif unique_id:
+                missing_unique_ids.append(unique_id)
+            elif model_name:
+                missing_names.append(model_name)
+        if missing_names or missing_unique_ids:
+            fetch = (
+                models_fetcher.fetch_model_parents_batch
+                if relation == "parents"
+                else models_fetcher.fetch_model_children_batch
+            )
+            related.update(await fetch(missing_names, missing_unique_ids))
+        return {r: related[r] for r in [*(model_names or []), *(unique_ids or [])]}
+
+    async def get_model_parents(
+        model_name: str | None = None,
+        unique_id: str | None = None,
+        model_names: list[str] | None = None,
+        unique_ids: list[str] | None = None,
+    ) -> list[dict] | dict[str, list[dict]] | str:
         try:
-            return models_fetcher.fetch_model_parents(model_name, unique_id)
+            if model_names or unique_ids:
+                return await get_related_models_batch(
+                    "parents", model_names, unique_ids
+                )
+            # Answered from the lineage graph once it's loaded
+            graph = model_lineage.get_graph_nowait()
+            node = graph.find_model(model_name, unique_id) if graph else None
+            if graph and node is not None:
+                return graph.get_parents(node)
+            return await models_fetcher.fetch_model_parents(model_name, unique_id)
         except Exception as e:
             return str(e)
 
-    def get_model_children(
-        model_name: str | None = None, unique_id: str | None = None
-    ) -> list[dict] | str:
+    async def get_model_children(
+        model_name: str | None = None,
+        unique_id: str | None = None,
+        model_names: list[str] | None = None,
+        unique_ids: list[str] | None = None,
+    ) -> list[dict] | dict[str, list[dict]] | str:
         try:
-            return models_fetcher.fetch_model_children(model_name, unique_id)
+            if model_names or unique_ids:
+                return await get_related_models_batch(
+                    "children", model_names, unique_ids
+                )
+            graph = model_lineage.get_graph_nowait()
+            node = graph.find_model(model_name, unique_id) if graph else None
+            if graph and node is not None:
+                return graph.get_children(node)
+            return await models_fetcher.fetch_model_children(model_name, unique_id)
         except Exception as e:
             return str(e)
 
-    def get_model_health(
-        model_name: str | None = None, unique_id: str | None = None
-    ) -> list[dict] | str:
+    async def get_model_profile(
+        model_name: str | None = None,
+        unique_id: str | None = None,
+        sections: list[ModelProfileSection] | None = None,
+    ) -> dict | str:
+        try:
+            return await models_fetcher.fetch_model_profile(
+                model_name, unique_id, sections
+            )
+        except Exception as e:
+            return str(e)
+
+    async def get_model_lineage(
+        model_name: str | None = None,
+        unique_id: str | None = None,
+        direction: LineageDirection = "descendants",
+        depth: int | None = None,
+        resource_types: list[str] | None = None,
+    ) -> dict | str:
         try:
-            return models_fetcher.fetch_model_health(model_name, unique_id)
+            graph = await model_lineage.get_graph()
+            node = graph.find_model(model_name, unique_id)
+            if node is None:
+                return f"Model {unique_id or model_name} not found."
+            return {
+                "scope": LINEAGE_SCOPE,
+                "scopeNote": LINEAGE_SCOPE_NOTE,
+                "nodes": graph.traverse(node, direction, depth, resource_types),
+            }
+        except Exception as e:
+            return str(e)
+
+    async def get_downstream_impact(
+        model_names: list[str] | None = None,
+        unique_ids: list[str] | None = None,
+    ) -> dict | str:
+        try:
+            graph = await model_lineage.get_graph()
+            references = [(n, None) for n in model_names or []] + [
+                (None, u) for u in unique_ids or []
+            ]
+            if not references:
+                return "Either model_names or unique_ids must be provided"
+            node_ids = []
+            missing = []
+            for model_name, unique_id in references:
+                node = graph.find_model(model_name, unique_id)
+                if node is None:
+                    missing.append(unique_id or model_name)
+                else:
+                    node_ids.append(node)
+            if missing:
+                return f"Models not found: {', '.join(str(m) for m in missing)}"
+            return {
+                "scope": LINEAGE_SCOPE,
+                "scopeNote": LINEAGE_SCOPE_NOTE,
+            } | graph.get_downstream_impact(node_ids)
+        except Exception as e:
+            return str(e)
+
+    async def get_model_health(
+        model_name: str | None = None,
+        unique_id: str | None = None,
+        model_names: list[str] | None = None,
+        unique_ids: list[str] | None = None,
+    ) -> list[dict] | dict | str:
+        try:
+            if model_names or unique_ids:
+                return await models_fetcher.fetch_model_health_batch(
+                    model_names, unique_ids
+                )
+            return await models_fetcher.fetch_model_health(model_name, unique_id)
         except Exception as e:
             return str(e)
 
@@ -121,6 +274,36 @@ def create_discovery_tool_definitions(config: DiscoveryConfig) -> list[ToolDefin
                 idempotent_hint=True,
             ),
         ),
+        ToolDefinition(
+            description=get_prompt("discovery/get_model_profile"),
+            fn=get_model_profile,
+            annotations=create_tool_annotations(
+                title="Get Model Profile",
+                read_only_hint=True,
+                destructive_hint=False,
+                idempotent_hint=True,
+            ),
+        ),
+        ToolDefinition(
+            description=get_prompt("discovery/get_model_lineage"),
+            fn=get_model_lineage,
+            annotations=create_tool_annotations(
+                title="Get Model Lineage",
+                read_only_hint=True,
+                destructive_hint=False,
+                idempotent_hint=True,
+            ),
+        ),
+        ToolDefinition(
+            description=get_prompt("discovery/get_downstream_impact"),
+            fn=get_downstream_impact,
+            annotations=create_tool_annotations(
+                title="Get Downstream Impact",
+                read_only_hint=True,
+                destructive_hint=False,
+                idempotent_hint=True,
+            ),
+        ),
         ToolDefinition(
             description=get_prompt("discovery/get_model_health"),
             fn=get_model_health,
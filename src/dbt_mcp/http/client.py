@@ -0,0 +1,56 @@
+import logging
+from typing import ClassVar
+
+import httpx
+
+from dbt_mcp.config.config import HttpClientConfig
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClientManager:
+    """Owns the pooled async HTTP clients used by the Discovery, Semantic Layer
+    and Admin API clients.
+
+    There is one client per upstream host, so connection limits apply per host
+    and connections are kept alive and reused across tool calls. HTTP/2 is
+    negotiated with hosts that support it.
+    """
+
+    _config = HttpClientConfig()
+    _clients: ClassVar[dict[str, httpx.AsyncClient]] = {}
+
+    @classmethod
+    def configure(cls, config: HttpClientConfig) -> None:
+        cls._config = config
+
+    @classmethod
+    def get_client(cls, url: str | httpx.URL) -> httpx.AsyncClient:
+        url = httpx.URL(url)
+        origin = f"{url.scheme}://{url.netloc.decode('ascii')}"
+        client = cls._clients.get(origin)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=cls._config.http2,
+                # Like requests, e.g. to the signed URLs of run artifacts
+                follow_redirects=True,
+                timeout=httpx.Timeout(
+                    cls._config.timeout, connect=cls._config.connect_timeout
+                ),
+                limits=httpx.Limits(
+                    max_connections=cls._config.max_connections,
+                    max_keepalive_connections=cls._config.max_keepalive_connections,
+                    keepalive_expiry=cls._config.keepalive_expiry,
+                ),
+            )
+            cls._clients[origin] = client
+        return client
+
+    @classmethod
+    async def close(cls) -> None:
+        clients, cls._clients = cls._clients, {}
+        for origin, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception:
+                logger.exception(f"Error closing HTTP client for {origin}")
@@ -1,47 +1,100 @@
+import asyncio
+import contextlib
+import functools
+import inspect
 import logging
 import time
-from collections.abc import AsyncIterator, Sequence
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
 from contextlib import (
     asynccontextmanager,
 )
-from typing import Any
+from typing import Any, get_args
 
 from dbtlabs_vortex.producer import shutdown
 from mcp.server.fastmcp import FastMCP
 from mcp.types import (
     ContentBlock,
     TextContent,
+    ToolAnnotations,
 )
 
 from dbt_mcp.config.config import Config
 from dbt_mcp.dbt_admin.tools import register_admin_api_tools
 from dbt_mcp.dbt_cli.tools import register_dbt_cli_tools
 from dbt_mcp.discovery.tools import register_discovery_tools
+from dbt_mcp.http.client import HttpClientManager
+from dbt_mcp.semantic_layer.session_pool import SemanticLayerSessionPool
+from dbt_mcp.semantic_layer.sql_cache import CompiledSqlCache
 from dbt_mcp.semantic_layer.tools import register_sl_tools
 from dbt_mcp.sql.tools import SqlToolsManager, register_sql_tools
+from dbt_mcp.tools.cache import ToolCache, get_cache_key
+from dbt_mcp.tools.executor import ToolExecutor
+from dbt_mcp.tools.single_flight import SingleFlight
+from dbt_mcp.tools.toolsets import get_toolset
 from dbt_mcp.tracking.tracking import UsageTracker
 
 logger = logging.getLogger(__name__)
 
 
+# Under the streamable HTTP transport the lifespan is entered once per session,
+# so shared resources are only released when the last session ends.
+_active_lifespans = 0
+
+
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    global _active_lifespans
     logger.info("Starting MCP server")
+    if isinstance(server, DbtMCP) and _active_lifespans == 0:
+        HttpClientManager.configure(server.config.http_client_config)
+        # The previous lifespan, if any, shut the executor down
+        server.tool_executor.reopen()
+        server.start_stats_logging()
+    _active_lifespans += 1
     try:
         yield
     except Exception as e:
         logger.error(f"Error in MCP server: {e}")
         raise e
     finally:
-        logger.info("Shutting down MCP server")
+        _active_lifespans -= 1
+        if _active_lifespans == 0:
+            await _shutdown(server)
+
+
+async def _shutdown(server: FastMCP) -> None:
+    logger.info("Shutting down MCP server")
+    try:
+        await SqlToolsManager.close()
+    except Exception:
+        logger.exception("Error closing SQL tools manager")
+    try:
+        await HttpClientManager.close()
+    except Exception:
+        logger.exception("Error closing HTTP clients")
+    try:
+        # Closing sessions may block on the network
+        await asyncio.to_thread(SemanticLayerSessionPool.close_all)
+    except Exception:
+        logger.exception("Error closing Semantic Layer sessions")
+    try:
+        await asyncio.to_thread(CompiledSqlCache.close_all)
+    except Exception:
+        logger.exception("Error closing compiled SQL caches")
+    if isinstance(server, DbtMCP):
         try:
-            await SqlToolsManager.close()
+            await server.stop_stats_logging()
+            server.log_stats()
         except Exception:
-            logger.exception("Error closing SQL tools manager")
+            logger.exception("Error logging tool stats")
         try:
-            shutdown()
+            server.tool_executor.shutdown()
         except Exception:
-            logger.exception("Error shutting down MCP server")
+            logger.exception("Error shutting down tool executor")
+    try:
+        shutdown()
+    except Exception:
+        logger.exception("Error shutting down MCP server")
 
 
 class DbtMCP(FastMCP):
@@ -52,10 +105,110 @@ class DbtMCP(FastMCP):
         *args: Any,
         **kwargs: Any,
     ) -> None:
+        self.tool_executor = ToolExecutor(config.tool_execution_config)
+        self.tool_cache = ToolCache(config.tool_cache_config)
+        self.in_flight_calls = SingleFlight()
+        self._stats_task: asyncio.Task[None] | None = None
         super().__init__(*args, **kwargs)
         self.usage_tracker = usage_tracker
         self.config = config
 
+    def log_stats(self) -> None:
+        """Logs the counters of the tool executor, tool cache and in-flight
+        calls."""
+        for pool, pool_stats in self.tool_executor.get_stats().items():
+            logger.debug(f"Tool executor {pool} pool: {pool_stats}")
+        logger.debug(f"Tool cache: {self.tool_cache.get_stats()}")
+        logger.debug(f"In-flight tool calls: {self.in_flight_calls.get_stats()}")
+
+    def start_stats_logging(self) -> None:
+        interval = self.config.tool_execution_config.stats_log_interval_seconds
+        if interval > 0 and self._stats_task is None:
+            self._stats_task = asyncio.create_task(self._log_stats_every(interval))
+
+    async def stop_stats_logging(self) -> None:
+        task, self._stats_task = self._stats_task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _log_stats_every(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.log_stats()
+
+    def add_tool(
+        self,
+        fn: Callable[..., Any],
+        name: str | None = None,
+        title: str | None = None,
+        description: str | None = None,
+        annotations: ToolAnnotations | None = None,
+        structured_output: bool | None = None,
+    ) -> None:
+        tool_name = name or fn.__name__
+        if not inspect.iscoroutinefunction(fn):
+            fn = self._run_in_tool_executor(fn, tool_name)
+        if _is_read_only(annotations):
+            fn = self._share_results(fn, tool_name)
+        super().add_tool(
+            fn,
+            name=name,
+            title=title,
+            description=description,
+            annotations=annotations,
+            structured_output=structured_output,
+        )
+
+    def _run_in_tool_executor(
+        self, fn: Callable[..., Any], tool_name: str
+    ) -> Callable[..., Any]:
+        """Wraps a sync tool so that it runs on its toolset's thread pool
+        instead of blocking the event loop."""
+        toolset = get_toolset(tool_name)
+
+        @functools.wraps(fn)
+        async def run_tool(*args: Any, **kwargs: Any) -> Any:
+            return await self.tool_executor.run(
+                toolset, functools.partial(fn, *args, **kwargs)
+            )
+
+        return run_tool
+
+    def _share_results(
+        self, fn: Callable[..., Awaitable[Any]], tool_name: str
+    ) -> Callable[..., Awaitable[Any]]:
+        """Wraps a read-only, idempotent tool so that concurrent calls with the
+        same arguments share one execution, and repeated calls are served from
+        the tool cache."""
+        ttl_seconds = (
+            self.tool_cache.get_ttl(get_toolset(tool_name))
+            if _has_distinguishable_errors(fn)
+            else 0
+        )
+
+        async def call_and_cache(key: str, kwargs: dict[str, Any]) -> Any:
+            result = await fn(**kwargs)
+            # Tools report errors as strings, which we don't want to cache
+            if ttl_seconds > 0 and not isinstance(result, str):
+                self.tool_cache.set(key, result, ttl_seconds)
+            return result
+
+        @functools.wraps(fn)
+        async def run_tool(**kwargs: Any) -> Any:
+            key = get_cache_key(tool_name, kwargs)
+            if ttl_seconds > 0:
+                hit, result = self.tool_cache.get(key)
+                if hit:
+                    logger.debug(f"Tool cache hit for {tool_name}")
+                    return result
+            return await self.in_flight_calls.run(
+                key, functools.partial(call_and_cache, key, kwargs)
+            )
+
+        return run_tool
+
     async def call_tool(
         self, name: str, arguments: dict[str, Any]
     ) -> Sequence[ContentBlock] | dict[str, Any]:
@@ -100,6 +253,17 @@ class DbtMCP(FastMCP):
         return result
 
 
+def _is_read_only(annotations: ToolAnnotations | None) -> bool:
+    return bool(annotations and annotations.readOnlyHint and annotations.idempotentHint)
+
+
+def _has_distinguishable_errors(fn: Callable[..., Any]) -> bool:
+    """Whether a tool's results can be told apart from the error messages it
+    returns, which is required for caching them."""
+    return_types = get_args(inspect.signature(fn).return_annotation)
+    return str in return_types and len(return_types) > 1
+
+
 async def create_dbt_mcp(config: Config):
     dbt_mcp = DbtMCP(
         config=config,
@@ -110,7 +274,12 @@ async def create_dbt_mcp(config: Config):
 
     if config.semantic_layer_config:
         logger.info("Registering semantic layer tools")
-        register_sl_tools(dbt_mcp, config.semantic_layer_config, config.disable_tools)
+        register_sl_tools(
+            dbt_mcp,
+            config.semantic_layer_config,
+            config.disable_tools,
+            tool_executor=dbt_mcp.tool_executor,
+        )
 
     if config.discovery_config:
         logger.info("Registering discovery tools")
@@ -0,0 +1,115 @@
+import logging
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+
+class ResultBudgetExceededError(Exception):
+    """Raised when a result doesn't fit in the budget of a single call."""
+
+    pass
+
+
+@dataclass
+class BoundedTable:
+    table: pa.Table
+    # True if the rows past the budget were dropped
+    truncated: bool = False
+
+
+@dataclass
+class ResultBudgetStats:
+    results: int = 0
+    truncated: int = 0
+    aborted: int = 0
+    # The most memory held by the batches of a single result
+    peak_bytes: int = 0
+
+
+class ResultBudget:
+    """Reads results batch by batch, holding at most `max_rows` rows and
+    `max_bytes` bytes of each result.
+
+    Once a result exceeds either, reading stops so that the rest of it is
+    never fetched. The result is then either truncated to the rows that fit,
+    if `truncate` is set, or rejected with a `ResultBudgetExceededError`.
+    """
+
+    def __init__(self, max_bytes: int, max_rows: int, truncate: bool = False):
+        self.max_bytes = max_bytes
+        self.max_rows = max_rows
+        self.truncate = truncate
+        # Results are read from the worker threads that run the queries
+        self._lock = threading.Lock()
+        self._stats = ResultBudgetStats()
+
+    def read(
+        self, schema: pa.Schema, batches: Iterable[pa.RecordBatch]
+    ) -> BoundedTable:
+        kept: list[pa.RecordBatch] = []
+        rows = 0
+        nbytes = 0
+        # Each batch is held while deciding whether to keep it
+        peak_bytes = 0
+        truncated = False
+        for batch in batches:
+            peak_bytes = max(peak_bytes, nbytes + batch.nbytes)
+            if (
+                rows + batch.num_rows <= self.max_rows
+                and nbytes + batch.nbytes <= self.max_bytes
+            ):
+                kept.append(batch)
+                rows += batch.num_rows
+                nbytes += batch.nbytes
+                continue
+            if not self.truncate:
+                self._record(peak_bytes, truncated=False, aborted=True)
+                logger.warning(
+                    f"Aborted reading a result over the budget after {rows} rows, "
+                    + f"with a peak of {peak_bytes} bytes"
+                )
+                raise ResultBudgetExceededError(
+                    f"The result has more than {self.max_rows} rows or takes more "
+                    + f"than {self.max_bytes} bytes. Add a limit or a filter, "
+                    + "or group by fewer dimensions."
+                )
+            # Keep the rows of this batch that fit, assuming rows of even size
+            bytes_per_row = batch.nbytes / max(1, batch.num_rows)
+            fitting_rows = self.max_rows - rows
+            if bytes_per_row:
+                fitting_rows = min(
+                    fitting_rows, int((self.max_bytes - nbytes) / bytes_per_row)
+                )
+            if fitting_rows > 0:
+                kept.append(batch.slice(0, fitting_rows))
+                rows += fitting_rows
+            truncated = True
+            break
+        self._record(peak_bytes, truncated=truncated, aborted=False)
+        logger.info(
+            f"Read result of {rows} rows with a peak of {peak_bytes} bytes"
+            + (", truncated to fit the result budget" if truncated else "")
+        )
+        return BoundedTable(
+            table=pa.Table.from_batches(kept, schema=schema), truncated=truncated
+        )
+
+    def get_stats(self) -> ResultBudgetStats:
+        with self._lock:
+            return ResultBudgetStats(
+                results=self._stats.results,
+                truncated=self._stats.truncated,
+                aborted=self._stats.aborted,
+                peak_bytes=self._stats.peak_bytes,
+            )
+
+    def _record(self, peak_bytes: int, truncated: bool, aborted: bool) -> None:
+        with self._lock:
+            self._stats.results += 1
+            self._stats.truncated += truncated
+            self._stats.aborted += aborted
+            self._stats.peak_bytes = max(self._stats.peak_bytes, peak_bytes)
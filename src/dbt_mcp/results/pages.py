@@ -0,0 +1,144 @@
+import json
+import logging
+import threading
+import uuid
+from dataclasses import dataclass
+
+import pyarrow as pa
+
+from dbt_mcp.cache.lru import CacheStats, LRUCache
+from dbt_mcp.results.serialization import ResultFormat, is_json, serialize_table
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the number of results held at once, independent of their size
+MAX_RESULTS = 256
+
+
+class ResultPageError(Exception):
+    """Raised when a page token is malformed or its result has expired."""
+
+    pass
+
+
+@dataclass
+class ResultPage:
+    # The rows in this page, serialized in `result_format`
+    rows: str
+    result_format: ResultFormat
+    total_rows: int
+    next_page_token: str | None = None
+    # True if rows of the result were dropped, because it was too large to
+    # read in full or to keep for later pages
+    truncated: bool = False
+
+    def to_json(self) -> str:
+        # JSON rows are already serialized, so they're spliced in as-is
+        rows = self.rows if is_json(self.result_format) else json.dumps(self.rows)
+        return (
+            f'{{"rows":{rows},"total_rows":{self.total_rows},'
+            + f'"next_page_token":{json.dumps(self.next_page_token)}'
+            + (',"truncated":true}' if self.truncated else "}")
+        )
+
+
+@dataclass
+class _StoredResult:
+    table: pa.Table
+    result_format: ResultFormat
+    # True if the table only holds the first rows of the result
+    truncated: bool = False
+
+
+class ResultPageStore:
+    """Keeps query results in memory under short-lived handles so that they
+    can be read page by page.
+
+    Results are evicted once they are older than `max_age_seconds`, and the
+    least recently read results are evicted when all held results together
+    exceed `max_bytes`.
+    """
+
+    def __init__(self, max_age_seconds: float, max_bytes: int):
+        self._results: LRUCache[str, _StoredResult] = LRUCache(
+            max_entries=MAX_RESULTS,
+            ttl_seconds=max_age_seconds,
+            max_bytes=max_bytes,
+            size_of=lambda result: result.table.nbytes,
+        )
+        # Pages are read from the worker threads that run the queries
+        self._lock = threading.Lock()
+
+    def first_page(
+        self,
+        table: pa.Table,
+        page_size: int,
+        result_format: ResultFormat = ResultFormat.JSON,
+        truncated: bool = False,
+    ) -> ResultPage:
+        result = _StoredResult(
+            table=table, result_format=result_format, truncated=truncated
+        )
+        if table.num_rows <= page_size:
+            return _get_page("", result, offset=0, page_size=page_size)
+        result_id = uuid.uuid4().hex
+        with self._lock:
+            self._results.set(result_id, result)
+            is_stored = self._results.get(result_id)[0]
+        if not is_stored:
+            logger.warning(
+                f"Result of {table.nbytes} bytes is too large to page through, "
+                + "returning the first page only"
+            )
+            return ResultPage(
+                rows=serialize_table(table.slice(0, page_size), result_format),
+                result_format=result_format,
+                total_rows=table.num_rows,
+                truncated=True,
+            )
+        return _get_page(result_id, result, offset=0, page_size=page_size)
+
+    def get_page(self, page_token: str) -> ResultPage:
+        result_id, offset, page_size = _parse_page_token(page_token)
+        with self._lock:
+            is_stored, result = self._results.get(result_id)
+        if not is_stored or result is None:
+            raise ResultPageError(
+                "This result has expired. Please run the query again."
+            )
+        if offset >= result.table.num_rows:
+            raise ResultPageError(f"Invalid page token: {page_token}")
+        return _get_page(result_id, result, offset=offset, page_size=page_size)
+
+    def get_stats(self) -> CacheStats:
+        with self._lock:
+            return self._results.get_stats()
+
+
+def _get_page(
+    result_id: str, result: _StoredResult, offset: int, page_size: int
+) -> ResultPage:
+    table = result.table
+    next_offset = offset + page_size
+    next_page_token = (
+        f"{result_id}:{next_offset}:{page_size}"
+        if next_offset < table.num_rows
+        else None
+    )
+    return ResultPage(
+        rows=serialize_table(table.slice(offset, page_size), result.result_format),
+        result_format=result.result_format,
+        total_rows=table.num_rows,
+        next_page_token=next_page_token,
+        truncated=result.truncated,
+    )
+
+
+def _parse_page_token(page_token: str) -> tuple[str, int, int]:
+    try:
+        result_id, offset, page_size = page_token.split(":")
+        if int(offset) < 0 or int(page_size) < 1:
+            raise ValueError
+        return result_id, int(offset), int(page_size)
+    except ValueError as e:
+        raise ResultPageError(f"Invalid page token: {page_token}") from e
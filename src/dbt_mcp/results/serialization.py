@@ -0,0 +1,164 @@
+import base64
+import io
+import json
+from enum import Enum
+from typing import Any, cast
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.ipc as pa_ipc
+
+# Rows written to JSON at a time
+BATCH_ROWS = 65_536
+
+
+class ResultFormat(Enum):
+    # A JSON array with one object per row
+    JSON = "json"
+    # A JSON object with the column names and one array of values per column
+    COLUMNAR = "columnar"
+    CSV = "csv"
+    # A base64 encoded Arrow IPC stream, for programmatic clients
+    ARROW = "arrow"
+
+
+def serialize_table(table: pa.Table, result_format: ResultFormat) -> str:
+    """Serializes an Arrow table batch by batch, without going through pandas."""
+    match result_format:
+        case ResultFormat.JSON:
+            return to_json_records(table)
+        case ResultFormat.COLUMNAR:
+            return to_json_columns(table)
+        case ResultFormat.CSV:
+            return to_csv(table)
+        case ResultFormat.ARROW:
+            return to_arrow_ipc(table)
+
+
+def is_json(result_format: ResultFormat) -> bool:
+    return result_format in (ResultFormat.JSON, ResultFormat.COLUMNAR)
+
+
+def to_json_records(table: pa.Table) -> str:
+    """Writes compact records-oriented JSON.
+
+    Rows are assembled with Arrow compute kernels one batch at a time, so
+    values are never converted to Python objects. Dates and timestamps are
+    written as ISO 8601 strings (e.g. `2024-01-01 12:30:00`), NaN and
+    infinity as null.
+    """
+    out = io.StringIO()
+    out.write("[")
+    is_first = True
+    for batch in table.to_batches(max_chunksize=BATCH_ROWS):
+        if batch.num_rows == 0:
+            continue
+        if not is_first:
+            out.write(",")
+        out.write(_to_json_rows(batch))
+        is_first = False
+    out.write("]")
+    return out.getvalue()
+
+
+def to_json_columns(table: pa.Table) -> str:
+    """Writes compact column-oriented JSON, e.g.
+    `{"columns":["status","orders"],"data":[["completed","returned"],[3,1]]}`.
+
+    Column names are written once instead of once per row. Values are
+    encoded like `to_json_records` does.
+    """
+    out = io.StringIO()
+    out.write('{"columns":')
+    out.write(json.dumps(table.schema.names, separators=(",", ":"), ensure_ascii=False))
+    out.write(',"data":[')
+    for i, column in enumerate(table.columns):
+        if i > 0:
+            out.write(",")
+        out.write("[")
+        is_first = True
+        for chunk in column.chunks:
+            if len(chunk) == 0:
+                continue
+            if not is_first:
+                out.write(",")
+            out.write(_join(_to_json_values(chunk), ","))
+            is_first = False
+        out.write("]")
+    out.write("]}")
+    return out.getvalue()
+
+
+def to_csv(table: pa.Table) -> str:
+    out = io.BytesIO()
+    pa_csv.write_csv(table, out)
+    return out.getvalue().decode("utf-8")
+
+
+def to_arrow_ipc(table: pa.Table) -> str:
+    """Writes the table as a base64 encoded Arrow IPC stream, which keeps
+    the exact column types. It can be read back with
+    `pyarrow.ipc.open_stream(base64.b64decode(result)).read_all()`."""
+    sink = pa.BufferOutputStream()
+    with pa_ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=BATCH_ROWS)
+    return base64.b64encode(sink.getvalue().to_pybytes()).decode("ascii")
+
+
+def _to_json_rows(batch: pa.RecordBatch) -> str:
+    if batch.num_columns == 0:
+        return ",".join(["{}"] * batch.num_rows)
+    parts: list[Any] = []
+    for i, (name, column) in enumerate(
+        zip(batch.schema.names, batch.columns, strict=True)
+    ):
+        parts.append(("{" if i == 0 else ",") + json.dumps(name) + ":")
+        parts.append(_to_json_values(column))
+    parts.append("}")
+    return _join(pc.binary_join_element_wise(*parts, ""), ",")
+
+
+def _join(values: pa.Array, separator: str) -> str:
+    # Joins all values in one call instead of one Python string each
+    values_list = pa.ListArray.from_arrays([0, len(values)], values)
+    return cast(pa.StringArray, pc.binary_join(values_list, separator))[0].as_py()
+
+
+def _to_json_values(column: pa.Array) -> pa.Array:
+    """Encodes every value of a column as a JSON string."""
+    column_type = column.type
+    if pa.types.is_dictionary(column_type):
+        return _to_json_values(cast(pa.DictionaryArray, column).dictionary_decode())
+    if pa.types.is_floating(column_type):
+        column = pc.if_else(pc.is_finite(column), column, None)
+        values = pc.cast(column, pa.string())
+    elif (
+        pa.types.is_integer(column_type)
+        or pa.types.is_boolean(column_type)
+        or pa.types.is_decimal(column_type)
+    ):
+        values = pc.cast(column, pa.string())
+    elif pa.types.is_temporal(column_type) and not pa.types.is_duration(column_type):
+        values = _quote(pc.cast(column, pa.string()))
+    elif (
+        pa.types.is_string(column_type) or pa.types.is_large_string(column_type)
+    ) and not pc.any(pc.match_substring_regex(column, "[\\x00-\\x1f]")).as_py():
+        values = _quote(
+            pc.replace_substring(pc.replace_substring(column, "\\", "\\\\"), '"', '\\"')
+        )
+    else:
+        # Nested and binary values, and strings with control characters
+        return pa.array(
+            [
+                json.dumps(v, separators=(",", ":"), ensure_ascii=False, default=str)
+                for v in column.to_pylist()
+            ],
+            pa.string(),
+        )
+    return values.fill_null("null")
+
+
+def _quote(values: pa.Array) -> pa.Array:
+    quote: Any = '"'
+    return pc.binary_join_element_wise(quote, values, quote, "")
@@ -1,32 +1,136 @@
+import asyncio
+import functools
+import json
+import logging
+from collections.abc import Awaitable, Callable
 from contextlib import AbstractContextManager
-from functools import cache
-from typing import Any, Protocol
+from dataclasses import dataclass
+from typing import Any, Protocol, TypeVar
 
+import httpx
 import pyarrow as pa
+import pyarrow.compute as pc
 from dbtsl.api.shared.query_params import (
     GroupByParam,
+    GroupByType,
     OrderByGroupBy,
     OrderByMetric,
     OrderBySpec,
 )
 from dbtsl.error import QueryFailedError
 
+from dbt_mcp.cache.lru import LRUCache
+from dbt_mcp.cache.refreshing import RefreshingValue
 from dbt_mcp.config.config import SemanticLayerConfig
+from dbt_mcp.results.budget import (
+    BoundedTable,
+    ResultBudget,
+    ResultBudgetExceededError,
+)
+from dbt_mcp.results.pages import ResultPage, ResultPageError, ResultPageStore
+from dbt_mcp.results.serialization import ResultFormat, serialize_table
 from dbt_mcp.semantic_layer.gql.gql import GRAPHQL_QUERIES
 from dbt_mcp.semantic_layer.gql.gql_request import submit_request
-from dbt_mcp.semantic_layer.levenshtein import get_misspellings
+from dbt_mcp.semantic_layer.manifest import (
+    SemanticManifest,
+    intersect_dimensions,
+    intersect_entities,
+    parse_dimensions,
+    parse_entities,
+)
+from dbt_mcp.semantic_layer.rollup import CachedQueryResult, order_columns, roll_up
+from dbt_mcp.semantic_layer.session_pool import SemanticLayerSessionPool
+from dbt_mcp.semantic_layer.sql_cache import CompiledSqlCache
+from dbt_mcp.semantic_layer.streaming import stream_dimension_values, stream_query
 from dbt_mcp.semantic_layer.types import (
     DimensionToolResponse,
+    DimensionValuesToolResponse,
     EntityToolResponse,
     GetMetricsCompiledSqlError,
     GetMetricsCompiledSqlResult,
     GetMetricsCompiledSqlSuccess,
+    MetricQuery,
     MetricToolResponse,
     OrderByParam,
     QueryMetricsError,
     QueryMetricsResult,
     QueryMetricsSuccess,
 )
+from dbt_mcp.tools.executor import ToolExecutor
+from dbt_mcp.tools.toolsets import Toolset
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Upper bound on the number of cached query results, independent of their size
+RESULT_CACHE_MAX_ENTRIES = 256
+
+# Upper bound on the number of queries in a batch, so that a batch fits in the
+# workers and queue of the semantic layer tool pool with the default limits
+MAX_BATCH_QUERIES = 20
+
+# Upper bound on the size of the cached values of all dimensions together
+DIMENSION_VALUES_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Values of a dimension larger than this aren't cached, so that a single
+# high-cardinality dimension can't evict all the others
+DIMENSION_VALUES_MAX_CACHED_BYTES = 8 * 1024 * 1024
+
+
+@dataclass
+class _DimensionValues:
+    # Distinct and sorted
+    values: pa.Array
+    # True if only the values that fit in the result budget were read
+    truncated: bool = False
+
+
+def _filter_dimension_values(
+    dimension_values: _DimensionValues, prefix: str | None, limit: int
+) -> DimensionValuesToolResponse:
+    values = dimension_values.values
+    if prefix:
+        matches = pc.starts_with(
+            pc.utf8_lower(values.cast(pa.string())), pattern=prefix.lower()
+        )
+        values = values.filter(matches)
+    return DimensionValuesToolResponse(
+        values=values.slice(0, limit).to_pylist(),
+        has_more=len(values) > limit or dimension_values.truncated,
+        truncated=dimension_values.truncated,
+    )
+
+
+def _get_query_cache_key(
+    metrics: list[str],
+    group_by: list[GroupByParam] | None,
+    order_by: list[OrderByParam] | None,
+    where: str | None,
+    limit: int | None,
+    keep_column_order: bool = False,
+) -> str:
+    """Builds a key that is the same for queries that return the same rows.
+
+    Unless `keep_column_order` is set, metrics and group bys are sorted
+    because their order only changes the order of the columns, which results
+    served from the cache are reordered to match. The order of the order bys
+    is kept.
+    """
+    group_by_keys = [
+        [g.name, str(g.type), g.grain.upper() if g.grain else None]
+        for g in group_by or []
+    ]
+    return json.dumps(
+        {
+            "metrics": metrics if keep_column_order else sorted(metrics),
+            "group_by": group_by_keys if keep_column_order else sorted(group_by_keys),
+            "order_by": [[o.name, o.descending] for o in order_by or []],
+            "where": where.strip() if where else None,
+            "limit": limit,
+        },
+        separators=(",", ":"),
+    )
 
 
 class SemanticLayerClientProtocol(Protocol):
@@ -52,81 +156,312 @@ class SemanticLayerClientProtocol(Protocol):
         read_cache: bool = True,
     ) -> str: ...
 
+    def dimension_values(
+        self, metrics: list[str], group_by: str
+    ) -> pa.Table | list[str]: ...
+
 
 class SemanticLayerFetcher:
     def __init__(
         self,
-        sl_client: SemanticLayerClientProtocol,
+        sl_client: SemanticLayerClientProtocol | None,
         config: SemanticLayerConfig,
+        http_client: httpx.AsyncClient | None = None,
+        create_sl_client: Callable[[], SemanticLayerClientProtocol] | None = None,
+        tool_executor: ToolExecutor | None = None,
     ):
+        """Queries run on sessions of clients made by `create_sl_client`, up to
+        `config.max_sessions` at once. Without it, they run one at a time on
+        the session of `sl_client`.
+
+        Blocking work runs on the semantic layer pool of `tool_executor`, so
+        that its limits apply, or on asyncio's default executor without it."""
         self.sl_client = sl_client
         self.config = config
-        self.entities_cache: dict[str, list[EntityToolResponse]] = {}
-        self.dimensions_cache: dict[str, list[DimensionToolResponse]] = {}
+        self.http_client = http_client
+        self.tool_executor = tool_executor
+        # Queries are validated against the manifest without further requests
+        self.metrics_catalog = RefreshingValue(
+            name="semantic manifest",
+            load=self._fetch_semantic_manifest,
+            ttl_seconds=config.catalog_ttl_seconds,
+        )
+        # Dimensions and entities are cached per metric, so that requests
+        # for metric combinations can be answered from the cache.
+        self.dimensions_cache: LRUCache[str, list[DimensionToolResponse]] = LRUCache(
+            max_entries=config.metadata_cache_max_entries,
+            ttl_seconds=config.catalog_ttl_seconds,
+        )
+        self.entities_cache: LRUCache[str, list[EntityToolResponse]] = LRUCache(
+            max_entries=config.metadata_cache_max_entries,
+            ttl_seconds=config.catalog_ttl_seconds,
+        )
+        # Query results are cached by the canonical form of the query, so that
+        # re-running a query doesn't go to the warehouse again.
+        self.result_cache: LRUCache[str, CachedQueryResult] = LRUCache(
+            max_entries=RESULT_CACHE_MAX_ENTRIES,
+            ttl_seconds=config.result_cache_ttl_seconds,
+            max_bytes=config.result_cache_max_bytes,
+            size_of=lambda result: result.table.nbytes,
+        )
+        # The distinct values of a dimension, sorted, by the dimension and the
+        # metrics they were queried with
+        self.dimension_values_cache: LRUCache[str, _DimensionValues] = LRUCache(
+            max_entries=config.metadata_cache_max_entries,
+            ttl_seconds=config.dimension_values_ttl_seconds,
+            max_bytes=DIMENSION_VALUES_CACHE_MAX_BYTES,
+            size_of=lambda values: values.values.nbytes,
+        )
+        self.compiled_sql_cache = CompiledSqlCache(
+            path=config.compiled_sql_cache_path,
+            namespace=f"{config.host}:{config.prod_environment_id}",
+            ttl_seconds=config.compiled_sql_cache_ttl_seconds,
+        )
+        self._manifest_fingerprint: str | None = None
+        self.result_budget = ResultBudget(
+            max_bytes=config.result_budget_max_bytes,
+            max_rows=config.result_budget_max_rows,
+            truncate=config.truncate_results_over_budget,
+        )
+        self.result_pages = ResultPageStore(
+            max_age_seconds=config.result_ttl_seconds,
+            max_bytes=config.result_max_bytes,
+        )
+        if create_sl_client is not None:
+            max_sessions = config.max_sessions
+        elif sl_client is not None:
+            # A client can only have one session open at a time
+            max_sessions = 1
+            single_client = sl_client
+
+            def create_sl_client() -> SemanticLayerClientProtocol:
+                return single_client
 
-    @cache
-    def list_metrics(self) -> list[MetricToolResponse]:
-        metrics_result = submit_request(
+        else:
+            raise ValueError("Either sl_client or create_sl_client is required")
+        self.session_pool: SemanticLayerSessionPool[SemanticLayerClientProtocol] = (
+            SemanticLayerSessionPool(
+                create_client=create_sl_client,
+                max_sessions=max_sessions,
+                idle_timeout_seconds=config.session_idle_timeout_seconds,
+            )
+        )
+        # Calls wait for a session here rather than in a worker thread, so that
+        # they don't tie up threads of the default executor while waiting.
+        self._session_slots = asyncio.Semaphore(max_sessions)
+        self._max_sessions = max_sessions
+
+    async def list_metrics(self) -> list[MetricToolResponse]:
+        return (await self.metrics_catalog.get()).metrics
+
+    async def invalidate_catalog(self) -> None:
+        """Drops all cached semantic layer metadata, e.g. after the
+        semantic manifest changed."""
+        self.metrics_catalog.invalidate()
+        self.dimensions_cache.clear()
+        self.entities_cache.clear()
+        self.result_cache.clear()
+        self.dimension_values_cache.clear()
+        # Writes to the database, which may wait on its lock
+        await self._run_blocking(self.compiled_sql_cache.clear)
+
+    async def _run_blocking(
+        self, fn: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> T:
+        call = functools.partial(fn, *args, **kwargs)
+        if self.tool_executor is None:
+            return await asyncio.to_thread(call)
+        return await self.tool_executor.run(Toolset.SEMANTIC_LAYER, call)
+
+    async def _fetch_semantic_manifest(self) -> SemanticManifest:
+        metrics_result = await submit_request(
             self.config,
             {"query": GRAPHQL_QUERIES["metrics"]},
+            self.http_client,
         )
-        return [
-            MetricToolResponse(
-                name=m.get("name"),
-                type=m.get("type"),
-                label=m.get("label"),
-                description=m.get("description"),
-            )
-            for m in metrics_result["data"]["metrics"]
-        ]
-
-    def get_dimensions(self, metrics: list[str]) -> list[DimensionToolResponse]:
-        metrics_key = ",".join(sorted(metrics))
-        if metrics_key not in self.dimensions_cache:
-            dimensions_result = submit_request(
-                self.config,
-                {
-                    "query": GRAPHQL_QUERIES["dimensions"],
-                    "variables": {"metrics": [{"name": m} for m in metrics]},
-                },
+        manifest = SemanticManifest(metrics_result["data"]["metrics"])
+        if manifest.fingerprint != self._manifest_fingerprint:
+            # SQL compiled against other manifests, e.g. before a restart,
+            # can't be served anymore
+            await self._run_blocking(
+                self.compiled_sql_cache.retain, manifest.fingerprint
             )
-            dimensions = []
-            for d in dimensions_result["data"]["dimensions"]:
-                dimensions.append(
-                    DimensionToolResponse(
-                        name=d.get("name"),
-                        type=d.get("type"),
-                        description=d.get("description"),
-                        label=d.get("label"),
-                        granularities=d.get("queryableGranularities")
-                        + d.get("queryableTimeGranularities"),
-                    )
+            self._manifest_fingerprint = manifest.fingerprint
+        return manifest
+
+    async def get_dimensions(self, metrics: list[str]) -> list[DimensionToolResponse]:
+        return await self._get_metrics_group_bys(
+            metrics=metrics,
+            cache=self.dimensions_cache,
+            fetch=self._fetch_dimensions,
+            select=lambda dimensions, _: dimensions,
+            intersect=intersect_dimensions,
+        )
+
+    async def get_entities(self, metrics: list[str]) -> list[EntityToolResponse]:
+        return await self._get_metrics_group_bys(
+            metrics=metrics,
+            cache=self.entities_cache,
+            fetch=self._fetch_entities,
+            select=lambda _, entities: entities,
+            intersect=intersect_entities,
+        )
+
+    async def _get_metrics_group_bys(
+        self,
+        metrics: list[str],
+        cache: LRUCache[str, list[T]],
+        fetch: Callable[[list[str]], Awaitable[list[T]]],
+        select: Callable[
+            [list[DimensionToolResponse], list[EntityToolResponse]], list[T]
+        ],
+        intersect: Callable[[list[list[T]]], list[T]],
+    ) -> list[T]:
+        """The dimensions and entities that can be queried with several metrics
+        are those shared by all of them, so multi-metric requests are answered
+        by intersecting the per-metric results.
+
+        Metrics that aren't cached yet get both their dimensions and entities
+        in one request, which fills both caches. Requests that include metrics
+        which aren't in the catalog are sent to the server as is, so it can
+        report them."""
+        metrics = list(dict.fromkeys(metrics))
+        if not await self._can_intersect(metrics):
+            return await fetch(metrics)
+
+        per_metric: dict[str, list[T]] = {}
+        for metric in metrics:
+            hit, group_bys = cache.get(metric)
+            if hit and group_bys is not None:
+                per_metric[metric] = group_bys
+        missing = [m for m in metrics if m not in per_metric]
+        fetched = await asyncio.gather(
+            *[self._fetch_dimensions_and_entities([m]) for m in missing]
+        )
+        for metric, (dimensions, entities) in zip(missing, fetched, strict=True):
+            self.dimensions_cache.set(metric, dimensions)
+            self.entities_cache.set(metric, entities)
+            per_metric[metric] = select(dimensions, entities)
+        if len(metrics) == 1:
+            return per_metric[metrics[0]]
+        return intersect([per_metric[m] for m in metrics])
+
+    async def _can_intersect(self, metrics: list[str]) -> bool:
+        if len(metrics) == 1:
+            return True
+        known_metrics = {m.name for m in await self.list_metrics()}
+        return known_metrics.issuperset(metrics)
+
+    async def _fetch_dimensions_and_entities(
+        self, metrics: list[str]
+    ) -> tuple[list[DimensionToolResponse], list[EntityToolResponse]]:
+        result = await submit_request(
+            self.config,
+            {
+                "query": GRAPHQL_QUERIES["dimensions_and_entities"],
+                "variables": {"metrics": [{"name": m} for m in metrics]},
+            },
+            self.http_client,
+        )
+        return parse_dimensions(result["data"]), parse_entities(result["data"])
+
+    async def _fetch_dimensions(
+        self, metrics: list[str]
+    ) -> list[DimensionToolResponse]:
+        dimensions_result = await submit_request(
+            self.config,
+            {
+                "query": GRAPHQL_QUERIES["dimensions"],
+                "variables": {"metrics": [{"name": m} for m in metrics]},
+            },
+            self.http_client,
+        )
+        return parse_dimensions(dimensions_result["data"])
+
+    async def _fetch_entities(self, metrics: list[str]) -> list[EntityToolResponse]:
+        entities_result = await submit_request(
+            self.config,
+            {
+                "query": GRAPHQL_QUERIES["entities"],
+                "variables": {"metrics": [{"name": m} for m in metrics]},
+            },
+            self.http_client,
+        )
+        return parse_entities(entities_result["data"])
+
+    async def get_dimension_values(
+        self,
+        metrics: list[str],
+        dimension: str,
+        prefix: str | None = None,
+        limit: int = 100,
+    ) -> DimensionValuesToolResponse:
+        """Gets the distinct values of a dimension for the given metrics, in
+        order, optionally only those starting with `prefix` (ignoring case)."""
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        validation_error = await self.validate_query_metrics_params(
+            metrics=metrics,
+            group_by=[
+                GroupByParam(name=dimension, type=GroupByType.DIMENSION, grain=None)
+            ],
+        )
+        if validation_error:
+            raise ValueError(validation_error)
+
+        cache_key = json.dumps([dimension, sorted(set(metrics))])
+        _, values = self.dimension_values_cache.get(cache_key)
+        if values is None:
+            # The SDK client is blocking, so we keep it off the event loop
+            async with self._session_slots:
+                values = await self._run_blocking(
+                    self._get_dimension_values, metrics=metrics, dimension=dimension
                 )
-            self.dimensions_cache[metrics_key] = dimensions
-        return self.dimensions_cache[metrics_key]
-
-    def get_entities(self, metrics: list[str]) -> list[EntityToolResponse]:
-        metrics_key = ",".join(sorted(metrics))
-        if metrics_key not in self.entities_cache:
-            entities_result = submit_request(
-                self.config,
-                {
-                    "query": GRAPHQL_QUERIES["entities"],
-                    "variables": {"metrics": [{"name": m} for m in metrics]},
-                },
+            if (
+                not values.truncated
+                and values.values.nbytes <= DIMENSION_VALUES_MAX_CACHED_BYTES
+            ):
+                self.dimension_values_cache.set(cache_key, values)
+        return await self._run_blocking(
+            _filter_dimension_values,
+            dimension_values=values,
+            prefix=prefix,
+            limit=limit,
+        )
+
+    def _get_dimension_values(
+        self, metrics: list[str], dimension: str
+    ) -> _DimensionValues:
+        """Reads the values within the result budget, so that the values of a
+        high-cardinality dimension aren't all pulled into memory."""
+
+        def read_values(
+            sl_client: SemanticLayerClientProtocol,
+        ) -> BoundedTable | None:
+            with stream_dimension_values(
+                sl_client, metrics=metrics, group_by=dimension
+            ) as (schema, batches):
+                try:
+                    return self.result_budget.read(schema, batches)
+                except ResultBudgetExceededError:
+                    # Only the result was too large, the session is fine
+                    return None
+
+        try:
+            result = self.session_pool.run(read_values)
+        except QueryFailedError as e:
+            raise ValueError(self._format_semantic_layer_error(e)) from e
+        if result is None:
+            raise ValueError(
+                f"The dimension {dimension} has too many values to list. "
+                + "Filter on it in query_metrics instead."
             )
-            entities = [
-                EntityToolResponse(
-                    name=e.get("name"),
-                    type=e.get("type"),
-                    description=e.get("description"),
-                )
-                for e in entities_result["data"]["entities"]
-            ]
-            self.entities_cache[metrics_key] = entities
-        return self.entities_cache[metrics_key]
+        values = result.table.column(0).drop_null().combine_chunks().unique()
+        return _DimensionValues(
+            values=values.take(pc.sort_indices(values)), truncated=result.truncated
+        )
 
-    def get_metrics_compiled_sql(
+    async def get_metrics_compiled_sql(
         self,
         metrics: list[str],
         group_by: list[GroupByParam] | None = None,
@@ -147,24 +482,66 @@ class SemanticLayerFetcher:
         Returns:
             GetMetricsCompiledSqlResult with either the compiled SQL or an error
         """
-        validation_error = self.validate_query_metrics_params(
+        validation_error = await self.validate_query_metrics_params(
             metrics=metrics,
             group_by=group_by,
+            order_by=order_by,
+            where=where,
         )
         if validation_error:
             return GetMetricsCompiledSqlError(error=validation_error)
 
+        fingerprint = (await self.metrics_catalog.get()).fingerprint
+        # Compiled SQL can't be reordered like cached results
+        cache_key = _get_query_cache_key(
+            metrics=metrics,
+            group_by=group_by,
+            order_by=order_by,
+            where=where,
+            limit=limit,
+            keep_column_order=True,
+        )
+        sql = await self._run_blocking(
+            self.compiled_sql_cache.get, fingerprint, cache_key
+        )
+        if sql is not None:
+            logger.debug(f"Serving compiled SQL for {metrics} from the cache")
+            return GetMetricsCompiledSqlSuccess(sql=sql)
+
+        # The SDK client is blocking, so we keep it off the event loop
+        async with self._session_slots:
+            result = await self._run_blocking(
+                self._compile_sql,
+                metrics=metrics,
+                group_by=group_by,
+                order_by=order_by,
+                where=where,
+                limit=limit,
+            )
+        if isinstance(result, GetMetricsCompiledSqlSuccess):
+            await self._run_blocking(
+                self.compiled_sql_cache.set, fingerprint, cache_key, result.sql
+            )
+        return result
+
+    def _compile_sql(
+        self,
+        metrics: list[str],
+        group_by: list[GroupByParam] | None,
+        order_by: list[OrderByParam] | None,
+        where: str | None,
+        limit: int | None,
+    ) -> GetMetricsCompiledSqlResult:
         try:
-            with self.sl_client.session():
-                parsed_order_by: list[OrderBySpec] = (
-                    self.get_order_bys(
-                        order_by=order_by, metrics=metrics, group_by=group_by
-                    )
-                    if order_by is not None
-                    else []
+            parsed_order_by: list[OrderBySpec] = (
+                self.get_order_bys(
+                    order_by=order_by, metrics=metrics, group_by=group_by
                 )
-
-                compiled_sql = self.sl_client.compile_sql(
+                if order_by is not None
+                else []
+            )
+            compiled_sql = self.session_pool.run(
+                lambda sl_client: sl_client.compile_sql(
                     metrics=metrics,
                     group_by=group_by,  # type: ignore
                     order_by=parsed_order_by,  # type: ignore
@@ -172,9 +549,8 @@ class SemanticLayerFetcher:
                     limit=limit,
                     read_cache=True,
                 )
-
-                return GetMetricsCompiledSqlSuccess(sql=compiled_sql)
-
+            )
+            return GetMetricsCompiledSqlSuccess(sql=compiled_sql)
         except Exception as e:
             return self._format_get_metrics_compiled_sql_error(e)
 
@@ -204,48 +580,17 @@ class SemanticLayerFetcher:
             error=self._format_semantic_layer_error(compile_error)
         )
 
-    def validate_query_metrics_params(
-        self, metrics: list[str], group_by: list[GroupByParam] | None
+    async def validate_query_metrics_params(
+        self,
+        metrics: list[str],
+        group_by: list[GroupByParam] | None,
+        order_by: list[OrderByParam] | None = None,
+        where: str | None = None,
     ) -> str | None:
-        errors = []
-        available_metrics_names = [m.name for m in self.list_metrics()]
-        metric_misspellings = get_misspellings(
-            targets=metrics,
-            words=available_metrics_names,
-            top_k=5,
+        manifest = await self.metrics_catalog.get()
+        return manifest.validate_query(
+            metrics=metrics, group_by=group_by, order_by=order_by, where=where
         )
-        for metric_misspelling in metric_misspellings:
-            recommendations = (
-                " Did you mean: " + ", ".join(metric_misspelling.similar_words) + "?"
-            )
-            errors.append(
-                f"Metric {metric_misspelling.word} not found."
-                + (recommendations if metric_misspelling.similar_words else "")
-            )
-
-        if errors:
-            return f"Errors: {', '.join(errors)}"
-
-        available_group_by = [d.name for d in self.get_dimensions(metrics)] + [
-            e.name for e in self.get_entities(metrics)
-        ]
-        group_by_misspellings = get_misspellings(
-            targets=[g.name for g in group_by or []],
-            words=available_group_by,
-            top_k=5,
-        )
-        for group_by_misspelling in group_by_misspellings:
-            recommendations = (
-                " Did you mean: " + ", ".join(group_by_misspelling.similar_words) + "?"
-            )
-            errors.append(
-                f"Group by {group_by_misspelling.word} not found."
-                + (recommendations if group_by_misspelling.similar_words else "")
-            )
-
-        if errors:
-            return f"Errors: {', '.join(errors)}"
-        return None
 
     # TODO: move this to the SDK
     def _format_query_failed_error(self, query_error: Exception) -> QueryMetricsError:
@@ -283,47 +628,249 @@ class SemanticLayerFetcher:
                 )
         return result
 
-    def query_metrics(
+    async def query_metrics(
         self,
         metrics: list[str],
         group_by: list[GroupByParam] | None = None,
         order_by: list[OrderByParam] | None = None,
         where: str | None = None,
         limit: int | None = None,
+        page_size: int | None = None,
+        output_format: ResultFormat = ResultFormat.JSON,
+        use_cache: bool = True,
     ) -> QueryMetricsResult:
-        validation_error = self.validate_query_metrics_params(
+        if page_size is not None and page_size < 1:
+            return QueryMetricsError(error="page_size must be at least 1")
+        validation_error = await self.validate_query_metrics_params(
             metrics=metrics,
             group_by=group_by,
+            order_by=order_by,
+            where=where,
         )
         if validation_error:
             return QueryMetricsError(error=validation_error)
 
-        try:
-            query_error = None
-            with self.sl_client.session():
-                # Catching any exception within the session
-                # to ensure it is closed properly
-                try:
-                    parsed_order_by: list[OrderBySpec] = (
-                        self.get_order_bys(
-                            order_by=order_by, metrics=metrics, group_by=group_by
-                        )
-                        if order_by is not None
-                        else []
-                    )
-                    query_result = self.sl_client.query(
+        cache_key = _get_query_cache_key(
+            metrics=metrics,
+            group_by=group_by,
+            order_by=order_by,
+            where=where,
+            limit=limit,
+        )
+        truncated = False
+        is_cached, cached_result = (
+            self.result_cache.get(cache_key) if use_cache else (False, None)
+        )
+        if is_cached and cached_result is not None:
+            logger.debug(f"Serving query for {metrics} from the result cache")
+            # The cached query may have listed the same columns in another order
+            table = order_columns(cached_result.table, metrics, group_by or [])
+        else:
+            rolled_up = (
+                await self._roll_up_cached_result(
+                    metrics=metrics,
+                    group_by=group_by,
+                    order_by=order_by,
+                    where=where,
+                    limit=limit,
+                )
+                if use_cache and self.config.rollup_cached_results
+                else None
+            )
+            if rolled_up is not None:
+                logger.debug(f"Rolled up query for {metrics} from a cached result")
+                table = rolled_up
+            else:
+                # The SDK client is blocking, so we keep it off the event loop
+                async with self._session_slots:
+                    query_result = await self._run_blocking(
+                        self._query,
                         metrics=metrics,
-                        # TODO: remove this type ignore once this PR is merged: https://github.com/dbt-labs/semantic-layer-sdk-python/pull/80
-                        group_by=group_by,  # type: ignore
-                        order_by=parsed_order_by,  # type: ignore
-                        where=[where] if where else None,
+                        group_by=group_by,
+                        order_by=order_by,
+                        where=where,
                         limit=limit,
+                        read_cache=use_cache,
                     )
-                except Exception as e:
-                    query_error = e
-            if query_error:
-                return self._format_query_failed_error(query_error)
-            json_result = query_result.to_pandas().to_json(orient="records", indent=2)
-            return QueryMetricsSuccess(result=json_result or "")
+                if isinstance(query_result, QueryMetricsError):
+                    return query_result
+                table = query_result.table
+                truncated = query_result.truncated
+            # Truncated results can't be served or rolled up for later queries
+            if not truncated:
+                self.result_cache.set(
+                    cache_key,
+                    CachedQueryResult(
+                        metrics=metrics,
+                        group_by=group_by or [],
+                        where=where.strip() if where else None,
+                        limit=limit,
+                        table=table,
+                    ),
+                )
+        return await self._run_blocking(
+            self._format_query_result,
+            table=table,
+            page_size=page_size,
+            output_format=output_format,
+            truncated=truncated,
+        )
+
+    async def _roll_up_cached_result(
+        self,
+        metrics: list[str],
+        group_by: list[GroupByParam] | None,
+        order_by: list[OrderByParam] | None,
+        where: str | None,
+        limit: int | None,
+    ) -> pa.Table | None:
+        """Answers the query from the cached result of a finer-grained query
+        for the same metrics, if they can all be rolled up exactly."""
+        rollups = (await self.metrics_catalog.get()).rollups
+        aggregations = {m: rollups[m] for m in metrics if m in rollups}
+        results = self.result_cache.values()
+        if len(aggregations) < len(metrics) or not results:
+            return None
+        try:
+            return await self._run_blocking(
+                roll_up,
+                results,
+                metrics=metrics,
+                group_by=group_by or [],
+                order_by=order_by or [],
+                where=where,
+                limit=limit,
+                aggregations=aggregations,
+            )
+        except Exception:
+            logger.exception(f"Error rolling up cached results for {metrics}")
+            return None
+
+    async def query_metrics_batch(
+        self,
+        queries: list[MetricQuery],
+        output_format: ResultFormat = ResultFormat.JSON,
+        use_cache: bool = True,
+    ) -> list[QueryMetricsResult]:
+        """Runs independent queries concurrently, as many at once as there are
+        sessions, and returns their results in the same order.
+
+        Identical queries in the batch only run once."""
+        if len(queries) > MAX_BATCH_QUERIES:
+            raise ValueError(
+                f"A batch can have at most {MAX_BATCH_QUERIES} queries, "
+                + f"got {len(queries)}"
+            )
+        unique_queries: dict[str, MetricQuery] = {}
+        keys = []
+        for query in queries:
+            key = _get_query_cache_key(
+                metrics=query.metrics,
+                group_by=query.group_by,
+                order_by=query.order_by,
+                where=query.where,
+                limit=query.limit,
+                keep_column_order=True,
+            )
+            unique_queries.setdefault(key, query)
+            keys.append(key)
+        # Formatting results runs outside of the session slots, so the batch
+        # is gated as a whole to keep it from flooding the tool pool.
+        batch_slots = asyncio.Semaphore(self._max_sessions)
+
+        async def run_query(query: MetricQuery) -> QueryMetricsResult:
+            async with batch_slots:
+                return await self.query_metrics(
+                    metrics=query.metrics,
+                    group_by=query.group_by,
+                    order_by=query.order_by,
+                    where=query.where,
+                    limit=query.limit,
+                    output_format=output_format,
+                    use_cache=use_cache,
+                )
+
+        results = await asyncio.gather(
+            *[run_query(query) for query in unique_queries.values()],
+            return_exceptions=True,
+        )
+        results_by_key = {
+            key: QueryMetricsError(error=str(result))
+            if isinstance(result, BaseException)
+            else result
+            for key, result in zip(unique_queries, results, strict=True)
+        }
+        return [results_by_key[key] for key in keys]
+
+    async def get_query_metrics_page(self, page_token: str) -> QueryMetricsResult:
+        try:
+            page = await self._run_blocking(self.result_pages.get_page, page_token)
+        except ResultPageError as e:
+            return QueryMetricsError(error=str(e))
+        return QueryMetricsSuccess(result=page.to_json(), is_page=True)
+
+    def _query(
+        self,
+        metrics: list[str],
+        group_by: list[GroupByParam] | None,
+        order_by: list[OrderByParam] | None,
+        where: str | None,
+        limit: int | None,
+        read_cache: bool = True,
+    ) -> BoundedTable | QueryMetricsError:
+        try:
+            parsed_order_by: list[OrderBySpec] = (
+                self.get_order_bys(
+                    order_by=order_by, metrics=metrics, group_by=group_by
+                )
+                if order_by is not None
+                else []
+            )
+
+            def read_result(
+                sl_client: SemanticLayerClientProtocol,
+            ) -> BoundedTable | QueryMetricsError:
+                with stream_query(
+                    sl_client,
+                    metrics=metrics,
+                    group_by=group_by,
+                    order_by=parsed_order_by,
+                    where=[where] if where else None,
+                    limit=limit,
+                    read_cache=read_cache,
+                ) as (schema, batches):
+                    try:
+                        return self.result_budget.read(schema, batches)
+                    except ResultBudgetExceededError as e:
+                        # Only the result was too large, the session is fine
+                        return QueryMetricsError(error=str(e))
+
+            return self.session_pool.run(read_result)
         except Exception as e:
             return self._format_query_failed_error(e)
+
+    def _format_query_result(
+        self,
+        table: pa.Table,
+        page_size: int | None,
+        output_format: ResultFormat,
+        truncated: bool = False,
+    ) -> QueryMetricsResult:
+        try:
+            if page_size is not None:
+                page = self.result_pages.first_page(
+                    table, page_size, output_format, truncated=truncated
+                )
+                return QueryMetricsSuccess(result=page.to_json(), is_page=True)
+            if truncated:
+                # Returned as a single page, which marks the result as truncated
+                page = ResultPage(
+                    rows=serialize_table(table, output_format),
+                    result_format=output_format,
+                    total_rows=table.num_rows,
+                    truncated=True,
+                )
+                return QueryMetricsSuccess(result=page.to_json(), is_page=True)
+            return QueryMetricsSuccess(result=serialize_table(table, output_format))
+        except Exception as e:
+            return QueryMetricsError(error=str(e))
@@ -6,6 +6,22 @@ query GetMetrics($environmentId: BigInt!) {
     label
     description
     type
+    measures {
+      agg
+      expr
+    }
+    dimensions {
+      name
+      type
+      expr
+      queryableGranularities
+      queryableTimeGranularities
+    }
+    entities {
+      name
+      type
+      expr
+    }
   }
 }
     """,
@@ -27,6 +43,22 @@ query GetEntities($environmentId: BigInt!, $metrics: [MetricInput!]!) {
     name
     type
   }
+}
+    """,
+    "dimensions_and_entities": """
+query GetDimensionsAndEntities($environmentId: BigInt!, $metrics: [MetricInput!]!) {
+  dimensions(environmentId: $environmentId, metrics: $metrics) {
+    description
+    name
+    type
+    queryableGranularities
+    queryableTimeGranularities
+  }
+  entities(environmentId: $environmentId, metrics: $metrics) {
+    description
+    name
+    type
+  }
 }
     """,
 }
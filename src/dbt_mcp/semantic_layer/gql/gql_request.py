@@ -1,17 +1,21 @@
-import requests
+import httpx
 
 from dbt_mcp.config.config import SemanticLayerConfig
 from dbt_mcp.gql.errors import raise_gql_error
+from dbt_mcp.http.client import HttpClientManager
 
 
-def submit_request(
+async def submit_request(
     sl_config: SemanticLayerConfig,
     payload: dict,
+    http_client: httpx.AsyncClient | None = None,
 ) -> dict:
     if "variables" not in payload:
         payload["variables"] = {}
     payload["variables"]["environmentId"] = sl_config.prod_environment_id
-    r = requests.post(sl_config.url, json=payload, headers=sl_config.headers)
+    r = await (http_client or HttpClientManager.get_client(sl_config.url)).post(
+        sl_config.url, json=payload, headers=sl_config.headers
+    )
     result = r.json()
     raise_gql_error(result)
     return result
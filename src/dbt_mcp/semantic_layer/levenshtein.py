@@ -1,3 +1,4 @@
+import heapq
 from dataclasses import dataclass
 
 
@@ -49,20 +50,131 @@ def get_closest_words(
     return [word for word, _ in distances]
 
 
+def _get_pattern_masks(pattern: str) -> dict[str, int]:
+    masks: dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _bit_parallel_levenshtein(
+    pattern: str, masks: dict[str, int], word: str, max_distance: int
+) -> int:
+    """Myers' bit-parallel Levenshtein distance (in Hyyrö's formulation),
+    which processes a whole DP column per character of `word`.
+
+    Returns `max_distance + 1` as soon as the distance is known to exceed
+    `max_distance`.
+    """
+    too_far = max_distance + 1
+    length = len(pattern)
+    if abs(length - len(word)) > max_distance:
+        return too_far
+    if length == 0:
+        return len(word)
+    all_ones = (1 << length) - 1
+    last_bit = 1 << (length - 1)
+    positive = all_ones
+    negative = 0
+    distance = length
+    remaining = len(word)
+    for char in word:
+        matches = masks.get(char, 0)
+        vertical = matches | negative
+        horizontal = (((matches & positive) + positive) ^ positive) | matches
+        horizontal_positive = negative | ~(horizontal | positive)
+        horizontal_negative = positive & horizontal
+        if horizontal_positive & last_bit:
+            distance += 1
+        elif horizontal_negative & last_bit:
+            distance -= 1
+        remaining -= 1
+        # The distance changes by at most one per remaining character
+        if distance - remaining > max_distance:
+            return too_far
+        horizontal_positive = (horizontal_positive << 1) | 1
+        horizontal_negative <<= 1
+        positive = (horizontal_negative | ~(vertical | horizontal_positive)) & all_ones
+        negative = horizontal_positive & vertical & all_ones
+    return distance if distance <= max_distance else too_far
+
+
+def bounded_levenshtein(s1: str, s2: str, max_distance: int) -> int:
+    """Levenshtein distance between two words, or `max_distance + 1` if the
+    distance exceeds `max_distance`."""
+    return _bit_parallel_levenshtein(s1, _get_pattern_masks(s1), s2, max_distance)
+
+
+class WordIndex:
+    """Index over a list of words for finding the closest matches of a target.
+
+    Words are bucketed by length and the buckets closest to the target's
+    length are searched first. Once `top_k` matches are found, the search
+    bound shrinks to the distance of the worst of them, so most remaining
+    words are skipped by length or abandoned early by the bit-parallel
+    distance computation.
+    Results are the same as `get_closest_words`, including the order of
+    words at the same distance.
+
+    Build the index once per word list and reuse it across lookups.
+    """
+
+    def __init__(self, words: list[str]):
+        self.words = words
+        self._word_set = set(words)
+        self._by_length: dict[int, list[tuple[int, str]]] = {}
+        for position, word in enumerate(words):
+            self._by_length.setdefault(len(word), []).append((position, word))
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._word_set
+
+    def get_closest_words(
+        self,
+        target: str,
+        top_k: int | None = None,
+        threshold: int | None = None,
+    ) -> list[str]:
+        if threshold is None:
+            return get_closest_words(target, self.words, top_k=top_k)
+        if top_k is not None and top_k <= 0:
+            return []
+        # Max-heap of the best matches so far, ordered like the full scan
+        # by distance and then by position in the word list.
+        best: list[tuple[int, int, str]] = []
+        bound = threshold
+        masks = _get_pattern_masks(target)
+        lengths = sorted(self._by_length, key=lambda length: abs(length - len(target)))
+        for length in lengths:
+            if abs(length - len(target)) > bound:
+                break
+            for position, word in self._by_length[length]:
+                distance = _bit_parallel_levenshtein(target, masks, word, bound)
+                if distance > bound:
+                    continue
+                if top_k is None or len(best) < top_k:
+                    heapq.heappush(best, (-distance, -position, word))
+                elif (distance, position) < (-best[0][0], -best[0][1]):
+                    heapq.heapreplace(best, (-distance, -position, word))
+                if top_k is not None and len(best) == top_k:
+                    bound = -best[0][0]
+        return [word for _, _, word in sorted((-d, -p, w) for d, p, w in best)]
+
+
 def get_misspellings(
     targets: list[str],
-    words: list[str],
+    words: list[str] | WordIndex,
     top_k: int | None = None,
 ) -> list[Misspelling]:
+    index = words if isinstance(words, WordIndex) else WordIndex(words)
     misspellings = []
     for target in targets:
-        if target not in words:
+        if target not in index:
             misspellings.append(
                 Misspelling(
                     word=target,
-                    similar_words=get_closest_words(
+                    similar_words=index.get_closest_words(
                         target=target,
-                        words=words,
                         top_k=top_k,
                         threshold=max(1, len(target) // 2),
                     ),
@@ -0,0 +1,240 @@
+import hashlib
+import json
+import re
+from dataclasses import dataclass, replace
+
+from dbtsl.api.shared.query_params import GroupByParam
+from dbtsl.models.metric import MetricType
+
+from dbt_mcp.cache.lru import LRUCache
+from dbt_mcp.semantic_layer.levenshtein import WordIndex, get_misspellings
+from dbt_mcp.semantic_layer.rollup import ROLLUP_AGGREGATIONS
+from dbt_mcp.semantic_layer.types import (
+    DimensionToolResponse,
+    EntityToolResponse,
+    MetricToolResponse,
+    OrderByParam,
+)
+
+# Upper bound on the number of metric combinations whose group bys are kept
+GROUP_BYS_MAX_ENTRIES = 256
+
+# References to group bys in `where` filters, like `{{ Dimension('name') }}`
+# or `{{ TimeDimension('name', 'grain') }}`. References with other arguments,
+# like an entity path, are left for the server to resolve.
+WHERE_REFERENCE = re.compile(
+    r"\b(?P<kind>Dimension|TimeDimension|Entity)\(\s*"
+    + r"(?P<quote>['\"])(?P<name>[^'\"]+)(?P=quote)\s*"
+    + r"(?:,\s*(?P<grain_quote>['\"])(?P<grain>[^'\"]+)(?P=grain_quote)\s*)?\)"
+)
+
+
+def intersect_dimensions(
+    per_metric: list[list[DimensionToolResponse]],
+) -> list[DimensionToolResponse]:
+    first, *others = per_metric
+    others_by_name = [{d.name: d for d in dimensions} for dimensions in others]
+    result = []
+    for dimension in first:
+        matches = [o[dimension.name] for o in others_by_name if dimension.name in o]
+        if len(matches) < len(others_by_name):
+            continue
+        granularities = dimension.granularities
+        if granularities:
+            # Time dimensions can only be queried at grains shared by all metrics
+            for m in matches:
+                shared = set(m.granularities or [])
+                granularities = [g for g in granularities if g in shared]
+            if not granularities:
+                continue
+        result.append(replace(dimension, granularities=granularities))
+    return result
+
+
+def intersect_entities(
+    per_metric: list[list[EntityToolResponse]],
+) -> list[EntityToolResponse]:
+    first, *others = per_metric
+    other_names = [{e.name for e in entities} for entities in others]
+    return [e for e in first if all(e.name in names for names in other_names)]
+
+
+def parse_dimensions(data: dict) -> list[DimensionToolResponse]:
+    return [
+        DimensionToolResponse(
+            name=d.get("name"),
+            type=d.get("type"),
+            description=d.get("description"),
+            label=d.get("label"),
+            granularities=d.get("queryableGranularities")
+            + d.get("queryableTimeGranularities"),
+        )
+        for d in data["dimensions"]
+    ]
+
+
+def parse_entities(data: dict) -> list[EntityToolResponse]:
+    return [
+        EntityToolResponse(
+            name=e.get("name"),
+            type=e.get("type"),
+            description=e.get("description"),
+        )
+        for e in data["entities"]
+    ]
+
+
+def _get_metric_rollups(metrics: list[dict]) -> dict[str, str]:
+    """Maps the simple metrics whose measure can be re-aggregated exactly to
+    the aggregation that rolls them up."""
+    rollups = {}
+    for metric in metrics:
+        measures = metric.get("measures") or []
+        if metric.get("type") != MetricType.SIMPLE.value or len(measures) != 1:
+            continue
+        aggregation = ROLLUP_AGGREGATIONS.get(measures[0].get("agg"))
+        if aggregation is not None:
+            rollups[metric["name"]] = aggregation
+    return rollups
+
+
+@dataclass
+class _GroupBys:
+    dimensions: dict[str, DimensionToolResponse]
+    entities: dict[str, EntityToolResponse]
+    index: WordIndex
+
+
+def _format_misspelling(kind: str, word: str, similar_words: list[str]) -> str:
+    recommendations = " Did you mean: " + ", ".join(similar_words) + "?"
+    return f"{kind} {word} not found." + (recommendations if similar_words else "")
+
+
+class SemanticManifest:
+    """Index of the metrics in the Semantic Layer and of the dimensions and
+    entities each of them can be queried with.
+
+    Built from a single request for the whole catalog, so that queries can
+    be validated locally instead of asking the server about every metric.
+    """
+
+    def __init__(self, metrics: list[dict]):
+        # Changes whenever a metric, or the expression of one of its measures,
+        # dimensions or entities, changes
+        self.fingerprint = hashlib.sha256(
+            json.dumps(metrics, sort_keys=True).encode()
+        ).hexdigest()
+        self.metrics = [
+            MetricToolResponse(
+                name=m["name"],
+                type=m["type"],
+                label=m.get("label"),
+                description=m.get("description"),
+            )
+            for m in metrics
+        ]
+        self.metric_index = WordIndex([m.name for m in self.metrics])
+        # How the values of simple metrics are rolled up to a coarser grain
+        self.rollups = _get_metric_rollups(metrics)
+        self._dimensions = {
+            m["name"]: parse_dimensions({"dimensions": m.get("dimensions") or []})
+            for m in metrics
+        }
+        self._entities = {
+            m["name"]: parse_entities({"entities": m.get("entities") or []})
+            for m in metrics
+        }
+        # The manifest is replaced rather than updated, so entries never expire
+        self._group_bys: LRUCache[tuple[str, ...], _GroupBys] = LRUCache(
+            max_entries=GROUP_BYS_MAX_ENTRIES, ttl_seconds=float("inf")
+        )
+
+    def _get_group_bys(self, metrics: list[str]) -> _GroupBys:
+        """The dimensions and entities shared by all of the given metrics,
+        which must be in the manifest."""
+        key = tuple(sorted(set(metrics)))
+        _, group_bys = self._group_bys.get(key)
+        if group_bys is None:
+            dimensions = intersect_dimensions([self._dimensions[m] for m in key])
+            entities = intersect_entities([self._entities[m] for m in key])
+            group_bys = _GroupBys(
+                dimensions={d.name: d for d in dimensions},
+                entities={e.name: e for e in entities},
+                index=WordIndex(
+                    [d.name for d in dimensions] + [e.name for e in entities]
+                ),
+            )
+            self._group_bys.set(key, group_bys)
+        return group_bys
+
+    def validate_query(
+        self,
+        metrics: list[str],
+        group_by: list[GroupByParam] | None = None,
+        order_by: list[OrderByParam] | None = None,
+        where: str | None = None,
+    ) -> str | None:
+        """Returns the errors of a query, or None if it looks valid."""
+        errors = [
+            _format_misspelling("Metric", m.word, m.similar_words)
+            for m in get_misspellings(targets=metrics, words=self.metric_index, top_k=5)
+        ]
+        if errors:
+            return f"Errors: {', '.join(errors)}"
+
+        # Intersected once per combination of metrics
+        group_bys = self._get_group_bys(metrics)
+        dimensions_by_name = group_bys.dimensions
+        errors.extend(
+            _format_misspelling("Group by", m.word, m.similar_words)
+            for m in get_misspellings(
+                targets=[g.name for g in group_by or []],
+                words=group_bys.index,
+                top_k=5,
+            )
+        )
+        for g in group_by or []:
+            if g.grain and g.name in dimensions_by_name:
+                errors.extend(
+                    _validate_grain(dimensions_by_name[g.name], g.grain, "Group by")
+                )
+
+        queried = set(metrics) | {g.name for g in group_by or []}
+        errors.extend(
+            f"Order by {o.name} not found in metrics or group by."
+            for o in order_by or []
+            if o.name not in queried
+        )
+
+        if where:
+            for reference in WHERE_REFERENCE.finditer(where):
+                name = reference["name"]
+                if reference["kind"] == "Entity":
+                    if name not in group_bys.entities:
+                        errors.append(f"Entity {name} in where not found.")
+                elif name not in dimensions_by_name:
+                    errors.append(f"Dimension {name} in where not found.")
+                elif reference["grain"]:
+                    errors.extend(
+                        _validate_grain(
+                            dimensions_by_name[name], reference["grain"], "Where"
+                        )
+                    )
+
+        if errors:
+            return f"Errors: {', '.join(errors)}"
+        return None
+
+
+def _validate_grain(
+    dimension: DimensionToolResponse, grain: str, context: str
+) -> list[str]:
+    granularities = dimension.granularities or []
+    if not granularities:
+        return [f"{context} {dimension.name} is not a time dimension."]
+    if grain.upper() not in {g.upper() for g in granularities}:
+        return [
+            f"{context} {dimension.name} can't be queried at grain {grain}."
+            + f" Available grains: {', '.join(granularities)}."
+        ]
+    return []
@@ -0,0 +1,235 @@
+from dataclasses import dataclass
+from typing import Any, Literal, cast
+
+import pyarrow as pa
+import pyarrow.compute as pc
+from dbtsl.api.shared.query_params import GroupByParam
+
+from dbt_mcp.semantic_layer.types import OrderByParam
+
+# Standard time granularities, from the finest to the coarsest
+TIME_GRAINS = [
+    "NANOSECOND",
+    "MICROSECOND",
+    "MILLISECOND",
+    "SECOND",
+    "MINUTE",
+    "HOUR",
+    "DAY",
+    "WEEK",
+    "MONTH",
+    "QUARTER",
+    "YEAR",
+]
+
+# How the values of metrics are re-aggregated, by the aggregation of their
+# measure. Other aggregations (e.g. AVERAGE or COUNT_DISTINCT) can't be
+# rolled up exactly.
+ROLLUP_AGGREGATIONS = {
+    "SUM": "sum",
+    "SUM_BOOLEAN": "sum",
+    "COUNT": "sum",
+    "MIN": "min",
+    "MAX": "max",
+}
+
+
+@dataclass
+class CachedQueryResult:
+    metrics: list[str]
+    group_by: list[GroupByParam]
+    # Stripped of surrounding whitespace
+    where: str | None
+    limit: int | None
+    table: pa.Table
+
+
+def can_roll_up_grain(source_grain: str, target_grain: str) -> bool:
+    source_grain, target_grain = source_grain.upper(), target_grain.upper()
+    if source_grain == target_grain:
+        return True
+    if source_grain not in TIME_GRAINS or target_grain not in TIME_GRAINS:
+        # e.g. custom granularities like fiscal quarters
+        return False
+    # Weeks don't nest into months, quarters or years
+    if source_grain == "WEEK":
+        return False
+    return TIME_GRAINS.index(source_grain) < TIME_GRAINS.index(target_grain)
+
+
+def roll_up(
+    results: list[CachedQueryResult],
+    metrics: list[str],
+    group_by: list[GroupByParam],
+    order_by: list[OrderByParam],
+    where: str | None,
+    limit: int | None,
+    aggregations: dict[str, str],
+) -> pa.Table | None:
+    """Answers a query by re-aggregating the cached result of a query for the
+    same metrics at a finer grain or with more group bys.
+
+    `aggregations` maps every queried metric to the Arrow aggregation that
+    rolls it up. Returns None unless the rollup is exact.
+    """
+    if any(m not in aggregations for m in metrics):
+        return None
+    # Smaller results are cheaper to roll up
+    for result in sorted(results, key=lambda r: r.table.num_rows):
+        table = _roll_up(
+            result,
+            metrics=metrics,
+            group_by=group_by,
+            order_by=order_by,
+            where=where,
+            limit=limit,
+            aggregations=aggregations,
+        )
+        if table is not None:
+            return table
+    return None
+
+
+def order_columns(
+    table: pa.Table, metrics: list[str], group_by: list[GroupByParam]
+) -> pa.Table:
+    """Orders the columns of a cached result like a query for the same
+    metrics and group bys in another order.
+
+    The group by and metric columns keep their positions in the table, and
+    are ordered like `group_by` and `metrics` within them. The table is
+    returned as is if its columns can't all be matched to the query.
+    """
+    # Warehouses may change the case of column names
+    columns = {name.lower(): name for name in table.column_names}
+    group_by_columns = [columns.get(_get_column_name(g)) for g in group_by]
+    metric_columns = [columns.get(m.lower()) for m in metrics]
+    requested = [*group_by_columns, *metric_columns]
+    if None in requested or len(set(requested)) < len(requested):
+        return table
+    names = list(table.column_names)
+    for queried in (group_by_columns, metric_columns):
+        positions = sorted(names.index(cast(str, c)) for c in queried)
+        for position, column in zip(positions, queried, strict=True):
+            names[position] = cast(str, column)
+    return table.select(names)
+
+
+def _roll_up(
+    result: CachedQueryResult,
+    metrics: list[str],
+    group_by: list[GroupByParam],
+    order_by: list[OrderByParam],
+    where: str | None,
+    limit: int | None,
+    aggregations: dict[str, str],
+) -> pa.Table | None:
+    # A limited result may be missing rows of the rolled up groups, and rows
+    # that only exist for some of the metrics would differ.
+    if (
+        result.limit is not None
+        or sorted(result.metrics) != sorted(metrics)
+        or result.where != (where.strip() if where else None)
+    ):
+        return None
+    # Warehouses may change the case of column names
+    columns = {name.lower(): name for name in result.table.column_names}
+    if len(columns) < result.table.num_columns:
+        return None
+
+    keys: dict[str, Any] = {}
+    for target in group_by:
+        source = _find_source_group_by(result.group_by, target)
+        if source is None:
+            return None
+        source_column = columns.get(_get_column_name(source).lower())
+        if source_column is None:
+            return None
+        values: Any = result.table.column(source_column)
+        name = source_column
+        if _get_column_name(source) != _get_column_name(target):
+            if target.grain is None or not pa.types.is_temporal(values.type):
+                return None
+            values = pc.floor_temporal(
+                values, unit=cast(Any, target.grain.lower()), week_starts_monday=True
+            )
+            name = _match_case(_get_column_name(target), source_column)
+        if name in keys:
+            return None
+        keys[name] = values
+
+    metric_columns: list[str] = []
+    for metric in metrics:
+        metric_column = columns.get(metric.lower())
+        if metric_column is None or metric_column in keys:
+            return None
+        metric_columns.append(metric_column)
+    table = pa.Table.from_arrays(
+        [*keys.values(), *(result.table.column(c) for c in metric_columns)],
+        names=[*keys, *metric_columns],
+    )
+    aggregated = table.group_by(list(keys), use_threads=False).aggregate(
+        [
+            (column, cast(Any, aggregations[metric]))
+            for metric, column in zip(metrics, metric_columns, strict=True)
+        ]
+    )
+    rolled_up = pa.Table.from_arrays(
+        [
+            *(aggregated.column(name) for name in keys),
+            *(
+                aggregated.column(f"{column}_{aggregations[metric]}")
+                for metric, column in zip(metrics, metric_columns, strict=True)
+            ),
+        ],
+        names=[*keys, *metric_columns],
+    )
+
+    sort_keys: list[tuple[str, Literal["ascending", "descending"]]] = []
+    for o in order_by:
+        order_by_group_by = next((g for g in group_by if g.name == o.name), None)
+        if order_by_group_by is not None:
+            column = _get_column_name(order_by_group_by).lower()
+        else:
+            column = o.name.lower()
+        sort_column = next(
+            (c for c in rolled_up.column_names if c.lower() == column), None
+        )
+        if sort_column is None:
+            return None
+        # Warehouses don't agree on where nulls are sorted
+        if limit is not None and rolled_up.column(sort_column).null_count > 0:
+            return None
+        sort_keys.append((sort_column, "descending" if o.descending else "ascending"))
+    if sort_keys:
+        rolled_up = rolled_up.sort_by(sort_keys)
+    if limit is not None:
+        rolled_up = rolled_up.slice(0, limit)
+    return rolled_up
+
+
+def _find_source_group_by(
+    group_by: list[GroupByParam], target: GroupByParam
+) -> GroupByParam | None:
+    """Finds the group by that `target` can be rolled up from, preferring
+    the same grain."""
+    candidates = [
+        g for g in group_by if g.name == target.name and g.type == target.type
+    ]
+    for g in candidates:
+        if _get_column_name(g) == _get_column_name(target):
+            return g
+    for g in candidates:
+        if g.grain and target.grain and can_roll_up_grain(g.grain, target.grain):
+            return g
+    return None
+
+
+def _get_column_name(group_by: GroupByParam) -> str:
+    if group_by.grain:
+        return f"{group_by.name}__{group_by.grain}".lower()
+    return group_by.name.lower()
+
+
+def _match_case(name: str, reference: str) -> str:
+    return name.upper() if reference.isupper() else name.lower()
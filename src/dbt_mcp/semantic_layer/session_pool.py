@@ -0,0 +1,159 @@
+import logging
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from typing import Any, ClassVar, Generic, Protocol, TypeVar
+
+from dbtsl.error import QueryFailedError, TimeoutError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SessionClient(Protocol):
+    def session(self) -> AbstractContextManager[Any]: ...
+
+
+C = TypeVar("C", bound=SessionClient)
+
+
+@dataclass
+class SessionPoolStats:
+    opened: int = 0
+    reused: int = 0
+    # Closed after an error
+    recycled: int = 0
+    # Closed after being idle for too long
+    expired: int = 0
+    idle: int = 0
+
+
+@dataclass
+class _PooledSession(Generic[C]):
+    client: C
+    context: AbstractContextManager[Any]
+    last_used_at: float
+    uses: int = 0
+
+
+class SemanticLayerSessionPool(Generic[C]):
+    """Keeps Semantic Layer sessions open between queries.
+
+    Every session belongs to its own client, since a client can only have one
+    session open at a time. At most `max_sessions` sessions are in use at
+    once and further calls wait for one to be released. Sessions that have
+    been idle for longer than `idle_timeout_seconds` are closed instead of
+    reused, as the server may have dropped their connections.
+
+    A session that raises anything but a query failure is considered broken
+    and closed. If it was a reused session, the call is retried once on a new
+    session, so that connections dropped while idle don't surface as errors.
+    """
+
+    _pools: ClassVar[weakref.WeakSet["SemanticLayerSessionPool[Any]"]] = (
+        weakref.WeakSet()
+    )
+
+    def __init__(
+        self,
+        create_client: Callable[[], C],
+        max_sessions: int,
+        idle_timeout_seconds: float,
+    ):
+        self.create_client = create_client
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._semaphore = threading.BoundedSemaphore(max(1, max_sessions))
+        self._lock = threading.Lock()
+        # Most recently used last, so that the warmest session is reused first
+        self._idle: list[_PooledSession[C]] = []
+        self._stats = SessionPoolStats()
+        SemanticLayerSessionPool._pools.add(self)
+
+    def run(self, fn: Callable[[C], T]) -> T:
+        """Runs `fn` with the client of a pooled session, blocking until a
+        session is available."""
+        with self._semaphore:
+            session = self._acquire()
+            while True:
+                try:
+                    result = fn(session.client)
+                except QueryFailedError:
+                    # The query was invalid, but the session is fine
+                    self._release(session)
+                    raise
+                except Exception as e:
+                    self._close(session)
+                    with self._lock:
+                        self._stats.recycled += 1
+                    if session.uses == 0 or isinstance(e, TimeoutError):
+                        raise
+                    logger.info(f"Retrying on a new Semantic Layer session after: {e}")
+                    session = self._open()
+                    continue
+                self._release(session)
+                return result
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._idle = self._idle, []
+        for session in sessions:
+            self._close(session)
+
+    @classmethod
+    def close_all(cls) -> None:
+        for pool in list(cls._pools):
+            pool.close()
+
+    def get_stats(self) -> SessionPoolStats:
+        with self._lock:
+            return SessionPoolStats(
+                opened=self._stats.opened,
+                reused=self._stats.reused,
+                recycled=self._stats.recycled,
+                expired=self._stats.expired,
+                idle=len(self._idle),
+            )
+
+    def _acquire(self) -> _PooledSession[C]:
+        session = None
+        with self._lock:
+            now = time.monotonic()
+            expired = [
+                s
+                for s in self._idle
+                if now - s.last_used_at >= self.idle_timeout_seconds
+            ]
+            self._idle = [s for s in self._idle if s not in expired]
+            self._stats.expired += len(expired)
+            if self._idle:
+                session = self._idle.pop()
+                self._stats.reused += 1
+        for expired_session in expired:
+            self._close(expired_session)
+        return session if session is not None else self._open()
+
+    def _release(self, session: _PooledSession[C]) -> None:
+        session.uses += 1
+        session.last_used_at = time.monotonic()
+        with self._lock:
+            self._idle.append(session)
+
+    def _open(self) -> _PooledSession[C]:
+        client = self.create_client()
+        context = client.session()
+        context.__enter__()
+        with self._lock:
+            self._stats.opened += 1
+        return _PooledSession(
+            client=client, context=context, last_used_at=time.monotonic()
+        )
+
+    def _close(self, session: _PooledSession[C]) -> None:
+        try:
+            session.context.__exit__(None, None, None)
+        except Exception:
+            logger.debug("Error closing Semantic Layer session", exc_info=True)
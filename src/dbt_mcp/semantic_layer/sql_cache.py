@@ -0,0 +1,147 @@
+import logging
+import sqlite3
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import ClassVar
+
+from dbt_mcp.cache.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the number of compiled queries kept, in memory and on disk
+MAX_ENTRIES = 4096
+
+_SCHEMA = """
+create table if not exists compiled_sql (
+    namespace text not null,
+    query text not null,
+    fingerprint text not null,
+    sql text not null,
+    created_at real not null,
+    primary key (namespace, query)
+)
+"""
+
+
+class CompiledSqlCache:
+    """Cache for the SQL that Semantic Layer queries compile to.
+
+    Entries are keyed by the canonical query and only match the semantic
+    manifest `fingerprint` they were compiled against, so SQL compiled
+    before the manifest changed is never served. Entries also expire after
+    `ttl_seconds`, since compiled SQL can change with parts of the project
+    that the fingerprint doesn't cover.
+
+    If `path` is set, entries are also written to a SQLite database there so
+    that they outlive the server process. `namespace` keeps the entries of
+    different environments sharing the database apart. The database is
+    optional: if it can't be used, the cache carries on in memory only.
+    """
+
+    _caches: ClassVar[weakref.WeakSet["CompiledSqlCache"]] = weakref.WeakSet()
+
+    def __init__(self, path: Path | None, namespace: str, ttl_seconds: float):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self._memory: LRUCache[tuple[str, str], str] = LRUCache(
+            max_entries=MAX_ENTRIES, ttl_seconds=ttl_seconds
+        )
+        # Used from the worker threads that compile queries
+        self._lock = threading.Lock()
+        self._path = path if ttl_seconds > 0 else None
+        self._db: sqlite3.Connection | None = None
+        self._connect()
+        CompiledSqlCache._caches.add(self)
+
+    def get(self, fingerprint: str, query: str) -> str | None:
+        with self._lock:
+            _, sql = self._memory.get((fingerprint, query))
+            if sql is not None:
+                return sql
+            row = self._execute(
+                "select sql, created_at from compiled_sql"
+                + " where namespace = ? and query = ? and fingerprint = ?"
+                + " and created_at > ?",
+                (self.namespace, query, fingerprint, time.time() - self.ttl_seconds),
+            )
+            if not row:
+                return None
+            sql, created_at = row[0]
+            self._memory.set(
+                (fingerprint, query),
+                sql,
+                ttl_seconds=created_at + self.ttl_seconds - time.time(),
+            )
+            return sql
+
+    def set(self, fingerprint: str, query: str, sql: str) -> None:
+        with self._lock:
+            self._memory.set((fingerprint, query), sql)
+            self._execute(
+                "insert or replace into compiled_sql values (?, ?, ?, ?, ?)",
+                (self.namespace, query, fingerprint, sql, time.time()),
+            )
+            # Drop the oldest entries beyond the bound, across namespaces
+            self._execute(
+                "delete from compiled_sql where rowid in (select rowid from"
+                + " compiled_sql order by created_at desc limit -1 offset ?)",
+                (MAX_ENTRIES,),
+            )
+
+    def retain(self, fingerprint: str) -> None:
+        """Drops the entries compiled against any other manifest."""
+        with self._lock:
+            # Entries in memory can't match another fingerprint, so they're
+            # left to expire
+            self._execute(
+                "delete from compiled_sql where namespace = ? and fingerprint != ?",
+                (self.namespace, fingerprint),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._execute(
+                "delete from compiled_sql where namespace = ?", (self.namespace,)
+            )
+
+    def close(self) -> None:
+        """Closes the database, which is opened again if the cache is used
+        afterwards."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    @classmethod
+    def close_all(cls) -> None:
+        for cache in list(cls._caches):
+            cache.close()
+
+    def _connect(self) -> None:
+        if self._path is None:
+            return
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self._path, check_same_thread=False)
+            self._db.execute(_SCHEMA)
+            self._db.commit()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Not persisting compiled SQL to {self._path}: {e}")
+            self._db = None
+            # Not tried again
+            self._path = None
+
+    def _execute(self, statement: str, parameters: tuple) -> list[tuple]:
+        if self._db is None:
+            self._connect()
+        if self._db is None:
+            return []
+        try:
+            with self._db:
+                return self._db.execute(statement, parameters).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Error using the compiled SQL database: {e}")
+            return []
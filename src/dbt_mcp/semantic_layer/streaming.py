@@ -0,0 +1,106 @@
+import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import pyarrow as pa
+from dbtsl.client.sync import SyncSemanticLayerClient
+
+logger = logging.getLogger(__name__)
+
+ResultStream = tuple[pa.Schema, Iterator[pa.RecordBatch]]
+
+
+def _get_adbc_internals(
+    sl_client: Any, compiler_name: str = "get_query_sql"
+) -> tuple[Any, Callable[[Exception], None], Callable[[Any], str]] | None:
+    """The ADBC connection, error handler and the `compiler_name` SQL
+    compiler of an SDK client.
+
+    These are internals of the SDK, so None is returned if any of them is
+    missing, so that queries fall back to the public API instead of failing.
+    """
+    if not isinstance(sl_client, SyncSemanticLayerClient):
+        return None
+    try:
+        from dbtsl.api.adbc.protocol import ADBCProtocol
+    except ImportError:
+        ADBCProtocol = None  # type: ignore[assignment,misc]
+    adbc = getattr(sl_client, "_adbc", None)
+    handle_error = getattr(adbc, "_handle_error", None)
+    compile_sql = getattr(ADBCProtocol, compiler_name, None)
+    try:
+        # Raises without an open session
+        conn = adbc._conn  # type: ignore[union-attr]
+    except (AttributeError, ValueError):
+        conn = None
+    if (
+        not hasattr(conn, "cursor")
+        or not callable(handle_error)
+        or not callable(compile_sql)
+    ):
+        logger.debug("Can't stream from the Semantic Layer SDK client, querying it")
+        return None
+    return conn, handle_error, compile_sql
+
+
+@contextmanager
+def _stream_sql(
+    conn: Any, handle_error: Callable[[Exception], None], sql: str
+) -> Iterator[ResultStream]:
+    with conn.cursor() as cursor:
+        try:
+            cursor.execute(sql)
+        except Exception as e:
+            # Raises the SDK's errors, like QueryFailedError
+            handle_error(e)
+        reader = cursor.fetch_record_batch()
+        try:
+            yield reader.schema, iter(reader)
+        finally:
+            reader.close()
+
+
+@contextmanager
+def stream_query(sl_client: Any, **query_params: Any) -> Iterator[ResultStream]:
+    """Runs a query and yields the schema and the batches of its result.
+
+    The SDK only returns whole tables, so for SDK clients the query is run on
+    the client's ADBC connection directly, and batches are read from the
+    server as they're iterated over. Leaving the context closes the stream,
+    which stops the server from sending the rest of the result. Other clients,
+    and SDK clients whose internals aren't as expected, are queried for a
+    whole table.
+    """
+    internals = _get_adbc_internals(sl_client)
+    if internals is None:
+        table: pa.Table = sl_client.query(**query_params)
+        yield table.schema, iter(table.to_batches())
+        return
+
+    conn, handle_error, get_query_sql = internals
+    with _stream_sql(conn, handle_error, get_query_sql(query_params)) as stream:
+        yield stream
+
+
+@contextmanager
+def stream_dimension_values(
+    sl_client: Any, metrics: list[str], group_by: str
+) -> Iterator[ResultStream]:
+    """Like `stream_query`, for the values of the `group_by` dimension."""
+    internals = _get_adbc_internals(sl_client, "get_dimension_values_sql")
+    if internals is None:
+        result = sl_client.dimension_values(metrics=metrics, group_by=group_by)
+        # The SDK is typed as returning a list, but returns a table
+        table = (
+            result
+            if isinstance(result, pa.Table)
+            else pa.table({group_by: pa.array(result)})
+        )
+        yield table.schema, iter(table.to_batches())
+        return
+
+    conn, handle_error, get_dimension_values_sql = internals
+    sql = get_dimension_values_sql({"metrics": metrics, "group_by": group_by})
+    with _stream_sql(conn, handle_error, sql) as stream:
+        yield stream
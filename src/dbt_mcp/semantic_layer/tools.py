@@ -1,5 +1,6 @@
+import json
 import logging
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 
 from dbtsl.api.shared.query_params import GroupByParam
 from dbtsl.client.sync import SyncSemanticLayerClient
@@ -7,19 +8,23 @@ from mcp.server.fastmcp import FastMCP
 
 from dbt_mcp.config.config import SemanticLayerConfig
 from dbt_mcp.prompts.prompts import get_prompt
+from dbt_mcp.results.serialization import ResultFormat, is_json
 from dbt_mcp.semantic_layer.client import (
     SemanticLayerClientProtocol,
     SemanticLayerFetcher,
 )
 from dbt_mcp.semantic_layer.types import (
     DimensionToolResponse,
+    DimensionValuesToolResponse,
     EntityToolResponse,
     GetMetricsCompiledSqlSuccess,
+    MetricQuery,
     MetricToolResponse,
     OrderByParam,
     QueryMetricsSuccess,
 )
 from dbt_mcp.tools.definitions import ToolDefinition
+from dbt_mcp.tools.executor import ToolExecutor
 from dbt_mcp.tools.register import register_tools
 from dbt_mcp.tools.tool_names import ToolName
 from dbt_mcp.tools.annotations import create_tool_annotations
@@ -28,45 +33,69 @@ logger = logging.getLogger(__name__)
 
 
 def create_sl_tool_definitions(
-    config: SemanticLayerConfig, sl_client: SemanticLayerClientProtocol
+    config: SemanticLayerConfig,
+    sl_client: SemanticLayerClientProtocol | None = None,
+    create_sl_client: Callable[[], SemanticLayerClientProtocol] | None = None,
+    tool_executor: ToolExecutor | None = None,
 ) -> list[ToolDefinition]:
     semantic_layer_fetcher = SemanticLayerFetcher(
         sl_client=sl_client,
         config=config,
+        create_sl_client=create_sl_client,
+        tool_executor=tool_executor,
     )
 
-    def list_metrics() -> list[MetricToolResponse] | str:
+    async def list_metrics() -> list[MetricToolResponse] | str:
+        try:
+            return await semantic_layer_fetcher.list_metrics()
+        except Exception as e:
+            return str(e)
+
+    async def get_dimensions(metrics: list[str]) -> list[DimensionToolResponse] | str:
         try:
-            return semantic_layer_fetcher.list_metrics()
+            return await semantic_layer_fetcher.get_dimensions(metrics=metrics)
         except Exception as e:
             return str(e)
 
-    def get_dimensions(metrics: list[str]) -> list[DimensionToolResponse] | str:
+    async def get_entities(metrics: list[str]) -> list[EntityToolResponse] | str:
         try:
-            return semantic_layer_fetcher.get_dimensions(metrics=metrics)
+            return await semantic_layer_fetcher.get_entities(metrics=metrics)
         except Exception as e:
             return str(e)
 
-    def get_entities(metrics: list[str]) -> list[EntityToolResponse] | str:
+    async def get_dimension_values(
+        metrics: list[str],
+        dimension: str,
+        prefix: str | None = None,
+        limit: int = 100,
+    ) -> DimensionValuesToolResponse | str:
         try:
-            return semantic_layer_fetcher.get_entities(metrics=metrics)
+            return await semantic_layer_fetcher.get_dimension_values(
+                metrics=metrics, dimension=dimension, prefix=prefix, limit=limit
+            )
         except Exception as e:
             return str(e)
 
-    def query_metrics(
+    async def query_metrics(
         metrics: list[str],
         group_by: list[GroupByParam] | None = None,
         order_by: list[OrderByParam] | None = None,
         where: str | None = None,
         limit: int | None = None,
+        page_size: int | None = None,
+        output_format: ResultFormat = ResultFormat.JSON,
+        use_cache: bool = True,
     ) -> str:
         try:
-            result = semantic_layer_fetcher.query_metrics(
+            result = await semantic_layer_fetcher.query_metrics(
                 metrics=metrics,
                 group_by=group_by,
                 order_by=order_by,
                 where=where,
                 limit=limit,
+                page_size=page_size,
+                output_format=output_format,
+                use_cache=use_cache,
             )
             if isinstance(result, QueryMetricsSuccess):
                 return result.result
@@ -75,7 +104,47 @@ def create_sl_tool_definitions(
         except Exception as e:
             return str(e)
 
-    def get_metrics_compiled_sql(
+    async def query_metrics_batch(
+        queries: list[MetricQuery],
+        output_format: ResultFormat = ResultFormat.JSON,
+        use_cache: bool = True,
+    ) -> str:
+        try:
+            results = await semantic_layer_fetcher.query_metrics_batch(
+                queries=queries,
+                output_format=output_format,
+                use_cache=use_cache,
+            )
+            # JSON results and pages, like those of truncated results, are
+            # already serialized, so they're spliced in as-is
+            return (
+                "["
+                + ",".join(
+                    (
+                        f'{{"result":{result.result}}}'
+                        if is_json(output_format) or result.is_page
+                        else f'{{"result":{json.dumps(result.result)}}}'
+                    )
+                    if isinstance(result, QueryMetricsSuccess)
+                    else json.dumps({"error": result.error})
+                    for result in results
+                )
+                + "]"
+            )
+        except Exception as e:
+            return str(e)
+
+    async def get_query_metrics_page(page_token: str) -> str:
+        try:
+            result = await semantic_layer_fetcher.get_query_metrics_page(page_token)
+            if isinstance(result, QueryMetricsSuccess):
+                return result.result
+            else:
+                return result.error
+        except Exception as e:
+            return str(e)
+
+    async def get_metrics_compiled_sql(
         metrics: list[str],
         group_by: list[GroupByParam] | None = None,
         order_by: list[OrderByParam] | None = None,
@@ -83,7 +152,7 @@ def create_sl_tool_definitions(
         limit: int | None = None,
     ) -> str:
         try:
-            result = semantic_layer_fetcher.get_metrics_compiled_sql(
+            result = await semantic_layer_fetcher.get_metrics_compiled_sql(
                 metrics=metrics,
                 group_by=group_by,
                 order_by=order_by,
@@ -128,6 +197,16 @@ def create_sl_tool_definitions(
                 idempotent_hint=True,
             ),
         ),
+        ToolDefinition(
+            description=get_prompt("semantic_layer/get_dimension_values"),
+            fn=get_dimension_values,
+            annotations=create_tool_annotations(
+                title="Get Dimension Values",
+                read_only_hint=True,
+                destructive_hint=False,
+                idempotent_hint=True,
+            ),
+        ),
         ToolDefinition(
             description=get_prompt("semantic_layer/query_metrics"),
             fn=query_metrics,
@@ -138,6 +217,26 @@ def create_sl_tool_definitions(
                 idempotent_hint=True,
             ),
         ),
+        ToolDefinition(
+            description=get_prompt("semantic_layer/query_metrics_batch"),
+            fn=query_metrics_batch,
+            annotations=create_tool_annotations(
+                title="Query Metrics Batch",
+                read_only_hint=True,
+                destructive_hint=False,
+                idempotent_hint=True,
+            ),
+        ),
+        ToolDefinition(
+            description=get_prompt("semantic_layer/get_query_metrics_page"),
+            fn=get_query_metrics_page,
+            annotations=create_tool_annotations(
+                title="Get Query Metrics Page",
+                read_only_hint=True,
+                destructive_hint=False,
+                idempotent_hint=True,
+            ),
+        ),
         ToolDefinition(
             description=get_prompt("semantic_layer/get_metrics_compiled_sql"),
             fn=get_metrics_compiled_sql,
@@ -155,16 +254,19 @@ def register_sl_tools(
     dbt_mcp: FastMCP,
     config: SemanticLayerConfig,
     exclude_tools: Sequence[ToolName] = [],
+    tool_executor: ToolExecutor | None = None,
 ) -> None:
+    def create_sl_client() -> SyncSemanticLayerClient:
+        return SyncSemanticLayerClient(
+            environment_id=config.prod_environment_id,
+            auth_token=config.service_token,
+            host=config.host,
+        )
+
     register_tools(
         dbt_mcp,
         create_sl_tool_definitions(
-            config,
-            SyncSemanticLayerClient(
-                environment_id=config.prod_environment_id,
-                auth_token=config.service_token,
-                host=config.host,
-            ),
+            config, create_sl_client=create_sl_client, tool_executor=tool_executor
         ),
         exclude_tools,
     )
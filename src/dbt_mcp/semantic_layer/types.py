@@ -1,5 +1,7 @@
 from dataclasses import dataclass
+from typing import Any
 
+from dbtsl.api.shared.query_params import GroupByParam
 from dbtsl.models.dimension import DimensionType
 from dbtsl.models.entity import EntityType
 from dbtsl.models.metric import MetricType
@@ -35,10 +37,31 @@ class EntityToolResponse:
     description: str | None = None
 
 
+@dataclass
+class DimensionValuesToolResponse:
+    values: list[Any]
+    # True if there are more matching values than were returned
+    has_more: bool
+    # True if the dimension has too many values to read them all, so that
+    # only the first values read were searched
+    truncated: bool = False
+
+
+@dataclass
+class MetricQuery:
+    metrics: list[str]
+    group_by: list[GroupByParam] | None = None
+    order_by: list[OrderByParam] | None = None
+    where: str | None = None
+    limit: int | None = None
+
+
 @dataclass
 class QueryMetricsSuccess:
     result: str
     error: None = None
+    # True if `result` is a JSON page of the rows, whatever their format
+    is_page: bool = False
 
 
 @dataclass
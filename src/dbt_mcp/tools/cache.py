@@ -0,0 +1,45 @@
+import json
+from typing import Any
+
+import pydantic_core
+
+from dbt_mcp.cache.lru import LRUCache
+from dbt_mcp.config.config import ToolCacheConfig
+from dbt_mcp.tools.toolsets import Toolset
+
+
+def get_cache_key(tool_name: str, arguments: dict[str, Any]) -> str:
+    """Builds a key that is the same for equivalent tool calls,
+    regardless of argument order."""
+    return json.dumps(
+        [tool_name, pydantic_core.to_jsonable_python(arguments)],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+
+
+def _get_size(value: Any) -> int:
+    return len(pydantic_core.to_json(value, fallback=str))
+
+
+class ToolCache(LRUCache[str, Any]):
+    """Cache for the results of read-only, idempotent tools.
+
+    Entries expire after their toolset's TTL and the cache is bounded by
+    the number of entries and the size of the serialized results.
+    """
+
+    def __init__(self, config: ToolCacheConfig):
+        super().__init__(
+            max_entries=config.max_entries,
+            ttl_seconds=config.ttl_seconds,
+            max_bytes=config.max_bytes,
+            size_of=_get_size,
+        )
+        self.config = config
+
+    def get_ttl(self, toolset: Toolset | None) -> float:
+        if toolset is None:
+            return self.config.ttl_seconds
+        return self.config.toolset_ttl_seconds.get(toolset, self.config.ttl_seconds)
@@ -0,0 +1,135 @@
+import asyncio
+import contextvars
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
+from dbt_mcp.config.config import ToolExecutionConfig
+from dbt_mcp.tools.toolsets import Toolset
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_POOL_NAME = "default"
+
+
+class ToolExecutorBusyError(Exception):
+    """Raised when a tool call is rejected because its toolset is saturated."""
+
+    pass
+
+
+class ToolExecutorShutdownError(Exception):
+    """Raised when a tool call is made after the executor was shut down."""
+
+    pass
+
+
+@dataclass
+class ToolPoolStats:
+    max_workers: int
+    running: int = 0
+    queued: int = 0
+    # Calls that returned
+    completed: int = 0
+    # Calls that raised or were cancelled
+    failed: int = 0
+    rejected: int = 0
+
+
+class _ToolPool:
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"dbt-mcp-{name}",
+        )
+        # Gate admission on the event loop so that queued calls can be counted
+        # and cancelled before they ever reach a worker thread.
+        self.semaphore = asyncio.Semaphore(max_workers)
+        self.stats = ToolPoolStats(max_workers=max_workers)
+
+
+class ToolExecutor:
+    """Runs synchronous tool functions on per-toolset thread pools.
+
+    Every toolset gets its own pool so that a slow call in one toolset
+    (e.g. `dbt build`) can't starve the workers of another.
+    """
+
+    def __init__(self, config: ToolExecutionConfig):
+        self.config = config
+        self._pools: dict[str, _ToolPool] = {}
+        self._is_shut_down = False
+
+    def _get_pool(self, toolset: Toolset | None) -> _ToolPool:
+        name = toolset.value if toolset else DEFAULT_POOL_NAME
+        if name not in self._pools:
+            max_workers = (
+                self.config.toolset_max_workers.get(toolset, self.config.max_workers)
+                if toolset
+                else self.config.max_workers
+            )
+            self._pools[name] = _ToolPool(name=name, max_workers=max(1, max_workers))
+        return self._pools[name]
+
+    async def run(self, toolset: Toolset | None, fn: Callable[[], T]) -> T:
+        self._check_not_shut_down()
+        pool = self._get_pool(toolset)
+        if pool.semaphore.locked():
+            if pool.stats.queued >= self.config.max_queued_calls:
+                pool.stats.rejected += 1
+                raise ToolExecutorBusyError(
+                    f"Too many concurrent calls for {pool.name} tools. "
+                    + "Please try again shortly."
+                )
+            logger.debug(
+                f"All {pool.stats.max_workers} {pool.name} workers are busy, "
+                + f"{pool.stats.queued + 1} calls queued"
+            )
+        pool.stats.queued += 1
+        try:
+            await pool.semaphore.acquire()
+        finally:
+            pool.stats.queued -= 1
+        pool.stats.running += 1
+        try:
+            # The executor may have been shut down while the call was queued
+            self._check_not_shut_down()
+            context = contextvars.copy_context()
+            result = await asyncio.get_running_loop().run_in_executor(
+                pool.executor, context.run, fn
+            )
+        except BaseException:
+            pool.stats.failed += 1
+            raise
+        else:
+            pool.stats.completed += 1
+            return result
+        finally:
+            pool.stats.running -= 1
+            pool.semaphore.release()
+
+    def get_stats(self) -> dict[str, ToolPoolStats]:
+        return {name: pool.stats for name, pool in self._pools.items()}
+
+    def _check_not_shut_down(self) -> None:
+        if self._is_shut_down:
+            raise ToolExecutorShutdownError(
+                "The server is shutting down, tool calls can't run anymore."
+            )
+
+    def reopen(self) -> None:
+        """Accepts calls again after a shutdown, on new pools."""
+        self._is_shut_down = False
+
+    def shutdown(self) -> None:
+        """Cancels queued calls. Calls made afterwards raise
+        ToolExecutorShutdownError instead of reaching a closed pool."""
+        self._is_shut_down = True
+        for pool in self._pools.values():
+            pool.executor.shutdown(wait=False, cancel_futures=True)
+        self._pools = {}
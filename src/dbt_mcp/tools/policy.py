@@ -63,9 +63,19 @@ tool_policies = {
     ToolName.GET_ENTITIES.value: ToolPolicy(
         name=ToolName.GET_ENTITIES.value, behavior=ToolBehavior.METADATA
     ),
+    # Dimension values are read from the warehouse
+    ToolName.GET_DIMENSION_VALUES.value: ToolPolicy(
+        name=ToolName.GET_DIMENSION_VALUES.value, behavior=ToolBehavior.RESULT_SET
+    ),
     ToolName.QUERY_METRICS.value: ToolPolicy(
         name=ToolName.QUERY_METRICS.value, behavior=ToolBehavior.RESULT_SET
     ),
+    ToolName.QUERY_METRICS_BATCH.value: ToolPolicy(
+        name=ToolName.QUERY_METRICS_BATCH.value, behavior=ToolBehavior.RESULT_SET
+    ),
+    ToolName.GET_QUERY_METRICS_PAGE.value: ToolPolicy(
+        name=ToolName.GET_QUERY_METRICS_PAGE.value, behavior=ToolBehavior.RESULT_SET
+    ),
     ToolName.GET_METRICS_COMPILED_SQL.value: ToolPolicy(
         name=ToolName.GET_METRICS_COMPILED_SQL.value, behavior=ToolBehavior.METADATA
     ),
@@ -76,12 +86,21 @@ tool_policies = {
     ToolName.GET_MODEL_CHILDREN.value: ToolPolicy(
         name=ToolName.GET_MODEL_CHILDREN.value, behavior=ToolBehavior.METADATA
     ),
+    ToolName.GET_MODEL_LINEAGE.value: ToolPolicy(
+        name=ToolName.GET_MODEL_LINEAGE.value, behavior=ToolBehavior.METADATA
+    ),
+    ToolName.GET_DOWNSTREAM_IMPACT.value: ToolPolicy(
+        name=ToolName.GET_DOWNSTREAM_IMPACT.value, behavior=ToolBehavior.METADATA
+    ),
     ToolName.GET_MODEL_DETAILS.value: ToolPolicy(
         name=ToolName.GET_MODEL_DETAILS.value, behavior=ToolBehavior.METADATA
     ),
     ToolName.GET_MODEL_HEALTH.value: ToolPolicy(
         name=ToolName.GET_MODEL_HEALTH.value, behavior=ToolBehavior.METADATA
     ),
+    ToolName.GET_MODEL_PROFILE.value: ToolPolicy(
+        name=ToolName.GET_MODEL_PROFILE.value, behavior=ToolBehavior.METADATA
+    ),
     ToolName.GET_MART_MODELS.value: ToolPolicy(
         name=ToolName.GET_MART_MODELS.value, behavior=ToolBehavior.METADATA
     ),
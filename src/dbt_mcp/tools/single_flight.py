@@ -0,0 +1,50 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    calls: int = 0
+    coalesced: int = 0
+    in_flight: int = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one execution.
+
+    The first call for a key starts the work and every call that arrives
+    while it is still running awaits the same result (or exception).
+    Nothing is kept once the work finishes, so results are never stale.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[str, asyncio.Task[Any]] = {}
+        self._stats = SingleFlightStats()
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        self._stats.calls += 1
+        task = self._in_flight.get(key)
+        if task is None:
+            # The work runs in its own task so that a cancelled caller
+            # doesn't cancel it for the other callers waiting on it.
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self._stats.coalesced += 1
+            logger.debug(f"Coalescing call with {key} into in-flight call")
+        return await asyncio.shield(task)
+
+    def get_stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            calls=self._stats.calls,
+            coalesced=self._stats.coalesced,
+            in_flight=len(self._in_flight),
+        )
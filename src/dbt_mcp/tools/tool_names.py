@@ -23,7 +23,10 @@ class ToolName(Enum):
     LIST_METRICS = "list_metrics"
     GET_DIMENSIONS = "get_dimensions"
     GET_ENTITIES = "get_entities"
+    GET_DIMENSION_VALUES = "get_dimension_values"
     QUERY_METRICS = "query_metrics"
+    QUERY_METRICS_BATCH = "query_metrics_batch"
+    GET_QUERY_METRICS_PAGE = "get_query_metrics_page"
     GET_METRICS_COMPILED_SQL = "get_metrics_compiled_sql"
 
     # Discovery tools
@@ -32,7 +35,10 @@ class ToolName(Enum):
     GET_MODEL_DETAILS = "get_model_details"
     GET_MODEL_PARENTS = "get_model_parents"
     GET_MODEL_CHILDREN = "get_model_children"
+    GET_MODEL_LINEAGE = "get_model_lineage"
+    GET_DOWNSTREAM_IMPACT = "get_downstream_impact"
     GET_MODEL_HEALTH = "get_model_health"
+    GET_MODEL_PROFILE = "get_model_profile"
 
     # SQL tools
     TEXT_TO_SQL = "text_to_sql"
@@ -20,7 +20,10 @@ toolsets = {
         ToolName.LIST_METRICS,
         ToolName.GET_DIMENSIONS,
         ToolName.GET_ENTITIES,
+        ToolName.GET_DIMENSION_VALUES,
         ToolName.QUERY_METRICS,
+        ToolName.GET_QUERY_METRICS_PAGE,
+        ToolName.QUERY_METRICS_BATCH,
         ToolName.GET_METRICS_COMPILED_SQL,
     },
     Toolset.DISCOVERY: {
@@ -29,7 +32,10 @@ toolsets = {
         ToolName.GET_MODEL_DETAILS,
         ToolName.GET_MODEL_PARENTS,
         ToolName.GET_MODEL_CHILDREN,
+        ToolName.GET_MODEL_LINEAGE,
+        ToolName.GET_DOWNSTREAM_IMPACT,
         ToolName.GET_MODEL_HEALTH,
+        ToolName.GET_MODEL_PROFILE,
     },
     Toolset.DBT_CLI: {
         ToolName.BUILD,
@@ -53,3 +59,10 @@ toolsets = {
         ToolName.GET_JOB_RUN_ARTIFACT,
     },
 }
+
+
+def get_toolset(tool_name: str) -> Toolset | None:
+    for toolset, tool_names in toolsets.items():
+        if tool_name in {t.value for t in tool_names}:
+            return toolset
+    return None
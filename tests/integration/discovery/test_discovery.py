@@ -30,8 +30,8 @@ def models_fetcher(api_client: MetadataAPIClient) -> ModelsFetcher:
     return ModelsFetcher(api_client=api_client, environment_id=int(environment_id))
 
 
-def test_fetch_models(models_fetcher: ModelsFetcher):
-    results = models_fetcher.fetch_models()
+async def test_fetch_models(models_fetcher: ModelsFetcher):
+    results = await models_fetcher.fetch_models()
 
     # Basic validation of the response
     assert isinstance(results, list)
@@ -52,67 +52,71 @@ def test_fetch_models(models_fetcher: ModelsFetcher):
                     assert "type" in column
 
 
-def test_fetch_models_with_filter(models_fetcher: ModelsFetcher):
+async def test_fetch_models_with_filter(models_fetcher: ModelsFetcher):
     # model_filter: ModelFilter = {"access": "protected"}
     model_filter: ModelFilter = {"modelingLayer": "marts"}
 
     # Fetch filtered results
-    filtered_results = models_fetcher.fetch_models(model_filter=model_filter)
+    filtered_results = await models_fetcher.fetch_models(model_filter=model_filter)
 
     # Validate filtered results
     assert len(filtered_results) > 0
 
 
-def test_fetch_model_details(models_fetcher: ModelsFetcher):
-    models = models_fetcher.fetch_models()
+async def test_fetch_model_details(models_fetcher: ModelsFetcher):
+    models = await models_fetcher.fetch_models()
     model_name = models[0]["name"]
 
     # Fetch filtered results
-    filtered_results = models_fetcher.fetch_model_details(model_name)
+    filtered_results = await models_fetcher.fetch_model_details(model_name)
 
     # Validate filtered results
     assert len(filtered_results) > 0
 
 
-def test_fetch_model_details_with_uniqueId(models_fetcher: ModelsFetcher):
-    models = models_fetcher.fetch_models()
+async def test_fetch_model_details_with_uniqueId(models_fetcher: ModelsFetcher):
+    models = await models_fetcher.fetch_models()
     model = models[0]
     model_name = model["name"]
     unique_id = model["uniqueId"]
 
     # Fetch by name
-    results_by_name = models_fetcher.fetch_model_details(model_name)
+    results_by_name = await models_fetcher.fetch_model_details(model_name)
 
     # Fetch by uniqueId
-    results_by_uniqueId = models_fetcher.fetch_model_details(model_name, unique_id)
+    results_by_uniqueId = await models_fetcher.fetch_model_details(
+        model_name, unique_id
+    )
 
     # Validate that both methods return the same result
     assert results_by_name["uniqueId"] == results_by_uniqueId["uniqueId"]
     assert results_by_name["name"] == results_by_uniqueId["name"]
 
 
-def test_fetch_model_parents(models_fetcher: ModelsFetcher):
-    models = models_fetcher.fetch_models()
+async def test_fetch_model_parents(models_fetcher: ModelsFetcher):
+    models = await models_fetcher.fetch_models()
     model_name = models[0]["name"]
 
     # Fetch filtered results
-    filtered_results = models_fetcher.fetch_model_parents(model_name)
+    filtered_results = await models_fetcher.fetch_model_parents(model_name)
 
     # Validate filtered results
     assert len(filtered_results) > 0
 
 
-def test_fetch_model_parents_with_uniqueId(models_fetcher: ModelsFetcher):
-    models = models_fetcher.fetch_models()
+async def test_fetch_model_parents_with_uniqueId(models_fetcher: ModelsFetcher):
+    models = await models_fetcher.fetch_models()
     model = models[0]
     model_name = model["name"]
     unique_id = model["uniqueId"]
 
     # Fetch by name
-    results_by_name = models_fetcher.fetch_model_parents(model_name)
+    results_by_name = await models_fetcher.fetch_model_parents(model_name)
 
     # Fetch by uniqueId
-    results_by_uniqueId = models_fetcher.fetch_model_parents(model_name, unique_id)
+    results_by_uniqueId = await models_fetcher.fetch_model_parents(
+        model_name, unique_id
+    )
 
     # Validate that both methods return the same result
     assert len(results_by_name) == len(results_by_uniqueId)
@@ -121,28 +125,30 @@ def test_fetch_model_parents_with_uniqueId(models_fetcher: ModelsFetcher):
         assert results_by_name[0]["name"] == results_by_uniqueId[0]["name"]
 
 
-def test_fetch_model_children(models_fetcher: ModelsFetcher):
-    models = models_fetcher.fetch_models()
+async def test_fetch_model_children(models_fetcher: ModelsFetcher):
+    models = await models_fetcher.fetch_models()
     model_name = models[0]["name"]
 
     # Fetch filtered results
-    filtered_results = models_fetcher.fetch_model_children(model_name)
+    filtered_results = await models_fetcher.fetch_model_children(model_name)
 
     # Validate filtered results
     assert isinstance(filtered_results, list)
 
 
-def test_fetch_model_children_with_uniqueId(models_fetcher: ModelsFetcher):
-    models = models_fetcher.fetch_models()
+async def test_fetch_model_children_with_uniqueId(models_fetcher: ModelsFetcher):
+    models = await models_fetcher.fetch_models()
     model = models[0]
     model_name = model["name"]
     unique_id = model["uniqueId"]
 
     # Fetch by name
-    results_by_name = models_fetcher.fetch_model_children(model_name)
+    results_by_name = await models_fetcher.fetch_model_children(model_name)
 
     # Fetch by uniqueId
-    results_by_uniqueId = models_fetcher.fetch_model_children(model_name, unique_id)
+    results_by_uniqueId = await models_fetcher.fetch_model_children(
+        model_name, unique_id
+    )
 
     # Validate that both methods return the same result
     assert len(results_by_name) == len(results_by_uniqueId)
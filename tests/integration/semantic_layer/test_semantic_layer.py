@@ -23,19 +23,25 @@ def semantic_layer_fetcher() -> SemanticLayerFetcher:
     )
 
 
-def test_semantic_layer_list_metrics(semantic_layer_fetcher: SemanticLayerFetcher):
-    metrics = semantic_layer_fetcher.list_metrics()
+async def test_semantic_layer_list_metrics(
+    semantic_layer_fetcher: SemanticLayerFetcher,
+):
+    metrics = await semantic_layer_fetcher.list_metrics()
     assert len(metrics) > 0
 
 
-def test_semantic_layer_list_dimensions(semantic_layer_fetcher: SemanticLayerFetcher):
-    metrics = semantic_layer_fetcher.list_metrics()
-    dimensions = semantic_layer_fetcher.get_dimensions(metrics=[metrics[0].name])
+async def test_semantic_layer_list_dimensions(
+    semantic_layer_fetcher: SemanticLayerFetcher,
+):
+    metrics = await semantic_layer_fetcher.list_metrics()
+    dimensions = await semantic_layer_fetcher.get_dimensions(metrics=[metrics[0].name])
     assert len(dimensions) > 0
 
 
-def test_semantic_layer_query_metrics(semantic_layer_fetcher: SemanticLayerFetcher):
-    result = semantic_layer_fetcher.query_metrics(
+async def test_semantic_layer_query_metrics(
+    semantic_layer_fetcher: SemanticLayerFetcher,
+):
+    result = await semantic_layer_fetcher.query_metrics(
         metrics=["revenue"],
         group_by=[
             GroupByParam(
@@ -48,10 +54,10 @@ def test_semantic_layer_query_metrics(semantic_layer_fetcher: SemanticLayerFetch
     assert result is not None
 
 
-def test_semantic_layer_query_metrics_invalid_query(
+async def test_semantic_layer_query_metrics_invalid_query(
     semantic_layer_fetcher: SemanticLayerFetcher,
 ):
-    result = semantic_layer_fetcher.query_metrics(
+    result = await semantic_layer_fetcher.query_metrics(
         metrics=["food_revenue"],
         group_by=[
             GroupByParam(
@@ -80,10 +86,10 @@ def test_semantic_layer_query_metrics_invalid_query(
     assert result is not None
 
 
-def test_semantic_layer_query_metrics_with_group_by_grain(
+async def test_semantic_layer_query_metrics_with_group_by_grain(
     semantic_layer_fetcher: SemanticLayerFetcher,
 ):
-    result = semantic_layer_fetcher.query_metrics(
+    result = await semantic_layer_fetcher.query_metrics(
         metrics=["revenue"],
         group_by=[
             GroupByParam(
@@ -96,10 +102,10 @@ def test_semantic_layer_query_metrics_with_group_by_grain(
     assert result is not None
 
 
-def test_semantic_layer_query_metrics_with_order_by(
+async def test_semantic_layer_query_metrics_with_order_by(
     semantic_layer_fetcher: SemanticLayerFetcher,
 ):
-    result = semantic_layer_fetcher.query_metrics(
+    result = await semantic_layer_fetcher.query_metrics(
         metrics=["revenue"],
         group_by=[
             GroupByParam(
@@ -113,16 +119,18 @@ def test_semantic_layer_query_metrics_with_order_by(
     assert result is not None
 
 
-def test_semantic_layer_query_metrics_with_misspellings(
+async def test_semantic_layer_query_metrics_with_misspellings(
     semantic_layer_fetcher: SemanticLayerFetcher,
 ):
-    result = semantic_layer_fetcher.query_metrics(["revehue"])
+    result = await semantic_layer_fetcher.query_metrics(["revehue"])
     assert result.result is not None
     assert "revenue" in result.result
 
 
-def test_semantic_layer_get_entities(semantic_layer_fetcher: SemanticLayerFetcher):
-    entities = semantic_layer_fetcher.get_entities(
+async def test_semantic_layer_get_entities(
+    semantic_layer_fetcher: SemanticLayerFetcher,
+):
+    entities = await semantic_layer_fetcher.get_entities(
         metrics=["count_dbt_copilot_requests"]
     )
     assert len(entities) > 0
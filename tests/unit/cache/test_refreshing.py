@@ -0,0 +1,82 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from dbt_mcp.cache.refreshing import RefreshingValue
+
+
+class Loader:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.fail = False
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> int:
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise ValueError("upstream unavailable")
+        return self.calls
+
+
+@pytest.fixture
+def clock():
+    with patch("dbt_mcp.cache.refreshing.time.monotonic", return_value=0) as clock:
+        yield clock
+
+
+async def test_first_get_loads_value_once(clock):
+    loader = Loader()
+    value = RefreshingValue(name="test", load=loader, ttl_seconds=60)
+    assert await asyncio.gather(value.get(), value.get()) == [1, 1]
+    assert await value.get() == 1
+    assert loader.calls == 1
+
+
+async def test_stale_value_is_served_while_refreshing(clock):
+    loader = Loader()
+    value = RefreshingValue(name="test", load=loader, ttl_seconds=60)
+    await value.get()
+
+    clock.return_value = 60
+    loader.release.clear()
+    assert await value.get() == 1
+    assert await value.get() == 1
+    loader.release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert await value.get() == 2
+    assert loader.calls == 2
+
+
+async def test_failed_refresh_keeps_stale_value(clock):
+    loader = Loader()
+    value = RefreshingValue(name="test", load=loader, ttl_seconds=60)
+    await value.get()
+
+    clock.return_value = 60
+    loader.fail = True
+    assert await value.get() == 1
+    await asyncio.sleep(0)
+    assert await value.get() == 1
+    assert value.is_stale
+
+
+async def test_invalidate_reloads_on_next_get(clock):
+    loader = Loader()
+    value = RefreshingValue(name="test", load=loader, ttl_seconds=60)
+    await value.get()
+    value.invalidate()
+    assert await value.get() == 2
+    assert await value.refresh() == 3
+
+
+async def test_get_nowait_loads_in_background(clock):
+    loader = Loader()
+    value = RefreshingValue(name="test", load=loader, ttl_seconds=60)
+    assert value.get_nowait() is None
+    await asyncio.sleep(0)
+    assert value.get_nowait() == 1
+    assert loader.calls == 1
@@ -9,6 +9,7 @@ from dbt_mcp.config.config import (
     load_config,
 )
 from dbt_mcp.tools.tool_names import ToolName
+from dbt_mcp.tools.toolsets import Toolset
 
 
 class TestDbtMcpSettings:
@@ -94,6 +95,41 @@ class TestDbtMcpSettings:
                 settings = DbtMcpSettings(_env_file=None)
                 assert settings.disable_tools == expected
 
+    def test_toolset_max_workers_parsing(self):
+        test_cases = [
+            ("", {Toolset.DBT_CLI: 1}),
+            ("discovery=4", {Toolset.DBT_CLI: 1, Toolset.DISCOVERY: 4}),
+            (
+                "dbt_cli=2, semantic_layer=16",
+                {Toolset.DBT_CLI: 2, Toolset.SEMANTIC_LAYER: 16},
+            ),
+        ]
+
+        for input_val, expected in test_cases:
+            with patch.dict(os.environ, {"DBT_MCP_TOOLSET_MAX_WORKERS": input_val}):
+                settings = DbtMcpSettings(_env_file=None)
+                assert settings.dbt_mcp_toolset_max_workers == expected
+
+        with patch.dict(os.environ, {"DBT_MCP_TOOLSET_MAX_WORKERS": "unknown=2"}):
+            with pytest.raises(ValueError):
+                DbtMcpSettings(_env_file=None)
+
+    def test_toolset_cache_ttl_parsing(self):
+        with patch.dict(
+            os.environ, {"DBT_MCP_TOOLSET_CACHE_TTL": "discovery=300, admin_api=5"}
+        ):
+            settings = DbtMcpSettings(_env_file=None)
+            assert settings.dbt_mcp_toolset_cache_ttl == {
+                Toolset.DBT_CLI: 0,
+                Toolset.ADMIN_API: 5,
+                Toolset.SQL: 0,
+                Toolset.DISCOVERY: 300,
+            }
+
+        with patch.dict(os.environ, {"DBT_MCP_TOOLSET_CACHE_TTL": "discovery=soon"}):
+            with pytest.raises(ValueError):
+                DbtMcpSettings(_env_file=None)
+
     def test_actual_host_property(self):
         with patch.dict(os.environ, {"DBT_HOST": "host1.com"}):
             settings = DbtMcpSettings(_env_file=None)
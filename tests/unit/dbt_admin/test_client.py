@@ -1,6 +1,6 @@
+import httpx
 import pytest
-import requests
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock
 
 from dbt_mcp.dbt_admin.client import (
     DbtAdminAPIClient,
@@ -28,13 +28,31 @@ def admin_config_with_prefix():
 
 
 @pytest.fixture
-def client(admin_config):
-    return DbtAdminAPIClient(admin_config)
+def http_client():
+    http_client = Mock(spec=httpx.AsyncClient)
+    http_client.request = AsyncMock()
+    http_client.get = AsyncMock()
+    return http_client
 
 
 @pytest.fixture
-def client_with_prefix(admin_config_with_prefix):
-    return DbtAdminAPIClient(admin_config_with_prefix)
+def mock_request(http_client):
+    return http_client.request
+
+
+@pytest.fixture
+def mock_get(http_client):
+    return http_client.get
+
+
+@pytest.fixture
+def client(admin_config, http_client):
+    return DbtAdminAPIClient(admin_config, http_client=http_client)
+
+
+@pytest.fixture
+def client_with_prefix(admin_config_with_prefix, http_client):
+    return DbtAdminAPIClient(admin_config_with_prefix, http_client=http_client)
 
 
 def test_client_initialization(client):
@@ -46,14 +64,13 @@ def test_client_initialization(client):
     assert client.headers["Accept"] == "application/json"
 
 
-@patch("requests.request")
-def test_make_request_success(mock_request, client):
+async def test_make_request_success(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {"data": "test"}
     mock_response.raise_for_status.return_value = None
     mock_request.return_value = mock_response
 
-    result = client._make_request("GET", "/test/endpoint")
+    result = await client._make_request("GET", "/test/endpoint")
 
     assert result == {"data": "test"}
     mock_request.assert_called_once_with(
@@ -61,20 +78,16 @@ def test_make_request_success(mock_request, client):
     )
 
 
-@patch("requests.request")
-def test_make_request_failure(mock_request, client):
+async def test_make_request_failure(mock_request, client):
     mock_response = Mock()
-    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
-        "404 Not Found"
-    )
+    mock_response.raise_for_status.side_effect = httpx.HTTPError("404 Not Found")
     mock_request.return_value = mock_response
 
     with pytest.raises(AdminAPIError):
-        client._make_request("GET", "/test/endpoint")
+        await client._make_request("GET", "/test/endpoint")
 
 
-@patch("requests.request")
-def test_list_jobs(mock_request, client):
+async def test_list_jobs(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {
         "data": [
@@ -105,7 +118,7 @@ def test_list_jobs(mock_request, client):
     mock_response.raise_for_status.return_value = None
     mock_request.return_value = mock_response
 
-    result = client.list_jobs(12345, project_id=1, limit=10)
+    result = await client.list_jobs(12345, project_id=1, limit=10)
 
     assert len(result) == 1
     assert result[0]["id"] == 1
@@ -121,8 +134,7 @@ def test_list_jobs(mock_request, client):
     )
 
 
-@patch("requests.request")
-def test_list_jobs_with_null_values(mock_request, client):
+async def test_list_jobs_with_null_values(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {
         "data": [
@@ -143,21 +155,20 @@ def test_list_jobs_with_null_values(mock_request, client):
     mock_response.raise_for_status.return_value = None
     mock_request.return_value = mock_response
 
-    result = client.list_jobs(12345)
+    result = await client.list_jobs(12345)
 
     assert len(result) == 1
     assert result[0]["most_recent_run_id"] is None
     assert result[0]["schedule"] is None
 
 
-@patch("requests.request")
-def test_get_job_details(mock_request, client):
+async def test_get_job_details(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {"data": {"id": 1, "name": "test_job"}}
     mock_response.raise_for_status.return_value = None
     mock_request.return_value = mock_response
 
-    result = client.get_job_details(12345, 1)
+    result = await client.get_job_details(12345, 1)
 
     assert result == {"id": 1, "name": "test_job"}
     mock_request.assert_called_once_with(
@@ -167,14 +178,13 @@ def test_get_job_details(mock_request, client):
     )
 
 
-@patch("requests.request")
-def test_trigger_job_run(mock_request, client):
+async def test_trigger_job_run(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {"data": {"id": 200, "status": "queued"}}
     mock_response.raise_for_status.return_value = None
     mock_request.return_value = mock_response
 
-    result = client.trigger_job_run(
+    result = await client.trigger_job_run(
         12345, 1, "Manual trigger", git_branch="main", schema_override="test_schema"
     )
 
@@ -191,8 +201,7 @@ def test_trigger_job_run(mock_request, client):
     )
 
 
-@patch("requests.request")
-def test_list_jobs_runs(mock_request, client):
+async def test_list_jobs_runs(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {
         "data": [
@@ -234,7 +243,7 @@ def test_list_jobs_runs(mock_request, client):
     mock_response.raise_for_status.return_value = None
     mock_request.return_value = mock_response
 
-    result = client.list_jobs_runs(12345, job_definition_id=1, status="success")
+    result = await client.list_jobs_runs(12345, job_definition_id=1, status="success")
 
     assert len(result) == 1
     run = result[0]
@@ -281,8 +290,7 @@ def test_list_jobs_runs(mock_request, client):
     )
 
 
-@patch("requests.request")
-def test_get_job_run_details_without_debug(mock_request, client):
+async def test_get_job_run_details_without_debug(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {
         "data": {
@@ -296,7 +304,7 @@ def test_get_job_run_details_without_debug(mock_request, client):
     mock_response.raise_for_status.return_value = None
     mock_request.return_value = mock_response
 
-    result = client.get_job_run_details(12345, 100, debug=False)
+    result = await client.get_job_run_details(12345, 100, debug=False)
 
     assert result["id"] == 100
     # Verify truncated_debug_logs are removed
@@ -309,8 +317,7 @@ def test_get_job_run_details_without_debug(mock_request, client):
     )
 
 
-@patch("requests.request")
-def test_get_job_run_details_with_debug(mock_request, client):
+async def test_get_job_run_details_with_debug(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {
         "data": {
@@ -324,7 +331,7 @@ def test_get_job_run_details_with_debug(mock_request, client):
     mock_response.raise_for_status.return_value = None
     mock_request.return_value = mock_response
 
-    _ = client.get_job_run_details(12345, 100, debug=True)
+    _ = await client.get_job_run_details(12345, 100, debug=True)
 
     mock_request.assert_called_once_with(
         "GET",
@@ -333,14 +340,13 @@ def test_get_job_run_details_with_debug(mock_request, client):
     )
 
 
-@patch("requests.request")
-def test_cancel_job_run(mock_request, client):
+async def test_cancel_job_run(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {"data": {"id": 100, "status": "cancelled"}}
     mock_response.raise_for_status.return_value = None
     mock_request.return_value = mock_response
 
-    result = client.cancel_job_run(12345, 100)
+    result = await client.cancel_job_run(12345, 100)
 
     assert result == {"id": 100, "status": "cancelled"}
     mock_request.assert_called_once_with(
@@ -350,14 +356,13 @@ def test_cancel_job_run(mock_request, client):
     )
 
 
-@patch("requests.request")
-def test_retry_job_run(mock_request, client):
+async def test_retry_job_run(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {"data": {"id": 101, "status": "queued"}}
     mock_response.raise_for_status.return_value = None
     mock_request.return_value = mock_response
 
-    result = client.retry_job_run(12345, 100)
+    result = await client.retry_job_run(12345, 100)
 
     assert result == {"id": 101, "status": "queued"}
     mock_request.assert_called_once_with(
@@ -367,8 +372,7 @@ def test_retry_job_run(mock_request, client):
     )
 
 
-@patch("requests.request")
-def test_list_job_run_artifacts(mock_request, client):
+async def test_list_job_run_artifacts(mock_request, client):
     mock_response = Mock()
     mock_response.json.return_value = {
         "data": [
@@ -382,7 +386,7 @@ def test_list_job_run_artifacts(mock_request, client):
     mock_response.raise_for_status.return_value = None
     mock_request.return_value = mock_response
 
-    result = client.list_job_run_artifacts(12345, 100)
+    result = await client.list_job_run_artifacts(12345, 100)
 
     # Should filter out compiled/ and run/ artifacts
     expected = ["manifest.json", "catalog.json", "sources.json"]
@@ -395,15 +399,14 @@ def test_list_job_run_artifacts(mock_request, client):
     )
 
 
-@patch("requests.get")
-def test_get_job_run_artifact_json(mock_get, client):
+async def test_get_job_run_artifact_json(mock_get, client):
     mock_response = Mock()
     mock_response.json.return_value = {"nodes": {"model.test": {}}}
     mock_response.headers = {"content-type": "application/json"}
     mock_response.raise_for_status.return_value = None
     mock_get.return_value = mock_response
 
-    result = client.get_job_run_artifact(12345, 100, "manifest.json", step=1)
+    result = await client.get_job_run_artifact(12345, 100, "manifest.json", step=1)
 
     # The client returns response.text, but the mock returns the mock_response.text which is a Mock object
     # In a real scenario with JSON content type, the API would return JSON as text
@@ -415,15 +418,14 @@ def test_get_job_run_artifact_json(mock_get, client):
     )
 
 
-@patch("requests.get")
-def test_get_job_run_artifact_text(mock_get, client):
+async def test_get_job_run_artifact_text(mock_get, client):
     mock_response = Mock()
     mock_response.text = "LOG DATA"
     mock_response.headers = {"content-type": "text/plain"}
     mock_response.raise_for_status.return_value = None
     mock_get.return_value = mock_response
 
-    result = client.get_job_run_artifact(12345, 100, "logs/dbt.log")
+    result = await client.get_job_run_artifact(12345, 100, "logs/dbt.log")
 
     assert result == "LOG DATA"
     mock_get.assert_called_once_with(
@@ -433,15 +435,14 @@ def test_get_job_run_artifact_text(mock_get, client):
     )
 
 
-@patch("requests.get")
-def test_get_job_run_artifact_no_step_param(mock_get, client):
+async def test_get_job_run_artifact_no_step_param(mock_get, client):
     mock_response = Mock()
     mock_response.text = "artifact content"
     mock_response.headers = {"content-type": "text/plain"}
     mock_response.raise_for_status.return_value = None
     mock_get.return_value = mock_response
 
-    client.get_job_run_artifact(12345, 100, "manifest.json")
+    await client.get_job_run_artifact(12345, 100, "manifest.json")
 
     mock_get.assert_called_once_with(
         "https://cloud.getdbt.com/api/v2/accounts/12345/runs/100/artifacts/manifest.json",
@@ -450,9 +451,8 @@ def test_get_job_run_artifact_no_step_param(mock_get, client):
     )
 
 
-@patch("requests.get")
-def test_get_job_run_artifact_request_exception(mock_get, client):
-    mock_get.side_effect = requests.exceptions.HTTPError("404 Not Found")
+async def test_get_job_run_artifact_request_exception(mock_get, client):
+    mock_get.side_effect = httpx.HTTPError("404 Not Found")
 
-    with pytest.raises(requests.exceptions.HTTPError):
-        client.get_job_run_artifact(12345, 100, "nonexistent.json")
+    with pytest.raises(httpx.HTTPError):
+        await client.get_job_run_artifact(12345, 100, "nonexistent.json")
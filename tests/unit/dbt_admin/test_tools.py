@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 
 from dbt_mcp.dbt_admin.tools import (
     register_admin_api_tools,
@@ -48,7 +48,7 @@ def mock_fastmcp():
 
 @pytest.fixture
 def mock_admin_client():
-    client = Mock()
+    client = AsyncMock()
     client.list_jobs.return_value = [
         {
             "id": 1,
@@ -133,7 +133,7 @@ def test_register_admin_api_tools_with_disabled_tools(
 
 
 @patch("dbt_mcp.dbt_admin.tools.get_prompt")
-def test_list_jobs_tool(mock_get_prompt, mock_config, mock_admin_client):
+async def test_list_jobs_tool(mock_get_prompt, mock_config, mock_admin_client):
     mock_get_prompt.return_value = "List jobs prompt"
 
     tool_definitions = create_admin_api_tool_definitions(
@@ -141,14 +141,14 @@ def test_list_jobs_tool(mock_get_prompt, mock_config, mock_admin_client):
     )
     list_jobs_tool = tool_definitions[0].fn  # First tool is list_jobs
 
-    result = list_jobs_tool(limit=10)
+    result = await list_jobs_tool(limit=10)
 
     assert isinstance(result, list)
     mock_admin_client.list_jobs.assert_called_once_with(12345, limit=10)
 
 
 @patch("dbt_mcp.dbt_admin.tools.get_prompt")
-def test_get_job_details_tool(mock_get_prompt, mock_config, mock_admin_client):
+async def test_get_job_details_tool(mock_get_prompt, mock_config, mock_admin_client):
     mock_get_prompt.return_value = "Get job prompt"
 
     tool_definitions = create_admin_api_tool_definitions(
@@ -156,14 +156,14 @@ def test_get_job_details_tool(mock_get_prompt, mock_config, mock_admin_client):
     )
     get_job_details_tool = tool_definitions[1].fn  # Second tool is get_job_details
 
-    result = get_job_details_tool(job_id=1)
+    result = await get_job_details_tool(job_id=1)
 
     assert isinstance(result, dict)
     mock_admin_client.get_job_details.assert_called_once_with(12345, 1)
 
 
 @patch("dbt_mcp.dbt_admin.tools.get_prompt")
-def test_trigger_job_run_tool(mock_get_prompt, mock_config, mock_admin_client):
+async def test_trigger_job_run_tool(mock_get_prompt, mock_config, mock_admin_client):
     mock_get_prompt.return_value = "Trigger job run prompt"
 
     tool_definitions = create_admin_api_tool_definitions(
@@ -171,7 +171,9 @@ def test_trigger_job_run_tool(mock_get_prompt, mock_config, mock_admin_client):
     )
     trigger_job_run_tool = tool_definitions[2].fn  # Third tool is trigger_job_run
 
-    result = trigger_job_run_tool(job_id=1, cause="Manual trigger", git_branch="main")
+    result = await trigger_job_run_tool(
+        job_id=1, cause="Manual trigger", git_branch="main"
+    )
 
     assert isinstance(result, dict)
     mock_admin_client.trigger_job_run.assert_called_once_with(
@@ -180,7 +182,7 @@ def test_trigger_job_run_tool(mock_get_prompt, mock_config, mock_admin_client):
 
 
 @patch("dbt_mcp.dbt_admin.tools.get_prompt")
-def test_list_jobs_runs_tool(mock_get_prompt, mock_config, mock_admin_client):
+async def test_list_jobs_runs_tool(mock_get_prompt, mock_config, mock_admin_client):
     mock_get_prompt.return_value = "List runs prompt"
 
     tool_definitions = create_admin_api_tool_definitions(
@@ -188,7 +190,7 @@ def test_list_jobs_runs_tool(mock_get_prompt, mock_config, mock_admin_client):
     )
     list_jobs_runs_tool = tool_definitions[3].fn  # Fourth tool is list_jobs_runs
 
-    result = list_jobs_runs_tool(job_id=1, status=JobRunStatus.SUCCESS, limit=5)
+    result = await list_jobs_runs_tool(job_id=1, status=JobRunStatus.SUCCESS, limit=5)
 
     assert isinstance(result, list)
     mock_admin_client.list_jobs_runs.assert_called_once_with(
@@ -197,7 +199,9 @@ def test_list_jobs_runs_tool(mock_get_prompt, mock_config, mock_admin_client):
 
 
 @patch("dbt_mcp.dbt_admin.tools.get_prompt")
-def test_get_job_run_details_tool(mock_get_prompt, mock_config, mock_admin_client):
+async def test_get_job_run_details_tool(
+    mock_get_prompt, mock_config, mock_admin_client
+):
     mock_get_prompt.return_value = "Get run prompt"
 
     tool_definitions = create_admin_api_tool_definitions(
@@ -207,7 +211,7 @@ def test_get_job_run_details_tool(mock_get_prompt, mock_config, mock_admin_clien
         4
     ].fn  # Fifth tool is get_job_run_details
 
-    result = get_job_run_details_tool(run_id=100, debug=True)
+    result = await get_job_run_details_tool(run_id=100, debug=True)
 
     assert isinstance(result, dict)
     mock_admin_client.get_job_run_details.assert_called_once_with(
@@ -216,7 +220,7 @@ def test_get_job_run_details_tool(mock_get_prompt, mock_config, mock_admin_clien
 
 
 @patch("dbt_mcp.dbt_admin.tools.get_prompt")
-def test_cancel_job_run_tool(mock_get_prompt, mock_config, mock_admin_client):
+async def test_cancel_job_run_tool(mock_get_prompt, mock_config, mock_admin_client):
     mock_get_prompt.return_value = "Cancel run prompt"
 
     tool_definitions = create_admin_api_tool_definitions(
@@ -224,14 +228,14 @@ def test_cancel_job_run_tool(mock_get_prompt, mock_config, mock_admin_client):
     )
     cancel_job_run_tool = tool_definitions[5].fn  # Sixth tool is cancel_job_run
 
-    result = cancel_job_run_tool(run_id=100)
+    result = await cancel_job_run_tool(run_id=100)
 
     assert isinstance(result, dict)
     mock_admin_client.cancel_job_run.assert_called_once_with(12345, 100)
 
 
 @patch("dbt_mcp.dbt_admin.tools.get_prompt")
-def test_retry_job_run_tool(mock_get_prompt, mock_config, mock_admin_client):
+async def test_retry_job_run_tool(mock_get_prompt, mock_config, mock_admin_client):
     mock_get_prompt.return_value = "Retry run prompt"
 
     tool_definitions = create_admin_api_tool_definitions(
@@ -239,14 +243,16 @@ def test_retry_job_run_tool(mock_get_prompt, mock_config, mock_admin_client):
     )
     retry_job_run_tool = tool_definitions[6].fn  # Seventh tool is retry_job_run
 
-    result = retry_job_run_tool(run_id=100)
+    result = await retry_job_run_tool(run_id=100)
 
     assert isinstance(result, dict)
     mock_admin_client.retry_job_run.assert_called_once_with(12345, 100)
 
 
 @patch("dbt_mcp.dbt_admin.tools.get_prompt")
-def test_list_job_run_artifacts_tool(mock_get_prompt, mock_config, mock_admin_client):
+async def test_list_job_run_artifacts_tool(
+    mock_get_prompt, mock_config, mock_admin_client
+):
     mock_get_prompt.return_value = "List run artifacts prompt"
 
     tool_definitions = create_admin_api_tool_definitions(
@@ -256,14 +262,16 @@ def test_list_job_run_artifacts_tool(mock_get_prompt, mock_config, mock_admin_cl
         7
     ].fn  # Eighth tool is list_job_run_artifacts
 
-    result = list_job_run_artifacts_tool(run_id=100)
+    result = await list_job_run_artifacts_tool(run_id=100)
 
     assert isinstance(result, list)
     mock_admin_client.list_job_run_artifacts.assert_called_once_with(12345, 100)
 
 
 @patch("dbt_mcp.dbt_admin.tools.get_prompt")
-def test_get_job_run_artifact_tool(mock_get_prompt, mock_config, mock_admin_client):
+async def test_get_job_run_artifact_tool(
+    mock_get_prompt, mock_config, mock_admin_client
+):
     mock_get_prompt.return_value = "Get run artifact prompt"
 
     tool_definitions = create_admin_api_tool_definitions(
@@ -273,7 +281,7 @@ def test_get_job_run_artifact_tool(mock_get_prompt, mock_config, mock_admin_clie
         8
     ].fn  # Ninth tool is get_job_run_artifact
 
-    result = get_job_run_artifact_tool(
+    result = await get_job_run_artifact_tool(
         run_id=100, artifact_path="manifest.json", step=1
     )
 
@@ -284,9 +292,9 @@ def test_get_job_run_artifact_tool(mock_get_prompt, mock_config, mock_admin_clie
 
 
 @patch("dbt_mcp.dbt_admin.tools.get_prompt")
-def test_tools_handle_exceptions(mock_get_prompt, mock_config):
+async def test_tools_handle_exceptions(mock_get_prompt, mock_config):
     mock_get_prompt.return_value = "Test prompt"
-    mock_admin_client = Mock()
+    mock_admin_client = AsyncMock()
     mock_admin_client.list_jobs.side_effect = Exception("API Error")
 
     tool_definitions = create_admin_api_tool_definitions(
@@ -294,14 +302,14 @@ def test_tools_handle_exceptions(mock_get_prompt, mock_config):
     )
     list_jobs_tool = tool_definitions[0].fn  # First tool is list_jobs
 
-    result = list_jobs_tool()
+    result = await list_jobs_tool()
 
     assert isinstance(result, str)
     assert "API Error" in result
 
 
 @patch("dbt_mcp.dbt_admin.tools.get_prompt")
-def test_tools_with_no_optional_parameters(
+async def test_tools_with_no_optional_parameters(
     mock_get_prompt, mock_config, mock_admin_client
 ):
     mock_get_prompt.return_value = "Test prompt"
@@ -312,19 +320,19 @@ def test_tools_with_no_optional_parameters(
 
     # Test list_jobs with no parameters
     list_jobs_tool = tool_definitions[0].fn
-    result = list_jobs_tool()
+    result = await list_jobs_tool()
     assert isinstance(result, list)
     mock_admin_client.list_jobs.assert_called_with(12345)
 
     # Test list_jobs_runs with no parameters
     list_jobs_runs_tool = tool_definitions[3].fn
-    result = list_jobs_runs_tool()
+    result = await list_jobs_runs_tool()
     assert isinstance(result, list)
     mock_admin_client.list_jobs_runs.assert_called_with(12345)
 
     # Test get_job_run_details with default debug parameter
     get_job_run_details_tool = tool_definitions[4].fn
-    result = get_job_run_details_tool(run_id=100)
+    result = await get_job_run_details_tool(run_id=100)
     assert isinstance(result, dict)
     # The debug parameter should be a Field object with default False
     call_args = mock_admin_client.get_job_run_details.call_args
@@ -335,7 +343,7 @@ def test_tools_with_no_optional_parameters(
 
 
 @patch("dbt_mcp.dbt_admin.tools.get_prompt")
-def test_trigger_job_run_with_all_optional_params(
+async def test_trigger_job_run_with_all_optional_params(
     mock_get_prompt, mock_config, mock_admin_client
 ):
     mock_get_prompt.return_value = "Trigger job run prompt"
@@ -345,7 +353,7 @@ def test_trigger_job_run_with_all_optional_params(
     )
     trigger_job_run_tool = tool_definitions[2].fn  # Third tool is trigger_job_run
 
-    result = trigger_job_run_tool(
+    result = await trigger_job_run_tool(
         job_id=1,
         cause="Manual trigger",
         git_branch="feature-branch",
@@ -1,9 +1,11 @@
+import json
 import subprocess
 
 import pytest
 from pytest import MonkeyPatch
 
 from dbt_mcp.dbt_cli.tools import register_dbt_cli_tools
+from dbt_mcp.results.serialization import ResultFormat
 from tests.mocks.config import mock_dbt_cli_config
 
 
@@ -308,3 +310,47 @@ def test_vars_not_added_when_none(monkeypatch: MonkeyPatch, mock_process, mock_f
     assert mock_calls
     args_list = mock_calls[0]
     assert "--vars" not in args_list
+
+
+@pytest.mark.parametrize(
+    "output_format,expected_output",
+    [
+        ("columnar", '{"columns":["id","status"],"data":[[1,2],["placed","shipped"]]}'),
+        ("csv", '"id","status"\n1,"placed"\n2,"shipped"\n'),
+    ],
+)
+def test_show_command_output_formats(
+    monkeypatch: MonkeyPatch, mock_fastmcp, output_format, expected_output
+):
+    class MockProcess:
+        def communicate(self, timeout=None):
+            rows = [{"id": 1, "status": "placed"}, {"id": 2, "status": "shipped"}]
+            return (
+                "12:00:00  Running with dbt=1.10.0\n"
+                + json.dumps({"show": rows}, indent=2),
+                None,
+            )
+
+    monkeypatch.setattr("subprocess.Popen", lambda args, **kwargs: MockProcess())
+    fastmcp, tools = mock_fastmcp
+    register_dbt_cli_tools(fastmcp, mock_dbt_cli_config)
+
+    output = tools["show"](
+        sql_query="select * from orders",
+        limit=2,
+        output_format=ResultFormat(output_format),
+    )
+    assert output == expected_output
+
+
+def test_show_command_errors_are_returned_as_is(
+    monkeypatch: MonkeyPatch, mock_process, mock_fastmcp
+):
+    monkeypatch.setattr("subprocess.Popen", lambda args, **kwargs: mock_process)
+    fastmcp, tools = mock_fastmcp
+    register_dbt_cli_tools(fastmcp, mock_dbt_cli_config)
+
+    output = tools["show"](
+        sql_query="select * from orders", limit=2, output_format=ResultFormat.CSV
+    )
+    assert output == "command output"
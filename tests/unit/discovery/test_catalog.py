@@ -0,0 +1,105 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from dbt_mcp.discovery.catalog import ModelCatalog
+
+
+def create_fetcher(last_updated_at: str | None = "2025-01-01T00:00:00Z") -> MagicMock:
+    fetcher = MagicMock()
+    fetcher.fetch_last_updated_at = AsyncMock(return_value=last_updated_at)
+    fetcher.fetch_models = AsyncMock(
+        side_effect=lambda model_filter=None: [
+            {"name": "orders", "filter": model_filter}
+        ]
+    )
+    return fetcher
+
+
+async def wait_for_refresh() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_models_are_crawled_once():
+    fetcher = create_fetcher()
+    catalog = ModelCatalog(fetcher, ttl_seconds=60, max_age_seconds=3600)
+
+    first = await catalog.get_models()
+    second = await catalog.get_models()
+
+    assert first is second
+    assert fetcher.fetch_models.await_count == 1
+
+
+async def test_filters_are_cataloged_separately():
+    fetcher = create_fetcher()
+    catalog = ModelCatalog(fetcher, ttl_seconds=60, max_age_seconds=3600)
+
+    marts = await catalog.get_models({"modelingLayer": "marts"})
+    everything = await catalog.get_models()
+
+    assert marts[0]["filter"] == {"modelingLayer": "marts"}
+    assert everything[0]["filter"] is None
+    assert fetcher.fetch_models.await_count == 2
+
+
+async def test_stale_models_are_kept_when_the_environment_is_unchanged():
+    fetcher = create_fetcher()
+    catalog = ModelCatalog(fetcher, ttl_seconds=0, max_age_seconds=3600)
+
+    await catalog.get_models()
+    await catalog.get_models()
+    await wait_for_refresh()
+
+    assert fetcher.fetch_models.await_count == 1
+    assert fetcher.fetch_last_updated_at.await_count == 2
+    assert catalog.get_stats().unchanged == 1
+
+
+async def test_stale_models_are_served_while_crawling_changes():
+    fetcher = create_fetcher()
+    catalog = ModelCatalog(fetcher, ttl_seconds=0, max_age_seconds=3600)
+    first = await catalog.get_models()
+
+    fetcher.fetch_last_updated_at.return_value = "2025-01-02T00:00:00Z"
+    fetcher.fetch_models.side_effect = lambda model_filter=None: [{"name": "new"}]
+    # Served from memory while the models are crawled in the background
+    assert await catalog.get_models() is first
+    await wait_for_refresh()
+
+    assert await catalog.get_models() == [{"name": "new"}]
+    assert catalog.get_stats().crawls == 2
+
+
+async def test_models_are_crawled_again_after_the_max_age():
+    fetcher = create_fetcher()
+    catalog = ModelCatalog(fetcher, ttl_seconds=0, max_age_seconds=0)
+
+    await catalog.get_models()
+    await catalog.get_models()
+    await wait_for_refresh()
+
+    assert fetcher.fetch_models.await_count == 2
+
+
+async def test_models_are_crawled_when_the_environment_check_fails():
+    fetcher = create_fetcher()
+    catalog = ModelCatalog(fetcher, ttl_seconds=0, max_age_seconds=3600)
+    await catalog.get_models()
+
+    fetcher.fetch_last_updated_at.side_effect = Exception("unavailable")
+    await catalog.get_models()
+    await wait_for_refresh()
+
+    assert fetcher.fetch_models.await_count == 2
+
+
+async def test_invalidate_crawls_again():
+    fetcher = create_fetcher()
+    catalog = ModelCatalog(fetcher, ttl_seconds=60, max_age_seconds=3600)
+
+    await catalog.get_models()
+    catalog.invalidate()
+    await catalog.get_models()
+
+    assert fetcher.fetch_models.await_count == 2
@@ -0,0 +1,222 @@
+import json
+from unittest.mock import patch
+
+import httpx
+
+from dbt_mcp.discovery.client import MetadataAPIClient, ModelsFetcher
+
+
+def models_page(names: list[str], end_cursor: str) -> dict:
+    return {
+        "data": {
+            "environment": {
+                "applied": {
+                    "models": {
+                        "pageInfo": {"endCursor": end_cursor},
+                        "edges": [
+                            {"node": {"name": n, "uniqueId": f"model.test.{n}"}}
+                            for n in names
+                        ],
+                    }
+                }
+            }
+        }
+    }
+
+
+async def test_fetch_models_reuses_client_across_pages():
+    requests: list[dict] = []
+    pages = {
+        "": models_page(["a", "b"], "cursor_1"),
+        "cursor_1": models_page(["c"], "cursor_2"),
+        "cursor_2": models_page([], "cursor_2"),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        assert request.headers["Authorization"] == "Bearer token"
+        return httpx.Response(200, json=pages[body["variables"]["after"]])
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        api_client = MetadataAPIClient(
+            url="https://metadata.test/graphql",
+            headers={"Authorization": "Bearer token"},
+            http_client=client,
+        )
+        fetcher = ModelsFetcher(api_client=api_client, environment_id=1)
+        models = await fetcher.fetch_models()
+
+    assert [m["name"] for m in models] == ["a", "b", "c"]
+    assert len(requests) == 3
+    assert all(r["variables"]["environmentId"] == 1 for r in requests)
+
+
+async def test_fetch_last_updated_at():
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        assert body["variables"] == {"environmentId": 1}
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "environment": {
+                        "applied": {"lastUpdatedAt": "2025-01-01T00:00:00Z"}
+                    }
+                }
+            },
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        api_client = MetadataAPIClient(
+            url="https://metadata.test/graphql",
+            headers={"Authorization": "Bearer token"},
+            http_client=client,
+        )
+        fetcher = ModelsFetcher(api_client=api_client, environment_id=1)
+        assert await fetcher.fetch_last_updated_at() == "2025-01-01T00:00:00Z"
+
+
+async def test_fetch_models_lineage_pages_through_all_models():
+    requests: list[dict] = []
+    pages = {
+        "": models_page(["a", "b"], "cursor_1"),
+        "cursor_1": models_page(["c"], "cursor_1"),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        return httpx.Response(200, json=pages[body["variables"]["after"]])
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        api_client = MetadataAPIClient(
+            url="https://metadata.test/graphql",
+            headers={"Authorization": "Bearer token"},
+            http_client=client,
+        )
+        fetcher = ModelsFetcher(api_client=api_client, environment_id=1)
+        models = await fetcher.fetch_models_lineage()
+
+    assert [m["name"] for m in models] == ["a", "b", "c"]
+    assert len(requests) == 2
+    assert "children" in requests[0]["query"]
+
+
+def batch_handler(requests: list[dict]):
+    models = {
+        "orders": {"uniqueId": "model.test.orders", "name": "orders"},
+        "customers": {"uniqueId": "model.test.customers", "name": "customers"},
+    }
+    by_unique_id = {m["uniqueId"]: m for m in models.values()}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        requests.append(body)
+        applied = {}
+        for key, model_filter in body["variables"].items():
+            if not key.startswith("filter"):
+                continue
+            if "uniqueIds" in model_filter:
+                nodes = [
+                    by_unique_id[u]
+                    for u in model_filter["uniqueIds"]
+                    if u in by_unique_id
+                ]
+            else:
+                nodes = [models[model_filter["identifier"]]]
+            parents = [{"name": "raw"}]
+            applied[key.replace("filter", "models")] = {
+                "edges": [{"node": n | {"parents": parents}} for n in nodes]
+            }
+        return httpx.Response(200, json={"data": {"environment": {"applied": applied}}})
+
+    return handler
+
+
+async def test_fetch_batch_looks_up_names_and_unique_ids_in_one_request():
+    requests: list[dict] = []
+    transport = httpx.MockTransport(batch_handler(requests))
+    async with httpx.AsyncClient(transport=transport) as client:
+        api_client = MetadataAPIClient(
+            url="https://metadata.test/graphql", headers={}, http_client=client
+        )
+        fetcher = ModelsFetcher(api_client=api_client, environment_id=1)
+        parents = await fetcher.fetch_model_parents_batch(
+            model_names=["orders"],
+            unique_ids=["model.test.customers", "model.test.missing"],
+        )
+
+    assert parents == {
+        "orders": [{"name": "raw"}],
+        "model.test.customers": [{"name": "raw"}],
+        "model.test.missing": [],
+    }
+    assert len(requests) == 1
+    assert "models1: models(filter: $filter1" in requests[0]["query"]
+    assert requests[0]["variables"]["first1"] == 2
+
+
+async def test_fetch_batch_respects_the_max_batch_size():
+    requests: list[dict] = []
+    transport = httpx.MockTransport(batch_handler(requests))
+    async with httpx.AsyncClient(transport=transport) as client:
+        api_client = MetadataAPIClient(
+            url="https://metadata.test/graphql", headers={}, http_client=client
+        )
+        fetcher = ModelsFetcher(api_client=api_client, environment_id=1)
+        with patch("dbt_mcp.discovery.client.MAX_BATCH_SIZE", 1):
+            details = await fetcher.fetch_model_details_batch(
+                model_names=["orders", "customers"]
+            )
+
+    assert [d["uniqueId"] for d in details.values()] == [
+        "model.test.orders",
+        "model.test.customers",
+    ]
+    assert len(requests) == 2
+
+
+async def test_fetch_model_profile_in_one_request():
+    requests: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        node = {
+            "name": "orders",
+            "uniqueId": "model.test.orders",
+            "description": None,
+            "parents": [{"name": "stg_orders", "description": None}],
+            "executionInfo": {"lastRunStatus": "success"},
+        }
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "environment": {"applied": {"models": {"edges": [{"node": node}]}}}
+                }
+            },
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        api_client = MetadataAPIClient(
+            url="https://metadata.test/graphql", headers={}, http_client=client
+        )
+        fetcher = ModelsFetcher(api_client=api_client, environment_id=1)
+        profile = await fetcher.fetch_model_profile(
+            unique_id="model.test.orders", sections=["parents", "health"]
+        )
+
+    assert profile == {
+        "name": "orders",
+        "uniqueId": "model.test.orders",
+        "parents": [{"name": "stg_orders"}],
+        "executionInfo": {"lastRunStatus": "success"},
+    }
+    assert len(requests) == 1
+    query = requests[0]["query"]
+    assert "parents" in query and "tests" in query
+    assert "children" not in query and "rawCode" not in query
+    assert requests[0]["variables"]["modelsFilter"] == {
+        "uniqueIds": ["model.test.orders"]
+    }
@@ -0,0 +1,142 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dbt_mcp.discovery.lineage import LineageGraph, ModelLineage
+
+
+def node(unique_id: str) -> dict:
+    resource_type, _, name = unique_id.split(".")
+    return {
+        "uniqueId": unique_id,
+        "resourceType": resource_type,
+        "name": name,
+        "description": f"The {name} {resource_type}",
+    }
+
+
+# source.raw_orders -> model.stg_orders -> model.orders -> exposure.dashboard
+#                                       \-> test.not_null_orders
+MODELS = [
+    node("model.p.stg_orders")
+    | {
+        "parents": [node("source.p.raw_orders")],
+        "children": [node("model.p.orders")],
+    },
+    node("model.p.orders")
+    | {
+        "parents": [node("model.p.stg_orders")],
+        "children": [node("exposure.p.dashboard"), node("test.p.not_null_orders")],
+    },
+]
+
+
+@pytest.fixture
+def graph() -> LineageGraph:
+    return LineageGraph(MODELS)
+
+
+def names(nodes: list[dict]) -> list[str]:
+    return [n["name"] for n in nodes]
+
+
+def test_parents_and_children(graph: LineageGraph):
+    orders = graph.find_model(model_name="orders")
+    assert orders is not None
+    assert graph.get_parents(orders) == [node("model.p.stg_orders")]
+    assert sorted(names(graph.get_children(orders))) == [
+        "dashboard",
+        "not_null_orders",
+    ]
+
+
+def test_edges_are_added_in_both_directions(graph: LineageGraph):
+    raw_orders = graph.find_model(unique_id="source.p.raw_orders")
+    assert raw_orders is not None
+    assert names(graph.get_children(raw_orders)) == ["stg_orders"]
+
+
+def test_traverse_descendants_closest_first(graph: LineageGraph):
+    stg_orders = graph.find_model(model_name="stg_orders")
+    assert stg_orders is not None
+    descendants = graph.traverse(stg_orders, "descendants")
+    assert [(n["name"], n["depth"]) for n in descendants][0] == ("orders", 1)
+    assert {n["name"] for n in descendants if n["depth"] == 2} == {
+        "dashboard",
+        "not_null_orders",
+    }
+
+
+def test_traverse_is_limited_by_depth(graph: LineageGraph):
+    stg_orders = graph.find_model(model_name="stg_orders")
+    assert stg_orders is not None
+    assert names(graph.traverse(stg_orders, "descendants", depth=1)) == ["orders"]
+
+
+def test_traverse_filters_resource_types_but_walks_through_them(
+    graph: LineageGraph,
+):
+    dashboard = graph.find_model(unique_id="exposure.p.dashboard")
+    assert dashboard is not None
+    ancestors = graph.traverse(dashboard, "ancestors", resource_types=["Source"])
+    assert ancestors == [node("source.p.raw_orders") | {"depth": 3}]
+
+
+def test_only_models_are_found_by_name(graph: LineageGraph):
+    assert graph.find_model(model_name="raw_orders") is None
+    with pytest.raises(ValueError):
+        graph.find_model()
+
+
+async def test_graph_is_kept_while_the_environment_is_unchanged():
+    fetcher = MagicMock()
+    fetcher.fetch_last_updated_at = AsyncMock(return_value="2025-01-01T00:00:00Z")
+    fetcher.fetch_models_lineage = AsyncMock(return_value=MODELS)
+    lineage = ModelLineage(fetcher, ttl_seconds=0)
+
+    assert lineage.get_graph_nowait() is None
+    first = await lineage.get_graph()
+    assert await lineage.get_graph() is first
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert fetcher.fetch_models_lineage.await_count == 1
+
+    fetcher.fetch_last_updated_at.return_value = "2025-01-02T00:00:00Z"
+    await lineage.graph.refresh()
+    assert fetcher.fetch_models_lineage.await_count == 2
+
+
+def test_downstream_impact():
+    models = [
+        MODELS[0] | {"executionInfo": {"executionTime": 2.0}},
+        MODELS[1] | {"executionInfo": {"executionTime": 5.5}},
+        node("model.p.customers")
+        | {"parents": [node("model.p.stg_orders")], "executionInfo": None},
+    ]
+    graph = LineageGraph(models)
+    stg_orders = graph.find_model(model_name="stg_orders")
+    orders = graph.find_model(model_name="orders")
+    assert stg_orders is not None and orders is not None
+
+    impact = graph.get_downstream_impact([stg_orders, orders])
+
+    assert impact["selected"] == ["model.p.stg_orders", "model.p.orders"]
+    assert impact["downstreamCounts"] == {"model": 1, "exposure": 1, "test": 1}
+    assert impact["exposures"] == [node("exposure.p.dashboard") | {"depth": 1}]
+    assert impact["executionTimeSeconds"] == 7.5
+    assert impact["modelsWithoutExecutionTime"] == 1
+    assert impact["slowestModels"] == [
+        {"uniqueId": "model.p.orders", "executionTimeSeconds": 5.5},
+        {"uniqueId": "model.p.stg_orders", "executionTimeSeconds": 2.0},
+    ]
+
+
+def test_edges_between_other_nodes_are_out_of_scope():
+    # The snapshot selects from the source directly, which no model reports
+    graph = LineageGraph(
+        [node("model.p.orders") | {"children": [node("snapshot.p.orders_snapshot")]}]
+    )
+    snapshot = graph.find_model(unique_id="snapshot.p.orders_snapshot")
+    assert snapshot is not None
+    assert names(graph.traverse(snapshot, "ancestors")) == ["orders"]
@@ -0,0 +1,72 @@
+import httpx
+import pytest
+
+from dbt_mcp.config.config import AdminApiConfig, HttpClientConfig
+from dbt_mcp.dbt_admin.client import DbtAdminAPIClient
+from dbt_mcp.http.client import HttpClientManager
+from dbt_mcp.mcp.server import DbtMCP, app_lifespan
+from dbt_mcp.tracking.tracking import UsageTracker
+from tests.mocks.config import mock_config
+
+
+@pytest.fixture(autouse=True)
+async def reset_clients():
+    yield
+    await HttpClientManager.close()
+    HttpClientManager.configure(HttpClientConfig())
+
+
+async def test_clients_are_shared_per_host():
+    discovery = HttpClientManager.get_client("https://metadata.test.com/graphql")
+    assert HttpClientManager.get_client("https://metadata.test.com/other") is discovery
+    assert HttpClientManager.get_client("https://test.com/api/v2") is not discovery
+
+
+async def test_clients_use_configured_limits():
+    HttpClientManager.configure(
+        HttpClientConfig(max_connections=3, timeout=5.0, connect_timeout=1.0)
+    )
+    client = HttpClientManager.get_client("https://test.com")
+    assert client.timeout.read == 5.0
+    assert client.timeout.connect == 1.0
+    pool = client._transport._pool  # type: ignore[attr-defined]
+    assert pool._max_connections == 3
+
+
+async def test_close_closes_all_clients():
+    first = HttpClientManager.get_client("https://a.test.com")
+    second = HttpClientManager.get_client("https://b.test.com")
+    await HttpClientManager.close()
+    assert first.is_closed
+    assert second.is_closed
+    assert not HttpClientManager.get_client("https://a.test.com").is_closed
+
+
+async def test_clients_are_closed_when_last_lifespan_exits():
+    dbt_mcp = DbtMCP(config=mock_config, usage_tracker=UsageTracker(), name="dbt")
+    async with app_lifespan(dbt_mcp):
+        async with app_lifespan(dbt_mcp):
+            client = HttpClientManager.get_client("https://test.com")
+        assert not client.is_closed
+    assert client.is_closed
+
+
+async def test_redirects_are_followed():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/artifacts/manifest.json"):
+            return httpx.Response(
+                302, headers={"Location": "https://artifacts.test.com/signed"}
+            )
+        return httpx.Response(200, text="{}")
+
+    client = HttpClientManager.get_client("https://test.com")
+    client._transport = httpx.MockTransport(handler)
+    admin_client = DbtAdminAPIClient(
+        AdminApiConfig(account_id=1, token="token", url="https://test.com")
+    )
+
+    artifact = await admin_client.get_job_run_artifact(
+        account_id=1, run_id=2, artifact_path="manifest.json"
+    )
+
+    assert artifact == "{}"
@@ -0,0 +1,47 @@
+import pyarrow as pa
+import pytest
+
+from dbt_mcp.results.budget import ResultBudget, ResultBudgetExceededError
+
+table = pa.table({"order_id": list(range(10))})
+
+
+def batches():
+    yield from table.to_batches(max_chunksize=4)
+
+
+def test_results_within_budget_are_read_in_full():
+    budget = ResultBudget(max_bytes=1024, max_rows=10)
+    result = budget.read(table.schema, batches())
+    assert result.table.equals(table)
+    assert result.truncated is False
+    assert budget.get_stats().peak_bytes == table.nbytes
+
+
+def test_reading_stops_once_over_budget():
+    read = []
+
+    def tracked_batches():
+        for batch in batches():
+            read.append(batch)
+            yield batch
+
+    budget = ResultBudget(max_bytes=1024, max_rows=5)
+    with pytest.raises(ResultBudgetExceededError, match="more than 5 rows"):
+        budget.read(table.schema, tracked_batches())
+    # The last batch was never fetched
+    assert len(read) == 2
+    assert budget.get_stats().aborted == 1
+
+
+def test_results_over_budget_can_be_truncated():
+    budget = ResultBudget(max_bytes=1024, max_rows=5, truncate=True)
+    result = budget.read(table.schema, batches())
+    assert result.table.column("order_id").to_pylist() == [0, 1, 2, 3, 4]
+    assert result.truncated is True
+
+    # 8 bytes per row
+    budget = ResultBudget(max_bytes=50, max_rows=10, truncate=True)
+    result = budget.read(table.schema, batches())
+    assert result.table.num_rows == 6
+    assert budget.get_stats().truncated == 1
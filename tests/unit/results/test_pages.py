@@ -0,0 +1,63 @@
+import json
+from unittest.mock import patch
+
+import pyarrow as pa
+import pytest
+
+from dbt_mcp.results.pages import ResultPageError, ResultPageStore
+
+table = pa.table({"order_id": list(range(5)), "status": ["completed"] * 5})
+
+
+def test_results_are_read_page_by_page():
+    store = ResultPageStore(max_age_seconds=60, max_bytes=1024 * 1024)
+    page = json.loads(store.first_page(table, page_size=2).to_json())
+    order_ids = [row["order_id"] for row in page["rows"]]
+    assert page["total_rows"] == 5
+    while page["next_page_token"]:
+        page = json.loads(store.get_page(page["next_page_token"]).to_json())
+        order_ids += [row["order_id"] for row in page["rows"]]
+    assert order_ids == [0, 1, 2, 3, 4]
+
+
+def test_small_results_are_not_kept():
+    store = ResultPageStore(max_age_seconds=60, max_bytes=1024 * 1024)
+    page = store.first_page(table, page_size=5)
+    assert page.next_page_token is None
+    assert store.get_stats().entries == 0
+
+
+def test_results_expire():
+    with patch("dbt_mcp.cache.lru.time.monotonic", return_value=0) as clock:
+        store = ResultPageStore(max_age_seconds=60, max_bytes=1024 * 1024)
+        page = store.first_page(table, page_size=2)
+        assert page.next_page_token is not None
+        clock.return_value = 60
+        with pytest.raises(ResultPageError, match="expired"):
+            store.get_page(page.next_page_token)
+
+
+def test_oldest_results_are_evicted_by_size():
+    store = ResultPageStore(max_age_seconds=60, max_bytes=int(table.nbytes * 1.5))
+    first = store.first_page(table, page_size=2)
+    second = store.first_page(table, page_size=2)
+    assert first.next_page_token is not None
+    assert second.next_page_token is not None
+    with pytest.raises(ResultPageError):
+        store.get_page(first.next_page_token)
+    assert store.get_page(second.next_page_token).rows
+
+
+def test_results_too_large_to_keep_are_truncated():
+    store = ResultPageStore(max_age_seconds=60, max_bytes=table.nbytes - 1)
+    page = json.loads(store.first_page(table, page_size=2).to_json())
+    assert len(page["rows"]) == 2
+    assert page["next_page_token"] is None
+    assert page["truncated"]
+
+
+@pytest.mark.parametrize("page_token", ["garbage", "abc:-1:2", "abc:0:0"])
+def test_invalid_page_tokens(page_token):
+    store = ResultPageStore(max_age_seconds=60, max_bytes=1024 * 1024)
+    with pytest.raises(ResultPageError, match="Invalid page token"):
+        store.get_page(page_token)
@@ -0,0 +1,87 @@
+import base64
+import datetime
+import decimal
+import json
+
+import pyarrow as pa
+
+from dbt_mcp.results import serialization
+from dbt_mcp.results.serialization import ResultFormat, serialize_table
+
+table = pa.table(
+    {
+        "metric_time": pa.array(
+            [datetime.datetime(2024, 1, 1, 12, 30), None], pa.timestamp("us")
+        ),
+        "order_date": pa.array([datetime.date(2024, 1, 2), None]),
+        "revenue": pa.array([decimal.Decimal("1.25"), None]),
+        "margin": [float("nan"), 0.5],
+        "status": ['completed "ok"', "returned"],
+        "orders": [3, None],
+    }
+)
+
+
+def test_json_records():
+    result = serialize_table(table, ResultFormat.JSON)
+    assert json.loads(result) == [
+        {
+            "metric_time": "2024-01-01 12:30:00.000000",
+            "order_date": "2024-01-02",
+            "revenue": 1.25,
+            "margin": None,
+            "status": 'completed "ok"',
+            "orders": 3,
+        },
+        {
+            "metric_time": None,
+            "order_date": None,
+            "revenue": None,
+            "margin": 0.5,
+            "status": "returned",
+            "orders": None,
+        },
+    ]
+    # Compact, without indentation
+    assert "\n" not in result
+    assert ", " not in result.replace('completed "ok"', "")
+
+
+def test_json_records_are_written_across_batches(monkeypatch):
+    monkeypatch.setattr(serialization, "BATCH_ROWS", 3)
+    tall = pa.table({"n": list(range(10))})
+    assert json.loads(serialize_table(tall, ResultFormat.JSON)) == [
+        {"n": n} for n in range(10)
+    ]
+    assert serialize_table(tall.slice(0, 0), ResultFormat.JSON) == "[]"
+
+
+def test_csv():
+    result = serialize_table(table.select(["status", "orders"]), ResultFormat.CSV)
+    assert result.splitlines() == [
+        '"status","orders"',
+        '"completed ""ok""",3',
+        '"returned",',
+    ]
+
+
+def test_json_columns():
+    result = serialize_table(table.select(["status", "orders"]), ResultFormat.COLUMNAR)
+    assert json.loads(result) == {
+        "columns": ["status", "orders"],
+        "data": [['completed "ok"', "returned"], [3, None]],
+    }
+
+
+def test_json_columns_are_written_across_chunks():
+    chunked = pa.concat_tables([pa.table({"n": [1, 2]}), pa.table({"n": [3]})])
+    assert serialize_table(chunked, ResultFormat.COLUMNAR) == (
+        '{"columns":["n"],"data":[[1,2,3]]}'
+    )
+
+
+def test_arrow_ipc():
+    # NaN doesn't equal itself, so the margin column is left out
+    exact = table.drop_columns(["margin"])
+    result = serialize_table(exact, ResultFormat.ARROW)
+    assert pa.ipc.open_stream(base64.b64decode(result)).read_all().equals(exact)
@@ -0,0 +1,149 @@
+import json
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from dbt_mcp.semantic_layer.client import SemanticLayerFetcher
+from tests.mocks.config import mock_semantic_layer_config
+
+
+def dimension(name: str, granularities: list[str] | None = None) -> dict:
+    return {
+        "name": name,
+        "type": "TIME" if granularities else "CATEGORICAL",
+        "description": None,
+        "label": None,
+        "queryableGranularities": granularities or [],
+        "queryableTimeGranularities": [],
+    }
+
+
+def entity(name: str) -> dict:
+    return {"name": name, "type": "PRIMARY", "description": None}
+
+
+class MockSemanticLayerAPI:
+    """Answers Semantic Layer GraphQL requests from in-memory metadata."""
+
+    def __init__(self) -> None:
+        self.metrics: list[dict[str, Any]] = [
+            {
+                "name": "revenue",
+                "type": "SIMPLE",
+                "label": None,
+                "description": None,
+                "measures": [{"agg": "SUM"}],
+            },
+            {
+                "name": "orders",
+                "type": "SIMPLE",
+                "label": None,
+                "description": None,
+                "measures": [{"agg": "COUNT"}],
+            },
+        ]
+        self.dimensions = {
+            "revenue": [
+                dimension("order__status"),
+                dimension("metric_time", ["DAY", "WEEK", "MONTH", "YEAR"]),
+            ],
+            "orders": [
+                dimension("order__status"),
+                dimension("order__channel"),
+                dimension("metric_time", ["WEEK", "MONTH"]),
+            ],
+        }
+        self.entities = {
+            "revenue": [entity("order"), entity("customer")],
+            "orders": [entity("order")],
+        }
+        self.requests: list[dict] = []
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        self.requests.append(payload)
+        if "GetMetrics" in payload["query"]:
+            catalog = [
+                {
+                    **m,
+                    "dimensions": self.dimensions.get(m["name"], []),
+                    "entities": self.entities.get(m["name"], []),
+                }
+                for m in self.metrics
+            ]
+            return httpx.Response(200, json={"data": {"metrics": catalog}})
+        metrics = [m["name"] for m in payload["variables"].get("metrics", [])]
+        unknown = [m for m in metrics if m not in self.dimensions]
+        if unknown:
+            return httpx.Response(
+                200, json={"errors": [{"message": f"Unknown metrics: {unknown}"}]}
+            )
+        if "GetDimensionsAndEntities" in payload["query"]:
+            return httpx.Response(
+                200,
+                json={
+                    "data": {
+                        "dimensions": self.shared(self.dimensions, metrics),
+                        "entities": self.shared(self.entities, metrics),
+                    }
+                },
+            )
+        if "GetDimensions" in payload["query"]:
+            return httpx.Response(
+                200,
+                json={"data": {"dimensions": self.shared(self.dimensions, metrics)}},
+            )
+        if "GetEntities" in payload["query"]:
+            return httpx.Response(
+                200, json={"data": {"entities": self.shared(self.entities, metrics)}}
+            )
+        raise AssertionError(f"Unexpected query: {payload['query']}")
+
+    @staticmethod
+    def shared(group_bys: dict[str, list[dict]], metrics: list[str]) -> list[dict]:
+        result = []
+        for group_by in group_bys[metrics[0]]:
+            matches = [
+                g
+                for m in metrics
+                for g in group_bys[m]
+                if g["name"] == group_by["name"]
+            ]
+            if len(matches) < len(metrics):
+                continue
+            grains = [
+                grain
+                for grain in group_by.get("queryableGranularities", [])
+                if all(grain in g["queryableGranularities"] for g in matches)
+            ]
+            if "queryableGranularities" in group_by:
+                if group_by["queryableGranularities"] and not grains:
+                    continue
+                group_by = {**group_by, "queryableGranularities": grains}
+            result.append(group_by)
+        return result
+
+    def count(self, operation: str) -> int:
+        return sum(f"query {operation}(" in r["query"] for r in self.requests)
+
+
+@pytest.fixture
+def sl_api() -> MockSemanticLayerAPI:
+    return MockSemanticLayerAPI()
+
+
+@pytest.fixture
+def make_fetcher(
+    sl_api: MockSemanticLayerAPI,
+) -> Callable[..., SemanticLayerFetcher]:
+    def make(**config_overrides) -> SemanticLayerFetcher:
+        return SemanticLayerFetcher(
+            sl_client=MagicMock(),
+            config=mock_semantic_layer_config.model_copy(update=config_overrides),
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(sl_api.handle)),
+        )
+
+    return make
@@ -0,0 +1,480 @@
+import datetime
+import json
+import threading
+from dataclasses import replace
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pyarrow as pa
+import pytest
+from dbtsl.api.shared.query_params import GroupByParam, GroupByType
+
+from dbt_mcp.config.config import ToolExecutionConfig
+from dbt_mcp.results.serialization import ResultFormat
+from dbt_mcp.semantic_layer.client import SemanticLayerFetcher
+from dbt_mcp.semantic_layer.types import (
+    MetricQuery,
+    OrderByParam,
+    QueryMetricsSuccess,
+)
+from dbt_mcp.tools.executor import ToolExecutor
+from tests.mocks.config import mock_semantic_layer_config
+
+
+async def test_list_metrics_is_served_from_catalog(make_fetcher, sl_api):
+    fetcher = make_fetcher()
+    assert [m.name for m in await fetcher.list_metrics()] == ["revenue", "orders"]
+    await fetcher.list_metrics()
+    assert sl_api.count("GetMetrics") == 1
+
+
+async def test_expired_catalog_is_refreshed_in_background(make_fetcher, sl_api):
+    with patch("dbt_mcp.cache.refreshing.time.monotonic", return_value=0) as clock:
+        fetcher = make_fetcher(catalog_ttl_seconds=60)
+        await fetcher.list_metrics()
+        sl_api.metrics.append(
+            {"name": "margin", "type": "DERIVED", "label": None, "description": None}
+        )
+
+        clock.return_value = 60
+        # The stale catalog is served while it's being refreshed
+        assert len(await fetcher.list_metrics()) == 2
+        # Wait for the in-flight refresh
+        await fetcher.metrics_catalog.refresh()
+        assert len(await fetcher.list_metrics()) == 3
+        assert sl_api.count("GetMetrics") == 2
+
+
+async def test_invalidate_catalog(make_fetcher, sl_api):
+    fetcher = make_fetcher()
+    await fetcher.list_metrics()
+    sl_api.metrics.pop()
+    await fetcher.invalidate_catalog()
+    assert [m.name for m in await fetcher.list_metrics()] == ["revenue"]
+
+
+async def test_multi_metric_dimensions_are_intersected_from_cache(make_fetcher, sl_api):
+    fetcher = make_fetcher()
+    await fetcher.get_dimensions(["revenue"])
+    await fetcher.get_dimensions(["orders"])
+    dimensions = await fetcher.get_dimensions(["orders", "revenue"])
+    assert [(d.name, d.granularities) for d in dimensions] == [
+        ("order__status", []),
+        ("metric_time", ["WEEK", "MONTH"]),
+    ]
+    assert sl_api.count("GetDimensionsAndEntities") == 2
+    assert [d.name for d in dimensions] == [
+        d["name"] for d in sl_api.shared(sl_api.dimensions, ["orders", "revenue"])
+    ]
+
+
+async def test_only_missing_metrics_are_fetched(make_fetcher, sl_api):
+    fetcher = make_fetcher()
+    await fetcher.get_entities(["revenue"])
+    entities = await fetcher.get_entities(["revenue", "orders"])
+    assert [e.name for e in entities] == ["order"]
+    requests = [r for r in sl_api.requests if "GetDimensionsAndEntities" in r["query"]]
+    assert [r["variables"]["metrics"] for r in requests] == [
+        [{"name": "revenue"}],
+        [{"name": "orders"}],
+    ]
+
+
+async def test_unknown_metrics_fall_back_to_server(make_fetcher, sl_api):
+    fetcher = make_fetcher()
+    with pytest.raises(Exception, match="Unknown metrics"):
+        await fetcher.get_dimensions(["revenue", "missing"])
+    assert fetcher.dimensions_cache.get_stats().entries == 0
+
+
+async def test_dimensions_cache_is_bounded(make_fetcher, sl_api):
+    fetcher = make_fetcher(metadata_cache_max_entries=1)
+    await fetcher.get_dimensions(["revenue"])
+    await fetcher.get_dimensions(["orders"])
+    await fetcher.get_dimensions(["revenue"])
+    assert sl_api.count("GetDimensionsAndEntities") == 3
+    assert fetcher.dimensions_cache.get_stats().entries == 1
+
+
+async def test_dimensions_and_entities_are_fetched_together(make_fetcher, sl_api):
+    fetcher = make_fetcher()
+    dimensions = await fetcher.get_dimensions(["revenue"])
+    entities = await fetcher.get_entities(["revenue"])
+
+    assert [d.name for d in dimensions] == ["order__status", "metric_time"]
+    assert [e.name for e in entities] == ["order", "customer"]
+    # Both caches were filled from the one response
+    assert sl_api.count("GetDimensionsAndEntities") == 1
+    assert sl_api.count("GetDimensions") == 0
+    assert sl_api.count("GetEntities") == 0
+
+
+async def test_validation_runs_against_the_manifest(make_fetcher, sl_api):
+    fetcher = make_fetcher()
+    error = await fetcher.validate_query_metrics_params(
+        metrics=["revenue", "orders"],
+        group_by=[
+            GroupByParam(name="order__channel", type=GroupByType.DIMENSION, grain=None)
+        ],
+    )
+    assert error is not None
+    assert "Group by order__channel not found" in error
+    await fetcher.validate_query_metrics_params(metrics=["orders"], group_by=None)
+    # The manifest is fetched once, and nothing is fetched per metric
+    assert len(sl_api.requests) == 1
+    assert sl_api.count("GetMetrics") == 1
+
+
+async def test_invalid_queries_fail_before_running(make_fetcher):
+    fetcher = make_fetcher()
+    result = await fetcher.query_metrics(
+        metrics=["revenue"], order_by=[OrderByParam(name="orders", descending=True)]
+    )
+    assert result.error is not None
+    assert "Order by orders not found" in result.error
+    fetcher.sl_client.query.assert_not_called()
+
+
+async def test_queries_run_on_the_semantic_layer_tool_pool(make_fetcher):
+    executor = ToolExecutor(ToolExecutionConfig())
+    fetcher = make_fetcher()
+    fetcher.tool_executor = executor
+    thread_names = []
+
+    def query(**kwargs):
+        thread_names.append(threading.current_thread().name)
+        return pa.table({"revenue": [1]})
+
+    fetcher.sl_client.query.side_effect = query
+    result = await fetcher.query_metrics(metrics=["revenue"])
+    assert result.result is not None
+    assert thread_names[0].startswith("dbt-mcp-semantic_layer")
+    assert executor.get_stats()["semantic_layer"].completed > 0
+    executor.shutdown()
+
+
+async def test_query_metrics_pages(make_fetcher):
+    fetcher = make_fetcher()
+    fetcher.sl_client.query.return_value = pa.table({"revenue": [1, 2, 3]})
+    result = await fetcher.query_metrics(metrics=["revenue"], page_size=2)
+    assert result.result is not None
+    page = json.loads(result.result)
+    assert page["rows"] == [{"revenue": 1}, {"revenue": 2}]
+
+    result = await fetcher.get_query_metrics_page(page["next_page_token"])
+    assert result.result is not None
+    page = json.loads(result.result)
+    assert page == {"rows": [{"revenue": 3}], "total_rows": 3, "next_page_token": None}
+
+    result = await fetcher.get_query_metrics_page("unknown:2:2")
+    assert result.error is not None
+
+
+async def test_query_metrics_output_format(make_fetcher):
+    fetcher = make_fetcher()
+    fetcher.sl_client.query.return_value = pa.table({"revenue": [1, 2, 3]})
+    result = await fetcher.query_metrics(
+        metrics=["revenue"], page_size=2, output_format=ResultFormat.CSV
+    )
+    assert result.result is not None
+    assert json.loads(result.result)["rows"] == '"revenue"\n1\n2\n'
+
+
+async def test_query_results_are_cached_by_canonical_query(make_fetcher):
+    fetcher = make_fetcher()
+    fetcher.sl_client.query.return_value = pa.table({"revenue": [1]})
+    metric_time = GroupByParam(
+        name="metric_time", type=GroupByType.TIME_DIMENSION, grain="month"
+    )
+    status = GroupByParam(name="order__status", type=GroupByType.DIMENSION, grain=None)
+    await fetcher.query_metrics(
+        metrics=["revenue", "orders"], group_by=[metric_time, status]
+    )
+    result = await fetcher.query_metrics(
+        metrics=["orders", "revenue"],
+        group_by=[status, replace(metric_time, grain="MONTH")],
+        output_format=ResultFormat.CSV,
+    )
+    assert result.result == '"revenue"\n1\n'
+    assert fetcher.sl_client.query.call_count == 1
+    assert fetcher.result_cache.get_stats().hits == 1
+
+    # A different query isn't served from the cache
+    await fetcher.query_metrics(metrics=["revenue"], group_by=[metric_time], limit=5)
+    assert fetcher.sl_client.query.call_count == 2
+
+
+async def test_cached_results_are_served_in_the_requested_column_order(
+    make_fetcher,
+):
+    fetcher = make_fetcher()
+    fetcher.sl_client.query.return_value = pa.table(
+        {"order__status": ["placed"], "revenue": [10], "orders": [1]}
+    )
+    status = GroupByParam(name="order__status", type=GroupByType.DIMENSION, grain=None)
+    await fetcher.query_metrics(metrics=["revenue", "orders"], group_by=[status])
+
+    result = await fetcher.query_metrics(
+        metrics=["orders", "revenue"],
+        group_by=[status],
+        output_format=ResultFormat.CSV,
+    )
+
+    assert result.result == '"order__status","orders","revenue"\n"placed",1,10\n'
+    assert fetcher.sl_client.query.call_count == 1
+
+
+async def test_compiled_sql_is_cached_per_column_order(make_fetcher, tmp_path):
+    fetcher = make_fetcher(compiled_sql_cache_path=tmp_path / "compiled_sql.sqlite3")
+    fetcher.sl_client.compile_sql.return_value = "select 1"
+    await fetcher.get_metrics_compiled_sql(metrics=["revenue", "orders"])
+    await fetcher.get_metrics_compiled_sql(metrics=["orders", "revenue"])
+    assert fetcher.sl_client.compile_sql.call_count == 2
+
+
+async def test_query_result_cache_can_be_bypassed(make_fetcher):
+    fetcher = make_fetcher()
+    fetcher.sl_client.query.return_value = pa.table({"revenue": [1]})
+    await fetcher.query_metrics(metrics=["revenue"])
+    fetcher.sl_client.query.return_value = pa.table({"revenue": [2]})
+    result = await fetcher.query_metrics(metrics=["revenue"], use_cache=False)
+    assert result.result == '[{"revenue":2}]'
+    assert fetcher.sl_client.query.call_args.kwargs["read_cache"] is False
+    # The fresh result replaces the cached one
+    assert (await fetcher.query_metrics(metrics=["revenue"])).result == (
+        '[{"revenue":2}]'
+    )
+    assert fetcher.sl_client.query.call_count == 2
+
+
+async def test_failed_queries_are_not_cached(make_fetcher):
+    fetcher = make_fetcher()
+    fetcher.sl_client.query.side_effect = RuntimeError("warehouse is down")
+    result = await fetcher.query_metrics(metrics=["revenue"])
+    assert result.error == "warehouse is down"
+    assert fetcher.result_cache.get_stats().entries == 0
+
+
+async def test_coarser_queries_are_not_rolled_up_by_default(make_fetcher):
+    fetcher = make_fetcher()
+    fetcher.sl_client.query.return_value = pa.table(
+        {
+            "metric_time__day": [datetime.date(2024, 1, d) for d in (1, 2)],
+            "revenue": [1, 2],
+        }
+    )
+    day = GroupByParam(name="metric_time", type=GroupByType.TIME_DIMENSION, grain="DAY")
+    await fetcher.query_metrics(metrics=["revenue"], group_by=[day])
+    await fetcher.query_metrics(
+        metrics=["revenue"], group_by=[replace(day, grain="MONTH")]
+    )
+    assert fetcher.sl_client.query.call_count == 2
+
+
+async def test_coarser_queries_are_rolled_up_from_cache(make_fetcher, sl_api):
+    fetcher = make_fetcher(rollup_cached_results=True)
+    fetcher.sl_client.query.return_value = pa.table(
+        {
+            "metric_time__day": [datetime.date(2024, 1, d) for d in (1, 2)],
+            "revenue": [1, 2],
+        }
+    )
+    day = GroupByParam(name="metric_time", type=GroupByType.TIME_DIMENSION, grain="DAY")
+    await fetcher.query_metrics(metrics=["revenue"], group_by=[day])
+
+    result = await fetcher.query_metrics(
+        metrics=["revenue"], group_by=[replace(day, grain="MONTH")]
+    )
+    assert result.result == '[{"metric_time__month":"2024-01-01","revenue":3}]'
+    assert fetcher.sl_client.query.call_count == 1
+
+    # Metrics that can't be rolled up exactly are queried
+    sl_api.metrics[0]["measures"] = [{"agg": "AVERAGE"}]
+    await fetcher.invalidate_catalog()
+    await fetcher.query_metrics(metrics=["revenue"], group_by=[day])
+    await fetcher.query_metrics(
+        metrics=["revenue"], group_by=[replace(day, grain="YEAR")]
+    )
+    assert fetcher.sl_client.query.call_count == 3
+
+
+async def test_query_metrics_batch_runs_queries_concurrently(sl_api):
+    # Both queries have to be running at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def query(metrics, **kwargs):
+        barrier.wait()
+        return pa.table({metrics[0]: [1]})
+
+    def create_sl_client():
+        client = MagicMock()
+        client.query.side_effect = query
+        return client
+
+    fetcher = SemanticLayerFetcher(
+        sl_client=None,
+        config=mock_semantic_layer_config.model_copy(update={"max_sessions": 2}),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(sl_api.handle)),
+        create_sl_client=create_sl_client,
+    )
+    results = await fetcher.query_metrics_batch(
+        [MetricQuery(metrics=["revenue"]), MetricQuery(metrics=["orders"])]
+    )
+    assert [r.result for r in results] == ['[{"revenue":1}]', '[{"orders":1}]']
+
+
+async def test_query_metrics_batch_reports_errors_per_query(make_fetcher):
+    fetcher = make_fetcher()
+
+    def query(metrics, **kwargs):
+        if metrics == ["orders"]:
+            raise RuntimeError("warehouse is down")
+        return pa.table({metrics[0]: [1]})
+
+    fetcher.sl_client.query.side_effect = query
+    results = await fetcher.query_metrics_batch(
+        [
+            MetricQuery(metrics=["orders"]),
+            MetricQuery(metrics=["unknown"]),
+            MetricQuery(metrics=["revenue"], limit=1),
+        ]
+    )
+    assert results[0].error == "warehouse is down"
+    assert results[1].error is not None
+    assert results[2].result == '[{"revenue":1}]'
+
+
+async def test_query_metrics_batch_runs_identical_queries_once(make_fetcher):
+    fetcher = make_fetcher()
+    fetcher.sl_client.query.return_value = pa.table({"revenue": [1]})
+    results = await fetcher.query_metrics_batch(
+        [MetricQuery(metrics=["revenue"])] * 3 + [MetricQuery(metrics=["orders"])]
+    )
+    assert len(results) == 4
+    assert results[0] is results[2]
+    assert fetcher.sl_client.query.call_count == 2
+
+
+async def test_query_metrics_batch_size_is_limited(make_fetcher):
+    fetcher = make_fetcher()
+    with pytest.raises(ValueError, match="at most 20 queries"):
+        await fetcher.query_metrics_batch(
+            [MetricQuery(metrics=["revenue"], limit=i) for i in range(21)]
+        )
+    fetcher.sl_client.query.assert_not_called()
+
+
+async def test_compiled_sql_is_cached_until_the_manifest_changes(
+    make_fetcher, sl_api, tmp_path
+):
+    fetcher = make_fetcher(compiled_sql_cache_path=tmp_path / "compiled_sql.sqlite3")
+    fetcher.sl_client.compile_sql.return_value = "select 1"
+    for _ in range(2):
+        result = await fetcher.get_metrics_compiled_sql(metrics=["revenue"])
+        assert result.sql == "select 1"
+    assert fetcher.sl_client.compile_sql.call_count == 1
+
+    # A restarted server reuses the compiled SQL
+    restarted = make_fetcher(compiled_sql_cache_path=tmp_path / "compiled_sql.sqlite3")
+    assert (await restarted.get_metrics_compiled_sql(metrics=["revenue"])).sql == (
+        "select 1"
+    )
+    restarted.sl_client.compile_sql.assert_not_called()
+
+    # But not once the manifest has changed
+    sl_api.metrics[0]["measures"] = [{"agg": "MAX"}]
+    await restarted.metrics_catalog.refresh()
+    restarted.sl_client.compile_sql.return_value = "select 2"
+    assert (await restarted.get_metrics_compiled_sql(metrics=["revenue"])).sql == (
+        "select 2"
+    )
+
+
+async def test_dimension_values_are_cached_and_filtered(make_fetcher):
+    fetcher = make_fetcher()
+    fetcher.sl_client.dimension_values.return_value = pa.table(
+        {"order__status": ["shipped", None, "Returned", "completed", "returned"]}
+    )
+    result = await fetcher.get_dimension_values(
+        metrics=["revenue"], dimension="order__status"
+    )
+    assert result.values == ["Returned", "completed", "returned", "shipped"]
+    assert result.has_more is False
+
+    result = await fetcher.get_dimension_values(
+        metrics=["revenue"], dimension="order__status", prefix="RE", limit=1
+    )
+    assert result.values == ["Returned"]
+    assert result.has_more is True
+    fetcher.sl_client.dimension_values.assert_called_once_with(
+        metrics=["revenue"], group_by="order__status"
+    )
+
+
+async def test_dimension_values_are_read_within_the_result_budget(make_fetcher):
+    fetcher = make_fetcher(result_budget_max_rows=2)
+    fetcher.sl_client.dimension_values.return_value = pa.table(
+        {"order__status": ["placed", "returned", "shipped"]}
+    )
+    with pytest.raises(ValueError, match="too many values"):
+        await fetcher.get_dimension_values(
+            metrics=["revenue"], dimension="order__status"
+        )
+    assert fetcher.session_pool.get_stats().recycled == 0
+
+    fetcher = make_fetcher(result_budget_max_rows=2, truncate_results_over_budget=True)
+    fetcher.sl_client.dimension_values.return_value = pa.table(
+        {"order__status": ["placed", "returned", "shipped"]}
+    )
+    result = await fetcher.get_dimension_values(
+        metrics=["revenue"], dimension="order__status"
+    )
+    assert result.values == ["placed", "returned"]
+    assert result.has_more is True
+    assert result.truncated is True
+    # Partial values aren't cached
+    assert fetcher.dimension_values_cache.get_stats().entries == 0
+
+
+async def test_dimension_values_of_unknown_dimension(make_fetcher):
+    fetcher = make_fetcher()
+    with pytest.raises(ValueError, match="Group by order__channel not found"):
+        await fetcher.get_dimension_values(
+            metrics=["revenue"], dimension="order__channel"
+        )
+    fetcher.sl_client.dimension_values.assert_not_called()
+
+
+async def test_results_over_budget_fail(make_fetcher):
+    fetcher = make_fetcher(result_budget_max_rows=2)
+    fetcher.sl_client.query.return_value = pa.table({"revenue": [1, 2, 3]})
+    result = await fetcher.query_metrics(metrics=["revenue"])
+    assert result.error is not None
+    assert "more than 2 rows" in result.error
+    # The session wasn't considered broken
+    assert fetcher.session_pool.get_stats().recycled == 0
+
+
+async def test_truncated_results_are_marked_and_not_cached(make_fetcher):
+    fetcher = make_fetcher(result_budget_max_rows=2, truncate_results_over_budget=True)
+    fetcher.sl_client.query.return_value = pa.table({"revenue": [1, 2, 3]})
+    result = await fetcher.query_metrics(metrics=["revenue"])
+    assert result.result is not None
+    assert json.loads(result.result) == {
+        "rows": [{"revenue": 1}, {"revenue": 2}],
+        "total_rows": 2,
+        "next_page_token": None,
+        "truncated": True,
+    }
+    assert fetcher.result_cache.get_stats().entries == 0
+
+
+async def test_truncated_results_are_pages_in_any_format(make_fetcher):
+    fetcher = make_fetcher(result_budget_max_rows=2, truncate_results_over_budget=True)
+    fetcher.sl_client.query.return_value = pa.table({"revenue": [1, 2, 3]})
+    result = await fetcher.query_metrics(
+        metrics=["revenue"], output_format=ResultFormat.CSV
+    )
+    assert isinstance(result, QueryMetricsSuccess)
+    assert result.is_page
+    assert json.loads(result.result)["rows"] == '"revenue"\n1\n2\n'
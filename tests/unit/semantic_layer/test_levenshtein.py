@@ -0,0 +1,52 @@
+import random
+import string
+
+import pytest
+
+from dbt_mcp.semantic_layer.levenshtein import (
+    WordIndex,
+    bounded_levenshtein,
+    get_closest_words,
+    get_misspellings,
+    levenshtein,
+)
+
+
+def random_words(rng: random.Random, count: int) -> list[str]:
+    alphabet = string.ascii_lowercase[:6] + "_"
+    return ["".join(rng.choices(alphabet, k=rng.randint(0, 12))) for _ in range(count)]
+
+
+@pytest.mark.parametrize("max_distance", [0, 1, 2, 3, 6])
+def test_bounded_levenshtein_matches_levenshtein(max_distance):
+    rng = random.Random(max_distance)
+    words = random_words(rng, 200)
+    for s1, s2 in zip(words, reversed(words), strict=True):
+        distance = levenshtein(s1, s2)
+        expected = distance if distance <= max_distance else max_distance + 1
+        assert bounded_levenshtein(s1, s2, max_distance) == expected
+
+
+def test_word_index_matches_full_scan():
+    rng = random.Random(0)
+    words = random_words(rng, 300)
+    # Duplicates and ties are returned in the original order
+    words += words[:20]
+    index = WordIndex(words)
+    for target in random_words(rng, 40):
+        for top_k in [None, 1, 5]:
+            threshold = max(1, len(target) // 2)
+            assert index.get_closest_words(
+                target, top_k=top_k, threshold=threshold
+            ) == get_closest_words(target, words, top_k=top_k, threshold=threshold)
+
+
+def test_get_misspellings():
+    words = ["revenue", "revenue_growth", "orders", "order_count"]
+    misspellings = get_misspellings(
+        targets=["revenue", "revenu", "order"], words=WordIndex(words), top_k=5
+    )
+    assert [(m.word, m.similar_words) for m in misspellings] == [
+        ("revenu", ["revenue"]),
+        ("order", ["orders"]),
+    ]
@@ -0,0 +1,93 @@
+import pytest
+from dbtsl.api.shared.query_params import GroupByParam, GroupByType
+
+from dbt_mcp.semantic_layer.manifest import SemanticManifest
+from dbt_mcp.semantic_layer.types import OrderByParam
+from tests.unit.semantic_layer.conftest import MockSemanticLayerAPI
+
+metric_time = GroupByParam(
+    name="metric_time", type=GroupByType.TIME_DIMENSION, grain="month"
+)
+status = GroupByParam(name="order__status", type=GroupByType.DIMENSION, grain=None)
+
+
+@pytest.fixture
+def manifest(sl_api: MockSemanticLayerAPI) -> SemanticManifest:
+    return SemanticManifest(
+        [
+            {
+                **m,
+                "dimensions": sl_api.dimensions[m["name"]],
+                "entities": sl_api.entities[m["name"]],
+            }
+            for m in sl_api.metrics
+        ]
+    )
+
+
+def test_valid_query(manifest):
+    assert (
+        manifest.validate_query(
+            metrics=["revenue", "orders"],
+            group_by=[metric_time, status],
+            order_by=[
+                OrderByParam(name="metric_time", descending=True),
+                OrderByParam(name="orders", descending=False),
+            ],
+            where="{{ TimeDimension('metric_time', 'WEEK') }} >= '2024-01-01'"
+            + " and {{ Dimension('order__status') }} = 'completed'"
+            + " and {{ Entity('order') }} is not null",
+        )
+        is None
+    )
+
+
+def test_unknown_metric(manifest):
+    error = manifest.validate_query(metrics=["revenu"])
+    assert error == "Errors: Metric revenu not found. Did you mean: revenue?"
+
+
+def test_group_by_grain_must_be_shared_by_all_metrics(manifest):
+    day = GroupByParam(name="metric_time", type=GroupByType.TIME_DIMENSION, grain="DAY")
+    assert manifest.validate_query(metrics=["revenue"], group_by=[day]) is None
+    error = manifest.validate_query(metrics=["revenue", "orders"], group_by=[day])
+    assert error is not None
+    assert "can't be queried at grain DAY. Available grains: WEEK, MONTH" in error
+
+
+def test_categorical_dimensions_have_no_grain(manifest):
+    error = manifest.validate_query(
+        metrics=["revenue"], group_by=[GroupByParam(**{**vars(status), "grain": "DAY"})]
+    )
+    assert error is not None
+    assert "order__status is not a time dimension" in error
+
+
+def test_order_by_must_be_queried(manifest):
+    error = manifest.validate_query(
+        metrics=["revenue"],
+        group_by=[status],
+        order_by=[OrderByParam(name="metric_time", descending=True)],
+    )
+    assert error == "Errors: Order by metric_time not found in metrics or group by."
+
+
+def test_where_references(manifest):
+    error = manifest.validate_query(
+        metrics=["revenue", "orders"],
+        where="{{ Dimension('order__channel') }} = 'web'"
+        + " and {{ Entity('customer') }} is not null"
+        + " and {{ TimeDimension('metric_time', 'DAY') }} > '2024-01-01'",
+    )
+    assert error is not None
+    assert "Dimension order__channel in where not found" in error
+    assert "Entity customer in where not found" in error
+    assert "Where metric_time can't be queried at grain DAY" in error
+    # References with entity paths are left to the server
+    assert (
+        manifest.validate_query(
+            metrics=["revenue"],
+            where="{{ Dimension('status', entity_path=['order']) }} = 'completed'",
+        )
+        is None
+    )
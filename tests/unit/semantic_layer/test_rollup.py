@@ -0,0 +1,161 @@
+import datetime
+
+import pyarrow as pa
+import pytest
+from dbtsl.api.shared.query_params import GroupByParam, GroupByType
+
+from dbt_mcp.semantic_layer.rollup import (
+    CachedQueryResult,
+    can_roll_up_grain,
+    order_columns,
+    roll_up,
+)
+from dbt_mcp.semantic_layer.types import OrderByParam
+
+
+def time_dimension(grain: str) -> GroupByParam:
+    return GroupByParam(
+        name="metric_time", type=GroupByType.TIME_DIMENSION, grain=grain
+    )
+
+
+status = GroupByParam(name="order__status", type=GroupByType.DIMENSION, grain=None)
+
+daily = CachedQueryResult(
+    metrics=["revenue", "orders"],
+    group_by=[time_dimension("DAY"), status],
+    where=None,
+    limit=None,
+    table=pa.table(
+        {
+            "METRIC_TIME__DAY": [
+                datetime.date(2024, 1, 1),
+                datetime.date(2024, 1, 2),
+                datetime.date(2024, 2, 1),
+                datetime.date(2024, 2, 1),
+            ],
+            "ORDER__STATUS": ["placed", "placed", "placed", "returned"],
+            "REVENUE": [10, 20, 5, None],
+            "ORDERS": [1, 2, 1, 1],
+        }
+    ),
+)
+aggregations = {"revenue": "sum", "orders": "sum"}
+
+
+@pytest.mark.parametrize(
+    "source,target,expected",
+    [
+        ("DAY", "MONTH", True),
+        ("day", "WEEK", True),
+        ("HOUR", "YEAR", True),
+        ("MONTH", "DAY", False),
+        ("WEEK", "MONTH", False),
+        ("DAY", "fiscal_quarter", False),
+    ],
+)
+def test_can_roll_up_grain(source, target, expected):
+    assert can_roll_up_grain(source, target) == expected
+
+
+def test_order_columns_like_the_query():
+    table = order_columns(
+        daily.table, ["orders", "revenue"], [status, time_dimension("day")]
+    )
+    assert table.column_names == [
+        "ORDER__STATUS",
+        "METRIC_TIME__DAY",
+        "ORDERS",
+        "REVENUE",
+    ]
+    # Columns that can't be matched leave the table as is
+    assert order_columns(daily.table, ["margin"], []) is daily.table
+
+
+def test_roll_up_to_coarser_grain():
+    table = roll_up(
+        [daily],
+        metrics=["orders", "revenue"],
+        group_by=[time_dimension("month")],
+        order_by=[OrderByParam(name="metric_time", descending=True)],
+        where=None,
+        limit=None,
+        aggregations=aggregations,
+    )
+    assert table is not None
+    assert table.to_pydict() == {
+        "METRIC_TIME__MONTH": [datetime.date(2024, 2, 1), datetime.date(2024, 1, 1)],
+        "ORDERS": [2, 3],
+        "REVENUE": [5, 30],
+    }
+
+
+def test_roll_up_to_fewer_group_bys():
+    table = roll_up(
+        [daily],
+        metrics=["revenue", "orders"],
+        group_by=[status],
+        order_by=[OrderByParam(name="orders", descending=True)],
+        where=None,
+        limit=1,
+        aggregations=aggregations,
+    )
+    assert table is not None
+    assert table.to_pydict() == {
+        "ORDER__STATUS": ["placed"],
+        "REVENUE": [35],
+        "ORDERS": [4],
+    }
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        # Not all metrics can be rolled up
+        {"aggregations": {"revenue": "sum"}},
+        # Different metrics
+        {"metrics": ["revenue"]},
+        # Different filter
+        {"where": "{{ Dimension('order__status') }} = 'placed'"},
+        # Finer grain than the cached result
+        {"group_by": [time_dimension("HOUR")]},
+        # Group by that isn't in the cached result
+        {"group_by": [GroupByParam("order__channel", GroupByType.DIMENSION, None)]},
+        # Nulls would be sorted differently by the warehouse
+        {
+            "group_by": [status],
+            "order_by": [OrderByParam(name="revenue", descending=True)],
+            "limit": 1,
+        },
+    ],
+)
+def test_no_roll_up_unless_exact(changes):
+    query = {
+        "metrics": ["revenue", "orders"],
+        "group_by": [time_dimension("MONTH")],
+        "order_by": [],
+        "where": None,
+        "limit": None,
+        "aggregations": aggregations,
+    }
+    assert roll_up([daily], **{**query, **changes}) is None
+
+
+def test_no_roll_up_from_limited_results():
+    limited = CachedQueryResult(
+        metrics=daily.metrics,
+        group_by=daily.group_by,
+        where=None,
+        limit=10,
+        table=daily.table,
+    )
+    table = roll_up(
+        [limited],
+        metrics=["revenue", "orders"],
+        group_by=[status],
+        order_by=[],
+        where=None,
+        limit=None,
+        aggregations=aggregations,
+    )
+    assert table is None
@@ -0,0 +1,127 @@
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import pytest
+from dbtsl.error import QueryFailedError
+
+from dbt_mcp.semantic_layer.session_pool import SemanticLayerSessionPool
+
+
+class MockClient:
+    def __init__(self) -> None:
+        self.opened = 0
+        self.closed = 0
+
+    @contextmanager
+    def session(self):
+        self.opened += 1
+        yield self
+        self.closed += 1
+
+
+def make_pool(**kwargs) -> tuple[SemanticLayerSessionPool, list[MockClient]]:
+    clients: list[MockClient] = []
+
+    def create_client() -> MockClient:
+        clients.append(MockClient())
+        return clients[-1]
+
+    pool = SemanticLayerSessionPool(
+        create_client=create_client,
+        **{"max_sessions": 4, "idle_timeout_seconds": 60, **kwargs},
+    )
+    return pool, clients
+
+
+def test_sessions_are_reused():
+    pool, clients = make_pool()
+    assert pool.run(lambda client: client) is pool.run(lambda client: client)
+    assert len(clients) == 1
+    assert clients[0].opened == 1
+    assert clients[0].closed == 0
+    assert pool.get_stats().reused == 1
+
+
+def test_idle_sessions_expire():
+    with patch("dbt_mcp.semantic_layer.session_pool.time.monotonic") as clock:
+        clock.return_value = 0
+        pool, clients = make_pool(idle_timeout_seconds=60)
+        pool.run(lambda client: None)
+        clock.return_value = 60
+        pool.run(lambda client: None)
+    assert len(clients) == 2
+    assert clients[0].closed == 1
+    assert pool.get_stats().expired == 1
+
+
+def test_query_failures_keep_the_session():
+    pool, clients = make_pool()
+
+    def fail(client):
+        raise QueryFailedError("invalid query", status="FAILED")
+
+    with pytest.raises(QueryFailedError):
+        pool.run(fail)
+    pool.run(lambda client: None)
+    assert len(clients) == 1
+
+
+def test_broken_reused_sessions_are_recycled_and_retried():
+    pool, clients = make_pool()
+    pool.run(lambda client: None)
+
+    def query(client):
+        if client is clients[0]:
+            raise ConnectionError("connection reset")
+        return "result"
+
+    assert pool.run(query) == "result"
+    assert len(clients) == 2
+    assert clients[0].closed == 1
+    assert pool.get_stats().recycled == 1
+
+
+def test_errors_on_new_sessions_are_not_retried():
+    pool, clients = make_pool()
+
+    def fail(client):
+        raise ConnectionError("connection refused")
+
+    with pytest.raises(ConnectionError):
+        pool.run(fail)
+    assert len(clients) == 1
+    assert pool.get_stats().idle == 0
+
+
+def test_concurrency_is_bounded():
+    pool, clients = make_pool(max_sessions=2)
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def query(client):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    threads = [threading.Thread(target=pool.run, args=(query,)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max_running == 2
+    assert len(clients) == 2
+
+
+def test_close_closes_idle_sessions():
+    pool, clients = make_pool()
+    pool.run(lambda client: None)
+    SemanticLayerSessionPool.close_all()
+    assert clients[0].closed == 1
+    assert pool.get_stats().idle == 0
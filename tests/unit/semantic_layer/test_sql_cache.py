@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+from dbt_mcp.mcp.server import DbtMCP, app_lifespan
+from dbt_mcp.semantic_layer.sql_cache import CompiledSqlCache
+from dbt_mcp.tracking.tracking import UsageTracker
+from tests.mocks.config import mock_config
+
+
+def test_entries_outlive_the_cache(tmp_path):
+    path = tmp_path / "cache" / "compiled_sql.sqlite3"
+    cache = CompiledSqlCache(path=path, namespace="env", ttl_seconds=60)
+    cache.set("manifest", "query", "select 1")
+    assert cache.get("manifest", "query") == "select 1"
+    cache.close()
+
+    cache = CompiledSqlCache(path=path, namespace="env", ttl_seconds=60)
+    assert cache.get("manifest", "query") == "select 1"
+    # Entries only match the manifest and the namespace they were set for
+    assert cache.get("other manifest", "query") is None
+    assert (
+        CompiledSqlCache(path=path, namespace="other env", ttl_seconds=60).get(
+            "manifest", "query"
+        )
+        is None
+    )
+
+
+def test_entries_expire(tmp_path):
+    path = tmp_path / "compiled_sql.sqlite3"
+    with patch("dbt_mcp.semantic_layer.sql_cache.time.time", return_value=0) as clock:
+        CompiledSqlCache(path=path, namespace="env", ttl_seconds=60).set(
+            "manifest", "query", "select 1"
+        )
+        clock.return_value = 60
+        cache = CompiledSqlCache(path=path, namespace="env", ttl_seconds=60)
+        assert cache.get("manifest", "query") is None
+
+
+def test_retain_drops_other_manifests(tmp_path):
+    path = tmp_path / "compiled_sql.sqlite3"
+    cache = CompiledSqlCache(path=path, namespace="env", ttl_seconds=60)
+    cache.set("old", "query", "select 1")
+    cache.set("new", "other query", "select 2")
+    cache.retain("new")
+    cache.close()
+
+    cache = CompiledSqlCache(path=path, namespace="env", ttl_seconds=60)
+    assert cache.get("old", "query") is None
+    assert cache.get("new", "other query") == "select 2"
+
+
+def test_unusable_database_falls_back_to_memory(tmp_path):
+    # The parent of the database is a file, so it can't be created
+    (tmp_path / "file").touch()
+    cache = CompiledSqlCache(
+        path=tmp_path / "file" / "compiled_sql.sqlite3", namespace="env", ttl_seconds=60
+    )
+    cache.set("manifest", "query", "select 1")
+    assert cache.get("manifest", "query") == "select 1"
+
+
+def test_close_all_closes_databases_until_used_again(tmp_path):
+    path = tmp_path / "compiled_sql.sqlite3"
+    cache = CompiledSqlCache(path=path, namespace="env", ttl_seconds=60)
+    CompiledSqlCache.close_all()
+    assert cache._db is None
+
+    cache.set("manifest", "query", "select 1")
+    cache.close()
+    cache = CompiledSqlCache(path=path, namespace="env", ttl_seconds=60)
+    assert cache.get("manifest", "query") == "select 1"
+
+
+async def test_databases_are_closed_when_the_server_shuts_down(tmp_path):
+    dbt_mcp = DbtMCP(config=mock_config, usage_tracker=UsageTracker(), name="dbt")
+    async with app_lifespan(dbt_mcp):
+        cache = CompiledSqlCache(
+            path=tmp_path / "compiled_sql.sqlite3", namespace="env", ttl_seconds=60
+        )
+        assert cache._db is not None
+    assert cache._db is None
@@ -0,0 +1,104 @@
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+from dbtsl.api.adbc.client.base import BaseADBCClient
+from dbtsl.api.adbc.client.sync import SyncADBCClient
+from dbtsl.api.adbc.protocol import ADBCProtocol
+from dbtsl.client.sync import SyncSemanticLayerClient
+
+from dbt_mcp.semantic_layer.streaming import (
+    _get_adbc_internals,
+    stream_dimension_values,
+    stream_query,
+)
+
+table = pa.table({"revenue": list(range(10))})
+
+
+def test_sdk_results_are_streamed_from_adbc():
+    reader = MagicMock(schema=table.schema)
+    reader.__iter__.return_value = iter(table.to_batches(max_chunksize=4))
+    adbc = MagicMock(spec=SyncADBCClient)
+    cursor = adbc._conn.cursor.return_value.__enter__.return_value
+    cursor.fetch_record_batch.return_value = reader
+    sl_client = SyncSemanticLayerClient(
+        environment_id=1, auth_token="token", host="host"
+    )
+    sl_client._adbc = adbc  # type: ignore[attr-defined]
+
+    with stream_query(sl_client, metrics=["revenue"], limit=10) as (schema, batches):
+        assert schema == table.schema
+        assert next(batches).num_rows == 4
+    assert "semantic_layer.query" in cursor.execute.call_args.args[0]
+    # The stream is closed without reading the rest of the result
+    reader.close.assert_called_once()
+
+
+def test_other_clients_are_queried_for_a_table():
+    sl_client = MagicMock()
+    sl_client.query.return_value = table
+    with stream_query(sl_client, metrics=["revenue"]) as (schema, batches):
+        assert pa.Table.from_batches(list(batches), schema=schema).equals(table)
+
+
+def create_sdk_client() -> SyncSemanticLayerClient:
+    return SyncSemanticLayerClient(environment_id=1, auth_token="token", host="host")
+
+
+def test_sdk_internals_used_for_streaming_exist():
+    # Streaming relies on internals of the SDK. If this fails after upgrading
+    # it, queries fall back to whole tables until streaming is updated.
+    sl_client = create_sdk_client()
+    adbc = sl_client._adbc  # type: ignore[attr-defined]
+    assert isinstance(adbc, SyncADBCClient)
+    assert isinstance(getattr(BaseADBCClient, "_conn", None), property)
+    assert callable(adbc._handle_error)
+    assert "semantic_layer.query" in ADBCProtocol.get_query_sql(
+        {"metrics": ["revenue"], "limit": 10}
+    )
+    assert "semantic_layer.dimension_values" in (
+        ADBCProtocol.get_dimension_values_sql(
+            {"metrics": ["revenue"], "group_by": "order__status"}
+        )
+    )
+
+    adbc._conn_unsafe = MagicMock()
+    assert _get_adbc_internals(sl_client) is not None
+    assert _get_adbc_internals(sl_client, "get_dimension_values_sql") is not None
+
+
+def test_sdk_clients_are_queried_for_a_table_when_internals_change():
+    sl_client = create_sdk_client()
+    sl_client._adbc = object()  # type: ignore[attr-defined]
+    sl_client.query = MagicMock(return_value=table)  # type: ignore[method-assign]
+
+    with stream_query(sl_client, metrics=["revenue"]) as (schema, batches):
+        assert pa.Table.from_batches(list(batches), schema=schema).equals(table)
+    sl_client.query.assert_called_once_with(metrics=["revenue"])
+
+
+def test_sdk_dimension_values_are_streamed_from_adbc():
+    reader = MagicMock(schema=table.schema)
+    reader.__iter__.return_value = iter(table.to_batches())
+    adbc = MagicMock(spec=SyncADBCClient)
+    cursor = adbc._conn.cursor.return_value.__enter__.return_value
+    cursor.fetch_record_batch.return_value = reader
+    sl_client = create_sdk_client()
+    sl_client._adbc = adbc  # type: ignore[attr-defined]
+
+    with stream_dimension_values(
+        sl_client, metrics=["revenue"], group_by="order__status"
+    ) as (schema, batches):
+        assert schema == table.schema
+    assert "semantic_layer.dimension_values" in cursor.execute.call_args.args[0]
+    reader.close.assert_called_once()
+
+
+def test_other_clients_are_asked_for_dimension_values():
+    sl_client = MagicMock()
+    sl_client.dimension_values.return_value = ["placed", "returned"]
+    with stream_dimension_values(
+        sl_client, metrics=["revenue"], group_by="order__status"
+    ) as (schema, batches):
+        result = pa.Table.from_batches(list(batches), schema=schema)
+    assert result.column("order__status").to_pylist() == ["placed", "returned"]
@@ -0,0 +1,125 @@
+from unittest.mock import patch
+
+from dbt_mcp.config.config import Config, ToolCacheConfig
+from dbt_mcp.mcp.server import DbtMCP
+from dbt_mcp.tools.annotations import create_tool_annotations
+from dbt_mcp.tools.cache import ToolCache, get_cache_key
+from dbt_mcp.tools.toolsets import Toolset
+from dbt_mcp.tracking.tracking import UsageTracker
+from tests.mocks.config import mock_config
+
+read_only_annotations = create_tool_annotations(
+    read_only_hint=True, destructive_hint=False, idempotent_hint=True
+)
+
+
+def test_cache_key_ignores_argument_order():
+    assert get_cache_key("get_dimensions", {"a": 1, "b": [2]}) == get_cache_key(
+        "get_dimensions", {"b": [2], "a": 1}
+    )
+    assert get_cache_key("get_dimensions", {"a": 1}) != get_cache_key(
+        "get_entities", {"a": 1}
+    )
+
+
+def test_cache_expires_entries():
+    cache = ToolCache(ToolCacheConfig())
+    with patch("dbt_mcp.cache.lru.time.monotonic", return_value=0):
+        cache.set("key", ["value"], ttl_seconds=10)
+    with patch("dbt_mcp.cache.lru.time.monotonic", return_value=5):
+        assert cache.get("key") == (True, ["value"])
+    with patch("dbt_mcp.cache.lru.time.monotonic", return_value=10):
+        assert cache.get("key") == (False, None)
+    stats = cache.get_stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 0)
+
+
+def test_cache_evicts_least_recently_used_entries():
+    cache = ToolCache(ToolCacheConfig(max_entries=2))
+    cache.set("a", 1, ttl_seconds=60)
+    cache.set("b", 2, ttl_seconds=60)
+    cache.get("a")
+    cache.set("c", 3, ttl_seconds=60)
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, 1)
+    assert cache.get_stats().evictions == 1
+
+
+def test_cache_is_bounded_by_bytes():
+    cache = ToolCache(ToolCacheConfig(max_bytes=20))
+    cache.set("a", "x" * 10, ttl_seconds=60)
+    cache.set("b", "y" * 10, ttl_seconds=60)
+    assert cache.get_stats().entries == 1
+    assert cache.get_stats().bytes <= 20
+    cache.set("c", "z" * 100, ttl_seconds=60)
+    assert cache.get("c") == (False, None)
+
+
+def test_toolset_ttl_overrides_default():
+    cache = ToolCache(
+        ToolCacheConfig(ttl_seconds=30, toolset_ttl_seconds={Toolset.DBT_CLI: 0})
+    )
+    assert cache.get_ttl(Toolset.DISCOVERY) == 30
+    assert cache.get_ttl(Toolset.DBT_CLI) == 0
+
+
+async def test_read_only_idempotent_tool_results_are_cached():
+    dbt_mcp = DbtMCP(config=mock_config, usage_tracker=UsageTracker(), name="dbt")
+    calls: list[str] = []
+
+    async def get_model_details(model_name: str) -> list[dict] | str:
+        calls.append(model_name)
+        return [{"name": model_name}]
+
+    dbt_mcp.add_tool(
+        get_model_details, annotations=read_only_annotations, structured_output=False
+    )
+    await dbt_mcp.call_tool("get_model_details", {"model_name": "orders"})
+    await dbt_mcp.call_tool("get_model_details", {"model_name": "orders"})
+    await dbt_mcp.call_tool("get_model_details", {"model_name": "customers"})
+    assert calls == ["orders", "customers"]
+    assert dbt_mcp.tool_cache.get_stats().hits == 1
+
+
+async def test_errors_and_non_idempotent_tools_are_not_cached():
+    dbt_mcp = DbtMCP(config=mock_config, usage_tracker=UsageTracker(), name="dbt")
+    calls: list[str] = []
+
+    async def get_model_details(model_name: str) -> list[dict] | str:
+        calls.append(model_name)
+        return "Error: upstream unavailable"
+
+    async def trigger_job_run(job_id: int) -> dict | str:
+        calls.append(str(job_id))
+        return {"id": job_id}
+
+    dbt_mcp.add_tool(
+        get_model_details, annotations=read_only_annotations, structured_output=False
+    )
+    dbt_mcp.add_tool(trigger_job_run, structured_output=False)
+    for _ in range(2):
+        await dbt_mcp.call_tool("get_model_details", {"model_name": "orders"})
+        await dbt_mcp.call_tool("trigger_job_run", {"job_id": 1})
+    assert calls == ["orders", "1", "orders", "1"]
+
+
+async def test_toolsets_with_zero_ttl_are_not_cached():
+    config = Config(
+        tracking_config=mock_config.tracking_config,
+        tool_cache_config=ToolCacheConfig(toolset_ttl_seconds={Toolset.DISCOVERY: 0}),
+        disable_tools=[],
+    )
+    dbt_mcp = DbtMCP(config=config, usage_tracker=UsageTracker(), name="dbt")
+    calls = 0
+
+    async def get_all_models() -> list[dict] | str:
+        nonlocal calls
+        calls += 1
+        return []
+
+    dbt_mcp.add_tool(
+        get_all_models, annotations=read_only_annotations, structured_output=False
+    )
+    await dbt_mcp.call_tool("get_all_models", {})
+    await dbt_mcp.call_tool("get_all_models", {})
+    assert calls == 2
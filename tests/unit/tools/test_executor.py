@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import threading
+import time
+
+import pytest
+
+from dbt_mcp.config.config import ToolExecutionConfig
+from dbt_mcp.mcp.server import DbtMCP, app_lifespan
+from dbt_mcp.tools.executor import (
+    ToolExecutor,
+    ToolExecutorBusyError,
+    ToolExecutorShutdownError,
+)
+from dbt_mcp.tools.toolsets import Toolset
+from dbt_mcp.tracking.tracking import UsageTracker
+from tests.mocks.config import mock_config
+
+
+async def test_run_uses_worker_thread():
+    executor = ToolExecutor(ToolExecutionConfig())
+    thread_name = await executor.run(
+        Toolset.DISCOVERY, lambda: threading.current_thread().name
+    )
+    assert thread_name.startswith("dbt-mcp-discovery")
+    assert executor.get_stats()["discovery"].completed == 1
+    executor.shutdown()
+
+
+async def test_run_executes_calls_in_parallel():
+    executor = ToolExecutor(ToolExecutionConfig(max_workers=4))
+    start = time.monotonic()
+    await asyncio.gather(
+        *[executor.run(Toolset.DISCOVERY, lambda: time.sleep(0.2)) for _ in range(4)]
+    )
+    assert time.monotonic() - start < 0.6
+    executor.shutdown()
+
+
+async def test_toolsets_use_separate_pools():
+    executor = ToolExecutor(
+        ToolExecutionConfig(toolset_max_workers={Toolset.DBT_CLI: 1})
+    )
+    release = threading.Event()
+    slow_call = asyncio.create_task(executor.run(Toolset.DBT_CLI, release.wait))
+    await asyncio.sleep(0.05)
+    # The saturated dbt CLI pool doesn't block other toolsets
+    assert await executor.run(Toolset.DISCOVERY, lambda: "ok") == "ok"
+    assert executor.get_stats()["dbt_cli"].running == 1
+    release.set()
+    await slow_call
+    executor.shutdown()
+
+
+async def test_run_rejects_when_queue_is_full():
+    executor = ToolExecutor(ToolExecutionConfig(max_workers=1, max_queued_calls=1))
+    release = threading.Event()
+    running = asyncio.create_task(executor.run(Toolset.DISCOVERY, release.wait))
+    await asyncio.sleep(0.05)
+    queued = asyncio.create_task(executor.run(Toolset.DISCOVERY, lambda: "queued"))
+    await asyncio.sleep(0.05)
+    assert executor.get_stats()["discovery"].queued == 1
+
+    with pytest.raises(ToolExecutorBusyError):
+        await executor.run(Toolset.DISCOVERY, lambda: "rejected")
+
+    release.set()
+    await running
+    assert await queued == "queued"
+    assert executor.get_stats()["discovery"].rejected == 1
+    executor.shutdown()
+
+
+async def test_failed_calls_are_counted_separately():
+    executor = ToolExecutor(ToolExecutionConfig())
+
+    def fail() -> None:
+        raise ValueError("failed")
+
+    await executor.run(Toolset.DISCOVERY, lambda: None)
+    with pytest.raises(ValueError):
+        await executor.run(Toolset.DISCOVERY, fail)
+
+    stats = executor.get_stats()["discovery"]
+    assert (stats.completed, stats.failed) == (1, 1)
+    executor.shutdown()
+
+
+async def test_calls_after_shutdown_raise_until_reopened():
+    executor = ToolExecutor(ToolExecutionConfig())
+    await executor.run(Toolset.SEMANTIC_LAYER, lambda: None)
+    executor.shutdown()
+
+    with pytest.raises(ToolExecutorShutdownError):
+        await executor.run(Toolset.SEMANTIC_LAYER, lambda: None)
+
+    executor.reopen()
+    assert await executor.run(Toolset.SEMANTIC_LAYER, lambda: "ok") == "ok"
+    executor.shutdown()
+
+
+async def test_sync_tools_are_registered_as_async():
+    dbt_mcp = DbtMCP(config=mock_config, usage_tracker=UsageTracker(), name="dbt")
+
+    def get_all_models() -> str:
+        return threading.current_thread().name
+
+    dbt_mcp.add_tool(get_all_models, structured_output=False)
+    tool = dbt_mcp._tool_manager.get_tool("get_all_models")
+    assert tool is not None
+    assert tool.is_async
+    result = await dbt_mcp.call_tool("get_all_models", {})
+    assert result[0].text.startswith("dbt-mcp-discovery")  # type: ignore
+    dbt_mcp.tool_executor.shutdown()
+
+
+async def test_stats_are_logged_periodically_and_at_shutdown(caplog):
+    config = mock_config.model_copy(
+        update={
+            "tool_execution_config": ToolExecutionConfig(
+                stats_log_interval_seconds=0.01
+            )
+        }
+    )
+    dbt_mcp = DbtMCP(config=config, usage_tracker=UsageTracker(), name="dbt")
+    await dbt_mcp.tool_executor.run(Toolset.DISCOVERY, lambda: None)
+    with caplog.at_level(logging.DEBUG, logger="dbt_mcp.mcp.server"):
+        async with app_lifespan(dbt_mcp):
+            await asyncio.sleep(0.05)
+            assert "Tool executor discovery pool" in caplog.text
+            caplog.clear()
+        assert "Tool cache: CacheStats(" in caplog.text
+        assert "In-flight tool calls: SingleFlightStats(" in caplog.text
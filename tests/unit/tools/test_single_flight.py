@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from dbt_mcp.mcp.server import DbtMCP
+from dbt_mcp.tools.annotations import create_tool_annotations
+from dbt_mcp.tools.single_flight import SingleFlight
+from dbt_mcp.tracking.tracking import UsageTracker
+from tests.mocks.config import mock_config
+
+
+async def test_concurrent_calls_share_one_execution():
+    single_flight = SingleFlight()
+    calls = 0
+
+    async def fetch() -> list[str]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return ["orders"]
+
+    results = await asyncio.gather(*[single_flight.run("key", fetch) for _ in range(5)])
+    assert results == [["orders"]] * 5
+    assert calls == 1
+    assert single_flight.get_stats().coalesced == 4
+
+    # Once the call finished, the next one executes again
+    await single_flight.run("key", fetch)
+    assert calls == 2
+
+
+async def test_exceptions_are_shared():
+    single_flight = SingleFlight()
+
+    async def fetch() -> None:
+        await asyncio.sleep(0.05)
+        raise ValueError("upstream unavailable")
+
+    results = await asyncio.gather(
+        single_flight.run("key", fetch),
+        single_flight.run("key", fetch),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, ValueError) for r in results)
+    assert single_flight.get_stats().in_flight == 0
+
+
+async def test_cancelled_caller_does_not_cancel_others():
+    single_flight = SingleFlight()
+
+    async def fetch() -> str:
+        await asyncio.sleep(0.05)
+        return "done"
+
+    first = asyncio.create_task(single_flight.run("key", fetch))
+    second = asyncio.create_task(single_flight.run("key", fetch))
+    await asyncio.sleep(0.01)
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert await second == "done"
+
+
+async def test_read_only_tools_are_coalesced_without_caching():
+    dbt_mcp = DbtMCP(config=mock_config, usage_tracker=UsageTracker(), name="dbt")
+    calls = 0
+
+    async def query_metrics(metrics: list[str]) -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "[]"
+
+    dbt_mcp.add_tool(
+        query_metrics,
+        annotations=create_tool_annotations(
+            read_only_hint=True, destructive_hint=False, idempotent_hint=True
+        ),
+        structured_output=False,
+    )
+    await asyncio.gather(
+        *[
+            dbt_mcp.call_tool("query_metrics", {"metrics": ["revenue"]})
+            for _ in range(3)
+        ]
+    )
+    assert calls == 1
+    await dbt_mcp.call_tool("query_metrics", {"metrics": ["revenue"]})
+    assert calls == 2